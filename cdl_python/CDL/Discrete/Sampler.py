@@ -1,7 +1,9 @@
 # ABOUTME: Sampler - Sample continuous signal at fixed intervals
 from typing import Any, Dict
+import numpy as np
 from cdl_python.base import CDLBlock
 from cdl_python.time_manager import TimeManager
+from cdl_python.CDL.Discrete.ZeroOrderHold import _sample_steps
 
 
 class Sampler(CDLBlock):
@@ -13,6 +15,10 @@ class Sampler(CDLBlock):
     Difference from ZeroOrderHold: Sampler is the idealized mathematical
     sampler, while ZeroOrderHold explicitly models the hold behavior.
     In practice, they behave identically.
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the value must outlive the next call. compute_raw()
+    returns the output value alone.
     """
 
     def __init__(self, time_manager: TimeManager, samplePeriod: float, startTime: float = 0.0):
@@ -31,6 +37,7 @@ class Sampler(CDLBlock):
         self._sampled_value: float = 0.0
         self._next_sample_time = startTime
         self._initialized = False
+        self._out = {'y': 0.0}
 
     def compute(self, u: float) -> Dict[str, Any]:
         """Compute sampled output
@@ -39,7 +46,20 @@ class Sampler(CDLBlock):
             u: Current input value
 
         Returns:
-            Dictionary with 'y': sampled value
+            Dictionary (owned by the block) with 'y': sampled value
+        """
+        out = self._out
+        out['y'] = self.compute_raw(u)
+        return out
+
+    def compute_raw(self, u: float) -> float:
+        """Compute sampled output, returning the output value directly
+
+        Args:
+            u: Current input value
+
+        Returns:
+            Sampled value
         """
         current_time = self.get_time()
 
@@ -53,4 +73,42 @@ class Sampler(CDLBlock):
                 while self._next_sample_time <= current_time:
                     self._next_sample_time += self.samplePeriod
 
-        return {'y': self._sampled_value}
+        return self._sampled_value
+
+    def compute_sequence(self, u: np.ndarray, t: np.ndarray) -> Dict[str, Any]:
+        """Compute sampled outputs for a sequence of calls
+
+        Equivalent to calling compute(u[i]) at time t[i] for each i in turn,
+        including the state left for later calls, but vectorized. The time
+        manager is not used.
+
+        Args:
+            u: Input values
+            t: Times of the calls, non-decreasing
+
+        Returns:
+            Dictionary with 'y': array of sampled values
+
+        Raises:
+            ValueError: If t decreases
+        """
+        u = np.asarray(u, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
+        if t.size == 0:
+            return {'y': u.copy()}
+
+        sampled, self._next_sample_time = _sample_steps(
+            t, self._next_sample_time, self.samplePeriod)
+        # The first call ever samples regardless of the time
+        if not self._initialized:
+            sampled[0] = True
+            self._initialized = True
+
+        # Index of the latest sample at or before each call (-1 if none)
+        last = np.maximum.accumulate(np.where(sampled, np.arange(t.size), -1))
+        y = u[np.maximum(last, 0)]
+        y[last < 0] = self._sampled_value
+
+        if last[-1] >= 0:
+            self._sampled_value = float(u[last[-1]])
+        return {'y': y}
@@ -1,5 +1,6 @@
 # ABOUTME: TriggeredMax - Track maximum value between triggers
 from typing import Any, Dict
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -36,24 +37,64 @@ class TriggeredMax(CDLBlock):
         Returns:
             Dictionary with 'y': maximum value since last trigger
         """
-        # Detect rising edge: trigger is True and was previously False
-        rising_edge = trigger and not self._previous_trigger
-
-        # Reset on rising edge
-        if rising_edge:
+        # Restart from the input on the first call and on a rising edge of
+        # trigger; otherwise keep the larger value
+        if self._first_call or (trigger and not self._previous_trigger):
             self._max_value = u
             self._first_call = False
-        else:
-            # Update maximum
-            if self._first_call:
-                # First call: initialize with current input
-                self._max_value = u
-                self._first_call = False
-            else:
-                # Track maximum
-                self._max_value = max(self._max_value, u)
+        elif u > self._max_value:
+            self._max_value = u
 
         # Update trigger history
         self._previous_trigger = trigger
 
         return {'y': self._max_value}
+
+    def compute_sequence(self, u: np.ndarray, trigger: np.ndarray) -> Dict[str, Any]:
+        """Compute maximum values for a sequence of inputs
+
+        Equivalent to calling compute(u[i], trigger[i]) for each i in turn,
+        including the state left for later calls, but vectorized.
+
+        Args:
+            u: Input values to track
+            trigger: Reset signals (reset maximum on rising edge)
+
+        Returns:
+            Dictionary with 'y': array of maximum values since last trigger
+        """
+        u = np.asarray(u, dtype=np.float64)
+        trigger = np.asarray(trigger, dtype=bool)
+        if u.size == 0:
+            return {'y': u.copy()}
+
+        # Calls that restart the maximum
+        reset = trigger.copy()
+        reset[1:] &= ~trigger[:-1]
+        reset[0] &= not self._previous_trigger
+        reset[0] |= self._first_call
+
+        # Prepend the current maximum, so calls before the first reset
+        # continue from it; segment k holds the calls after the k-th reset
+        values = np.concatenate(([self._max_value], u))
+        if np.isnan(values).any():
+            # NaN does not order like compute() treats it: step through
+            return {'y': np.array([self.compute(x, t)['y'] for x, t in
+                                   zip(u.tolist(), trigger.tolist())])}
+        segment = np.concatenate(([0], np.cumsum(reset)))
+
+        # Running maximum per segment: rank the values and offset the ranks
+        # by segment, so one running maximum over the keys never carries a
+        # value into a later segment. Equal values rank later ones lower, so
+        # the earlier one is kept, as in compute()
+        order = np.lexsort((-np.arange(values.size), values))
+        rank = np.empty_like(order)
+        rank[order] = np.arange(values.size)
+        key = segment * values.size + rank
+        np.maximum.accumulate(key, out=key)
+        y = values[order[key - segment * values.size]][1:]
+
+        self._max_value = float(y[-1])
+        self._first_call = False
+        self._previous_trigger = bool(trigger[-1])
+        return {'y': y}
@@ -15,6 +15,10 @@ class TriggeredSampler(CDLBlock):
     - Capturing values at specific events
     - Sample-and-hold circuits
     - Synchronizing signals to events
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the value must outlive the next call. compute_raw()
+    returns the output value alone.
     """
 
     def __init__(self, y_start: float = 0.0):
@@ -27,6 +31,7 @@ class TriggeredSampler(CDLBlock):
         self.y_start = y_start
         self._sampled_value = y_start
         self._previous_trigger = False
+        self._out = {'y': 0.0}
 
     def compute(self, u: float, trigger: bool) -> Dict[str, Any]:
         """Compute triggered sample output
@@ -36,7 +41,27 @@ class TriggeredSampler(CDLBlock):
             trigger: Trigger signal (sample on rising edge)
 
         Returns:
-            Dictionary with 'y': sampled value (updates on rising edge of trigger)
+            Dictionary (owned by the block) with 'y': sampled value (updates
+            on rising edge of trigger)
+        """
+        # Same as compute_raw(), inlined to save a call per step
+        if trigger and not self._previous_trigger:
+            self._sampled_value = u
+        self._previous_trigger = trigger
+
+        out = self._out
+        out['y'] = self._sampled_value
+        return out
+
+    def compute_raw(self, u: float, trigger: bool) -> float:
+        """Compute triggered sample output, returning the output value directly
+
+        Args:
+            u: Input value to sample
+            trigger: Trigger signal (sample on rising edge)
+
+        Returns:
+            Sampled value (updates on rising edge of trigger)
         """
         # Detect rising edge: trigger is True and was previously False
         rising_edge = trigger and not self._previous_trigger
@@ -48,4 +73,4 @@ class TriggeredSampler(CDLBlock):
         # Update trigger history
         self._previous_trigger = trigger
 
-        return {'y': self._sampled_value}
+        return self._sampled_value
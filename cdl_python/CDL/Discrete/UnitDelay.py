@@ -1,5 +1,6 @@
 # ABOUTME: UnitDelay - Unit delay (z^-1 operator)
 from typing import Any, Dict
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -15,6 +16,10 @@ class UnitDelay(CDLBlock):
     - Implementing discrete-time filters
     - Breaking algebraic loops
     - Storing previous values
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the value must outlive the next call. compute_raw()
+    returns the output value alone.
     """
 
     def __init__(self, y_start: float = 0.0):
@@ -27,6 +32,7 @@ class UnitDelay(CDLBlock):
         self.y_start = y_start
         self._previous_u = y_start
         self._first_call = True
+        self._out = {'y': 0.0}
 
     def compute(self, u: float) -> Dict[str, Any]:
         """Compute delayed output
@@ -35,7 +41,27 @@ class UnitDelay(CDLBlock):
             u: Current input value
 
         Returns:
-            Dictionary with 'y': previous input value (or y_start on first call)
+            Dictionary (owned by the block) with 'y': previous input value
+            (or y_start on first call)
+        """
+        out = self._out
+        # Same as compute_raw(), inlined to save a call per step
+        if self._first_call:
+            out['y'] = self.y_start
+            self._first_call = False
+        else:
+            out['y'] = self._previous_u
+        self._previous_u = u
+        return out
+
+    def compute_raw(self, u: float) -> float:
+        """Compute delayed output, returning the output value directly
+
+        Args:
+            u: Current input value
+
+        Returns:
+            Previous input value (or y_start on first call)
         """
         # Output is the previous input value
         if self._first_call:
@@ -47,4 +73,27 @@ class UnitDelay(CDLBlock):
         # Store current input for next call
         self._previous_u = u
 
+        return y
+
+    def compute_sequence(self, u: np.ndarray) -> Dict[str, Any]:
+        """Compute delayed outputs for a sequence of inputs
+
+        Equivalent to calling compute(u[i]) for each i in turn, including
+        the state left for later calls, but vectorized.
+
+        Args:
+            u: Input values
+
+        Returns:
+            Dictionary with 'y': array of inputs delayed by one call
+        """
+        u = np.asarray(u, dtype=np.float64)
+        y = np.empty_like(u)
+        if u.size == 0:
+            return {'y': y}
+
+        y[0] = self.y_start if self._first_call else self._previous_u
+        y[1:] = u[:-1]
+        self._first_call = False
+        self._previous_u = float(u[-1])
         return {'y': y}
@@ -1,9 +1,60 @@
 # ABOUTME: ZeroOrderHold - Zero-order hold (staircase output)
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
 from cdl_python.base import CDLBlock
 from cdl_python.time_manager import TimeManager
 
 
+def _sample_steps(t: np.ndarray, next_sample_time: float,
+                  period: float) -> Tuple[np.ndarray, float]:
+    """Find the calls in a sequence at which a periodic sampler samples
+
+    Matches calling the block once per element of t: a call samples when its
+    time has reached the next sample time, which then advances by period
+    (by repeated addition, as in compute_raw()) until it is past that time.
+
+    Args:
+        t: Non-empty, non-decreasing call times
+        next_sample_time: Next sample time before the first call
+        period: Sample period
+
+    Returns:
+        Tuple (sampled, next_sample_time): boolean array marking the calls
+        that sample, and the next sample time after the last call
+
+    Raises:
+        ValueError: If t decreases
+    """
+    if t.size > 1 and (t[1:] < t[:-1]).any():
+        raise ValueError("Times must be non-decreasing")
+
+    end = t[-1]
+    count = int((end - next_sample_time) // period) + 2 if end >= next_sample_time else 1
+    if count > 4 * t.size + 1024:
+        # Few calls per sample period: step through the calls instead of
+        # building every sample time
+        sampled = np.zeros(t.size, dtype=bool)
+        for i, current_time in enumerate(t.tolist()):
+            if current_time >= next_sample_time:
+                sampled[i] = True
+                while next_sample_time <= current_time:
+                    next_sample_time += period
+        return sampled, next_sample_time
+
+    # Sample times up to past the last call; cumsum adds one period at a
+    # time, so they round exactly like the scalar loop
+    steps = np.full(count, float(period))
+    steps[0] = next_sample_time
+    grid = np.cumsum(steps)
+    while grid[-1] <= end:
+        grid = np.append(grid, grid[-1] + period)
+
+    # A call samples when a sample time was reached since the previous call
+    passed = np.searchsorted(grid, t, side='right')
+    sampled = np.diff(passed, prepend=0) > 0
+    return sampled, float(grid[passed[-1]])
+
+
 class ZeroOrderHold(CDLBlock):
     """Zero-order hold - samples input and holds value constant
 
@@ -15,6 +66,10 @@ class ZeroOrderHold(CDLBlock):
     - Converting continuous signals to discrete
     - Interfacing with digital controllers
     - Creating piecewise-constant signals
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the value must outlive the next call. compute_raw()
+    returns the output value alone.
     """
 
     def __init__(self, time_manager: TimeManager, samplePeriod: float, startTime: float = 0.0):
@@ -32,6 +87,7 @@ class ZeroOrderHold(CDLBlock):
         self.startTime = startTime
         self._held_value: Optional[float] = None
         self._next_sample_time = startTime
+        self._out = {'y': 0.0}
 
     def compute(self, u: float) -> Dict[str, Any]:
         """Compute zero-order hold output
@@ -40,7 +96,21 @@ class ZeroOrderHold(CDLBlock):
             u: Current input value
 
         Returns:
-            Dictionary with 'y': held value (sampled at discrete times)
+            Dictionary (owned by the block) with 'y': held value (sampled at
+            discrete times)
+        """
+        out = self._out
+        out['y'] = self.compute_raw(u)
+        return out
+
+    def compute_raw(self, u: float) -> float:
+        """Compute zero-order hold output, returning the output value directly
+
+        Args:
+            u: Current input value
+
+        Returns:
+            Held value (sampled at discrete times)
         """
         current_time = self.get_time()
 
@@ -54,8 +124,43 @@ class ZeroOrderHold(CDLBlock):
 
         # Output the held value (or input if no sample yet)
         if self._held_value is None:
-            y = u  # Before first sample, pass through
+            return u  # Before first sample, pass through
+        return self._held_value
+
+    def compute_sequence(self, u: np.ndarray, t: np.ndarray) -> Dict[str, Any]:
+        """Compute zero-order hold outputs for a sequence of calls
+
+        Equivalent to calling compute(u[i]) at time t[i] for each i in turn,
+        including the state left for later calls, but vectorized. The time
+        manager is not used.
+
+        Args:
+            u: Input values
+            t: Times of the calls, non-decreasing
+
+        Returns:
+            Dictionary with 'y': array of held values
+
+        Raises:
+            ValueError: If t decreases
+        """
+        u = np.asarray(u, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
+        if t.size == 0:
+            return {'y': u.copy()}
+
+        sampled, self._next_sample_time = _sample_steps(
+            t, self._next_sample_time, self.samplePeriod)
+
+        # Index of the latest sample at or before each call (-1 if none)
+        last = np.maximum.accumulate(np.where(sampled, np.arange(t.size), -1))
+        y = u[np.maximum(last, 0)]
+        before = last < 0
+        if self._held_value is None:
+            y[before] = u[before]  # Before first sample, pass through
         else:
-            y = self._held_value
+            y[before] = self._held_value
 
+        if last[-1] >= 0:
+            self._held_value = float(u[last[-1]])
         return {'y': y}
@@ -4,6 +4,7 @@ Integer time table source block.
 Table look-up with respect to time with constant segments (piecewise constant).
 """
 
+import bisect
 from typing import Dict, Any, List
 import numpy as np
 from cdl_python.base import CDLBlock
@@ -78,6 +79,11 @@ class TimeTable(CDLBlock):
         if not np.allclose(self.table[:, 1:], np.round(self.table[:, 1:]), atol=1e-6):
             raise ValueError("All table values must be integers")
 
+        # Python float time stamps and Python int rows for the per-step lookup,
+        # which then avoids creating numpy scalars
+        self._time_stamps_list = self.time_stamps.tolist()
+        self._rows = self.values.tolist()
+
     def _get_index(self, t: float) -> int:
         """Get the index for table lookup
 
@@ -91,12 +97,12 @@ class TimeTable(CDLBlock):
         t_shifted = t % self.period
 
         # Find the last time stamp that is <= t_shifted
-        # Using searchsorted with side='right' gives us index where t_shifted would be inserted
+        # bisect_right gives the index where t_shifted would be inserted
         # We want the index before that (the last value <= t_shifted)
-        idx = np.searchsorted(self.time_stamps, t_shifted + 1e-6, side='right') - 1
+        idx = bisect.bisect_right(self._time_stamps_list, t_shifted + 1e-6) - 1
 
         # Clamp to valid range
-        idx = max(0, min(idx, len(self.time_stamps) - 1))
+        idx = max(0, min(idx, len(self._time_stamps_list) - 1))
 
         return idx
 
@@ -112,10 +118,10 @@ class TimeTable(CDLBlock):
         idx = self._get_index(current_time)
 
         # Get values
-        values = self.values[idx, :]
+        values = self._rows[idx]
 
-        # Return single value if only one output, otherwise return array
+        # Return single value if only one output, otherwise a copy of the row
         if self.nout == 1:
-            return {'y': int(values[0])}
+            return {'y': values[0]}
         else:
-            return {'y': values.tolist()}
+            return {'y': values[:]}
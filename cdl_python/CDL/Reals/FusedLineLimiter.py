@@ -0,0 +1,146 @@
+# ABOUTME: FusedLineLimiter block - a Limiter feeding the input of a Line, as one block.
+# ABOUTME: Applies both clamps as a single clamp on u before evaluating the line.
+from typing import Any, Dict
+import numpy as np
+from cdl_python.base import CDLBlock
+
+
+class FusedLineLimiter(CDLBlock):
+    """
+    Limiter followed by Line interpolation, fused into one block
+
+    Equivalent to feeding u through Limiter(uMax, uMin) and then into the
+    u input of Line(limitBelow, limitAbove), but clamps u only once:
+    the Limiter bounds are pushed through the Line limits at every step, so
+    y = a + b*min(hi, max(lo, u)) with lo, hi the Line-limited uMin, uMax.
+
+    Usually created with Line.fuse_with_limiter().
+
+    Parameters:
+        uMax: Upper limit of the limiter
+        uMin: Lower limit of the limiter
+        limitBelow: If true, limit u to be no smaller than x1 (default: True)
+        limitAbove: If true, limit u to be no larger than x2 (default: True)
+
+    Inputs:
+        x1: x-coordinate of first point
+        f1: y-coordinate of first point, f(x1)
+        x2: x-coordinate of second point
+        f2: y-coordinate of second point, f(x2)
+        u: Input value to limit and interpolate
+
+    Outputs:
+        y: Interpolated output value
+
+    Raises:
+        ValueError: If uMin >= uMax
+    """
+
+    def __init__(self, uMax: float, uMin: float, limitBelow: bool = True,
+                 limitAbove: bool = True, **kwargs):
+        """
+        Initialize FusedLineLimiter block.
+
+        Args:
+            uMax: Upper limit of the limiter
+            uMin: Lower limit of the limiter
+            limitBelow: Enable lower limit of the line
+            limitAbove: Enable upper limit of the line
+
+        Raises:
+            ValueError: If uMin >= uMax
+        """
+        super().__init__(**kwargs)
+        if uMin >= uMax:
+            raise ValueError(f"uMin ({uMin}) must be smaller than uMax ({uMax})")
+        self.uMax = uMax
+        self.uMin = uMin
+        self.limitBelow = limitBelow
+        self.limitAbove = limitAbove
+
+    def compute(self, x1: float, f1: float, x2: float, f2: float, u: float) -> Dict[str, Any]:
+        """
+        Compute limited linear interpolation.
+
+        Args:
+            x1: x-coordinate of first point
+            f1: y-coordinate of first point
+            x2: x-coordinate of second point
+            f2: y-coordinate of second point
+            u: Input value
+
+        Returns:
+            Dictionary with key 'y' containing interpolated value
+        """
+        return {'y': self.compute_raw(x1, f1, x2, f2, u)}
+
+    def compute_raw(self, x1: float, f1: float, x2: float, f2: float, u: float) -> float:
+        """
+        Compute limited linear interpolation, returning the output value directly.
+
+        Args:
+            x1: x-coordinate of first point
+            f1: y-coordinate of first point
+            x2: x-coordinate of second point
+            f2: y-coordinate of second point
+            u: Input value
+
+        Returns:
+            Interpolated value y
+        """
+        # y = a + b*x where b = (f2-f1)/(x2-x1) and a = f2 - b*x2
+        if x2 == x1:
+            b = 0.0
+            a = f1
+        else:
+            b = (f2 - f1) / (x2 - x1)
+            a = f2 - b * x2
+
+        # Push the limiter bounds through the line limits
+        lo = self.uMin
+        hi = self.uMax
+        if self.limitBelow:
+            lo = max(x1, lo)
+            hi = max(x1, hi)
+        if self.limitAbove:
+            lo = min(x2, lo)
+            hi = min(x2, hi)
+
+        return a + b * min(hi, max(lo, u))
+
+    def compute_batch(self, x1: np.ndarray, f1: np.ndarray, x2: np.ndarray,
+                      f2: np.ndarray, u: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute limited linear interpolation element-wise over arrays.
+
+        Args:
+            x1: x-coordinates of first points
+            f1: y-coordinates of first points
+            x2: x-coordinates of second points
+            f2: y-coordinates of second points
+            u: Input values
+
+        Returns:
+            Dictionary with key 'y' containing an array of interpolated values
+        """
+        x1 = np.asarray(x1, dtype=np.float64)
+        f1 = np.asarray(f1, dtype=np.float64)
+        x2 = np.asarray(x2, dtype=np.float64)
+        f2 = np.asarray(f2, dtype=np.float64)
+        u = np.asarray(u, dtype=np.float64)
+
+        same_x = x2 == x1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            b = np.where(same_x, 0.0, (f2 - f1) / (x2 - x1))
+        a = np.where(same_x, f1, f2 - b * x2)
+
+        lo = self.uMin
+        hi = self.uMax
+        if self.limitBelow:
+            lo = np.maximum(x1, lo)
+            hi = np.maximum(x1, hi)
+        if self.limitAbove:
+            lo = np.minimum(x2, lo)
+            hi = np.minimum(x2, hi)
+
+        return {'y': a + b * np.clip(u, lo, hi)}
@@ -0,0 +1,85 @@
+# ABOUTME: FusedSubtractSqrtTan block - a Subtract feeding a Sqrt feeding a Tan, as one block.
+# ABOUTME: Evaluates y = tan(sqrt(u1 - u2)) without the intermediate block outputs.
+import math
+from typing import Any, Dict
+import numpy as np
+from cdl_python.base import CDLBlock
+
+
+class FusedSubtractSqrtTan(CDLBlock):
+    """
+    Subtract followed by Sqrt and Tan, fused into one block
+
+    Equivalent to feeding the output of Subtract into the u input of Sqrt
+    and its output into the u input of Tan, but evaluated as a single
+    expression y = tan(sqrt(u1 - u2)).
+
+    Usually created with Subtract.fuse_with_sqrt_tan().
+
+    Inputs:
+        u1: Input with minuend
+        u2: Input with subtrahend
+
+    Outputs:
+        y: Tangent of the square root of the difference
+
+    Raises:
+        ValueError: If u1 - u2 is negative
+    """
+
+    def compute(self, u1: float, u2: float) -> Dict[str, Any]:
+        """
+        Compute tangent of the square root of the difference.
+
+        Args:
+            u1: Minuend value
+            u2: Subtrahend value
+
+        Returns:
+            Dictionary with output 'y' = tan(sqrt(u1 - u2))
+
+        Raises:
+            ValueError: If u1 - u2 < 0
+        """
+        return {'y': self.compute_raw(u1, u2)}
+
+    def compute_raw(self, u1: float, u2: float) -> float:
+        """
+        Compute tangent of the square root of the difference, returning the
+        output value directly.
+
+        Args:
+            u1: Minuend value
+            u2: Subtrahend value
+
+        Returns:
+            Output y = tan(sqrt(u1 - u2))
+
+        Raises:
+            ValueError: If u1 - u2 < 0
+        """
+        d = u1 - u2
+        if d < 0:
+            raise ValueError(f"Sqrt requires non-negative input, got {d}")
+        return math.tan(math.sqrt(d))
+
+    def compute_batch(self, u1: np.ndarray, u2: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute tangent of the square root of the difference element-wise over arrays.
+
+        Args:
+            u1: Minuend values
+            u2: Subtrahend values
+
+        Returns:
+            Dictionary with output 'y' containing an array of results
+
+        Raises:
+            ValueError: If any u1 - u2 is negative
+        """
+        y = np.subtract(u1, u2, dtype=np.float64)
+        if (y < 0).any():
+            raise ValueError(f"Sqrt requires non-negative input, got {y[y < 0][0]}")
+        np.sqrt(y, out=y)
+        np.tan(y, out=y)
+        return {'y': y}
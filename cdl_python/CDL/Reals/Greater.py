@@ -67,6 +67,19 @@ class Greater(CDLBlock):
         Returns:
             Dictionary with output 'y' (boolean)
         """
+        return {'y': self.compute_raw(u1, u2)}
+
+    def compute_raw(self, u1: float, u2: float) -> bool:
+        """
+        Compute comparison with hysteresis, returning the output value directly.
+
+        Args:
+            u1: First input value
+            u2: Second input value
+
+        Returns:
+            Output y (boolean)
+        """
         if self.h < 1e-10:
             # No hysteresis
             y = u1 > u2
@@ -82,7 +95,7 @@ class Greater(CDLBlock):
 
             self._state['y'] = y
 
-        return {'y': y}
+        return y
 
     def reset_state(self):
         """Reset state to initial conditions"""
@@ -0,0 +1,91 @@
+# ABOUTME: GreaterArray block - evaluates n Greater blocks with hysteresis in one call.
+# ABOUTME: Structure-of-arrays counterpart of Greater operating on NumPy input arrays.
+
+from typing import Dict, Any, Optional, Sequence, Union
+import numpy as np
+from cdl_python.block_array import BlockArray
+from cdl_python.time_manager import TimeManager
+
+
+class GreaterArray(BlockArray):
+    """
+    Array of n Greater blocks evaluated together.
+
+    Element-wise equivalent of Greater:
+    For h = 0: y[i] = u1[i] > u2[i]
+    For h > 0: y[i] switches to true if u1[i] > u2[i], and switches to false
+               if u1[i] <= u2[i] - h[i]
+
+    Parameters:
+        n: Number of blocks
+        h: Hysteresis, scalar or one value per block (default: 0, must be >= 0)
+        pre_y_start: Initial value of outputs, scalar or one value per block (default: False)
+
+    Inputs:
+        u1: First inputs (array of length n)
+        u2: Second inputs (array of length n)
+
+    Outputs:
+        y: Boolean array, true where u1 is greater than u2 with hysteresis
+
+    State:
+        Maintains previous outputs to implement hysteresis
+    """
+
+    def __init__(
+        self,
+        n: int,
+        h: Union[float, Sequence[float]] = 0.0,
+        pre_y_start: Union[bool, Sequence[bool]] = False,
+        time_manager: Optional[TimeManager] = None
+    ):
+        """
+        Initialize GreaterArray.
+
+        Args:
+            n: Number of blocks
+            h: Hysteresis parameter(s) (must be >= 0)
+            pre_y_start: Initial value(s) of output
+            time_manager: TimeManager instance (optional)
+
+        Raises:
+            ValueError: If any h < 0
+        """
+        super().__init__(n, time_manager)
+        h = self._parameter_array('h', h)
+        if np.any(h < 0):
+            raise ValueError(f"Hysteresis h must be >= 0, got {h}")
+        # Match Greater, which treats h < 1e-10 as no hysteresis
+        self.h = np.where(h < 1e-10, 0.0, h)
+        self.pre_y_start = self._parameter_array('pre_y_start', pre_y_start, dtype=bool)
+
+        # Initialize state for hysteresis
+        self._state = {
+            'y': self.pre_y_start.copy()
+        }
+
+    def compute(self, u1: np.ndarray, u2: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute comparisons with hysteresis for all blocks.
+
+        Args:
+            u1: First input values
+            u2: Second input values
+
+        Returns:
+            Dictionary with output 'y' (boolean array of length n)
+        """
+        u1 = self._input_array('u1', u1)
+        u2 = self._input_array('u2', u2)
+
+        # Stay true while u1 > u2 - h, switch on when u1 > u2
+        y = np.where(self._state['y'], u1 > u2 - self.h, u1 > u2)
+        self._state['y'] = y
+
+        return {'y': y}
+
+    def reset_state(self):
+        """Reset state to initial conditions"""
+        self._state = {
+            'y': self.pre_y_start.copy()
+        }
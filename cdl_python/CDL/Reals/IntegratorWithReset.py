@@ -2,6 +2,7 @@
 # ABOUTME: Implements y(t) = y_start + integral(k*u) with trigger-based reset functionality.
 
 from typing import Dict, Any, Optional
+import numpy as np
 from cdl_python.base import CDLBlock
 from cdl_python.time_manager import TimeManager
 
@@ -69,37 +70,98 @@ class IntegratorWithReset(CDLBlock):
         Returns:
             Dictionary with output 'y' (integrated value)
 
+        Raises:
+            RuntimeError: If no TimeManager is set
+        """
+        return {'y': self.compute_raw(u, trigger, y_reset_in)}
+
+    def compute_raw(self, u: float, trigger: bool, y_reset_in: float) -> float:
+        """
+        Compute integrator output, returning the output value directly.
+
+        Args:
+            u: Input value to integrate
+            trigger: Reset trigger (resets when True)
+            y_reset_in: Value to reset to when triggered
+
+        Returns:
+            Integrated value y
+
         Raises:
             RuntimeError: If no TimeManager is set
         """
         current_time = self.get_time()
+        state = self._state
 
         # Detect rising edge of trigger (False -> True)
-        if trigger and not self._state['last_trigger']:
+        rising_edge = trigger and not state['last_trigger']
+        state['last_trigger'] = trigger
+
+        if rising_edge:
             # Reset integrator
-            self._state['y'] = y_reset_in
-            self._state['last_time'] = current_time
-            self._state['last_trigger'] = trigger
-            return {'y': self._state['y']}
+            state['y'] = y_reset_in
+        elif state['last_time'] is not None:
+            # Integrate: dy/dt = k * u
+            dt = current_time - state['last_time']
+            if dt > 0:
+                state['y'] += self.k * u * dt
+        # On the first call, only initialize the time without integration
 
-        # First call - initialize without integration
-        if self._state['last_time'] is None:
-            self._state['last_time'] = current_time
-            self._state['last_trigger'] = trigger
-            return {'y': self._state['y']}
+        state['last_time'] = current_time
 
-        # Compute time step
-        dt = current_time - self._state['last_time']
+        return state['y']
 
-        # Integrate: dy/dt = k * u
-        if dt > 0:
-            self._state['y'] += self.k * u * dt
+    def compute_sequence(self, u: np.ndarray, t: np.ndarray, trigger: np.ndarray,
+                         y_reset_in: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute integrator outputs for a sequence of calls.
 
-        # Update state
-        self._state['last_time'] = current_time
-        self._state['last_trigger'] = trigger
+        Equivalent to calling compute(u[i], trigger[i], y_reset_in[i]) at
+        time t[i] for each i in turn, including the state left for later
+        calls, but vectorized. The time manager is not used.
 
-        return {'y': self._state['y']}
+        Args:
+            u: Input values to integrate
+            t: Times of the calls
+            trigger: Reset triggers (resets on a rising edge)
+            y_reset_in: Values to reset to when triggered (array or scalar)
+
+        Returns:
+            Dictionary with output 'y' (array of integrated values)
+        """
+        u = np.asarray(u, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
+        trigger = np.asarray(trigger, dtype=bool)
+        y_reset_in = np.broadcast_to(np.asarray(y_reset_in, dtype=np.float64), t.shape)
+        state = self._state
+        if t.size == 0:
+            return {'y': np.empty(0)}
+
+        last_time = state['last_time']
+        previous = np.concatenate(([np.nan if last_time is None else last_time], t[:-1]))
+        dt = t - previous
+        rising = trigger.copy()
+        rising[1:] &= ~trigger[:-1]
+        rising[0] &= not state['last_trigger']
+
+        # Increment of each call; -0.0 leaves any value unchanged, as the
+        # skipped update in compute() does. A reset replaces the value
+        step = np.where(dt > 0, self.k * u * dt, -0.0)
+        step[rising] = y_reset_in[rising]
+
+        # Accumulate each stretch between resets in order, so the result is
+        # rounded exactly as the repeated additions in compute()
+        y = np.concatenate(([state['y']], step))
+        bounds = np.flatnonzero(rising) + 1
+        for start, stop in zip(np.concatenate(([0], bounds)),
+                               np.concatenate((bounds, [y.size]))):
+            np.cumsum(y[start:stop], out=y[start:stop])
+        y = y[1:]
+
+        state['y'] = float(y[-1])
+        state['last_time'] = float(t[-1])
+        state['last_trigger'] = bool(trigger[-1])
+        return {'y': y}
 
     def reset_state(self):
         """Reset integrator to initial conditions"""
@@ -35,8 +35,15 @@ class LimitSlewRate(CDLBlock):
             raisingSlewRate: Maximum rate of increase (units/second)
             fallingSlewRate: Maximum rate of decrease (units/second, positive value)
             y_start: Initial output value
+
+        Raises:
+            ValueError: If raisingSlewRate or fallingSlewRate is not positive
         """
         super().__init__(time_manager)
+        if raisingSlewRate <= 0:
+            raise ValueError(f"raisingSlewRate must be > 0, got {raisingSlewRate}")
+        if fallingSlewRate <= 0:
+            raise ValueError(f"fallingSlewRate must be > 0, got {fallingSlewRate}")
         self.raisingSlewRate = raisingSlewRate
         self.fallingSlewRate = fallingSlewRate
 
@@ -44,6 +51,16 @@ class LimitSlewRate(CDLBlock):
         self._y = y_start
         self._previous_time = None
 
+    @property
+    def fallingSlewRate(self) -> float:
+        """Maximum rate of decrease (units/second, positive value)"""
+        return -self._neg_falling
+
+    @fallingSlewRate.setter
+    def fallingSlewRate(self, value: float):
+        # compute_raw() clamps with the negated rate
+        self._neg_falling = -value
+
     def compute(self, u: float) -> Dict[str, Any]:
         """Compute rate-limited output
 
@@ -53,6 +70,17 @@ class LimitSlewRate(CDLBlock):
         Returns:
             Dictionary with 'y': rate-limited output
         """
+        return {'y': self.compute_raw(u)}
+
+    def compute_raw(self, u: float) -> float:
+        """Compute rate-limited output, returning the output value directly
+
+        Args:
+            u: Input signal
+
+        Returns:
+            Rate-limited output y
+        """
         current_time = self.get_time()
 
         # Always apply rate limiting (even on first call)
@@ -63,22 +91,13 @@ class LimitSlewRate(CDLBlock):
             dt = 0.001 if current_time == 0 else current_time
 
         if dt > 0:
-            # Desired change
-            delta = u - self._y
-
-            # Limit the rate of change
-            if delta > 0:
-                # Rising: limit by raisingSlewRate
-                max_delta = self.raisingSlewRate * dt
-                delta = min(delta, max_delta)
-            else:
-                # Falling: limit by fallingSlewRate
-                max_delta = -self.fallingSlewRate * dt
-                delta = max(delta, max_delta)
+            # Desired change, limited to [-fallingSlewRate*dt, raisingSlewRate*dt].
+            # Both rates are positive, so a single clamp covers rising and falling.
+            delta = max(self._neg_falling * dt, min(u - self._y, self.raisingSlewRate * dt))
 
             # Update output
             self._y += delta
 
         self._previous_time = current_time
 
-        return {'y': self._y}
+        return self._y
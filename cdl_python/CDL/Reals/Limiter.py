@@ -53,4 +53,16 @@ class Limiter(CDLBlock):
         Returns:
             Dictionary with output 'y' = max(uMin, min(uMax, u))
         """
-        return {'y': max(self.uMin, min(self.uMax, u))}
+        return {'y': self.compute_raw(u)}
+
+    def compute_raw(self, u: float) -> float:
+        """
+        Compute limited value, returning the output value directly.
+
+        Args:
+            u: Input value
+
+        Returns:
+            Output y = max(uMin, min(uMax, u))
+        """
+        return max(self.uMin, min(self.uMax, u))
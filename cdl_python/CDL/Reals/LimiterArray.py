@@ -0,0 +1,66 @@
+# ABOUTME: LimiterArray block - evaluates n Limiter blocks in one call.
+# ABOUTME: Structure-of-arrays counterpart of Limiter using a single np.clip per step.
+
+from typing import Dict, Any, Sequence, Union
+import numpy as np
+from cdl_python.block_array import BlockArray
+
+
+class LimiterArray(BlockArray):
+    """
+    Array of n Limiter blocks evaluated together.
+
+    Outputs y[i] = max(uMin[i], min(uMax[i], u[i]))
+
+    Parameters:
+        n: Number of blocks
+        uMax: Upper limits, scalar or one value per block
+        uMin: Lower limits, scalar or one value per block
+
+    Inputs:
+        u: Inputs to be limited (array of length n)
+
+    Outputs:
+        y: Limited values of input signals
+
+    Raises:
+        ValueError: If any uMin >= uMax
+    """
+
+    def __init__(
+        self,
+        n: int,
+        uMax: Union[float, Sequence[float]],
+        uMin: Union[float, Sequence[float]],
+        **kwargs
+    ):
+        """
+        Initialize LimiterArray.
+
+        Args:
+            n: Number of blocks
+            uMax: Upper limit(s)
+            uMin: Lower limit(s)
+            **kwargs: Additional arguments for BlockArray
+
+        Raises:
+            ValueError: If any uMin >= uMax
+        """
+        super().__init__(n, **kwargs)
+        self.uMax = self._parameter_array('uMax', uMax)
+        self.uMin = self._parameter_array('uMin', uMin)
+        if np.any(self.uMin >= self.uMax):
+            raise ValueError(f"uMin ({self.uMin}) must be smaller than uMax ({self.uMax})")
+
+    def compute(self, u: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute limited values for all blocks.
+
+        Args:
+            u: Input values
+
+        Returns:
+            Dictionary with output 'y' = clip(u, uMin, uMax)
+        """
+        u = self._input_array('u', u)
+        return {'y': np.clip(u, self.uMin, self.uMax)}
@@ -2,6 +2,7 @@
 # ABOUTME: Computes linear interpolation through two points with optional limiting
 from typing import Any, Dict
 from cdl_python.base import CDLBlock
+from cdl_python.CDL.Reals.FusedLineLimiter import FusedLineLimiter
 
 
 class Line(CDLBlock):
@@ -52,6 +53,22 @@ class Line(CDLBlock):
         Returns:
             Dictionary with key 'y' containing interpolated value
         """
+        return {'y': self.compute_raw(x1, f1, x2, f2, u)}
+
+    def compute_raw(self, x1: float, f1: float, x2: float, f2: float, u: float) -> float:
+        """
+        Compute linear interpolation, returning the output value directly.
+
+        Args:
+            x1: x-coordinate of first point
+            f1: y-coordinate of first point
+            x2: x-coordinate of second point
+            f2: y-coordinate of second point
+            u: Input value
+
+        Returns:
+            Interpolated value y
+        """
         # Calculate slope and intercept
         # y = a + b*x where b = (f2-f1)/(x2-x1) and a = f2 - b*x2
         if x2 == x1:
@@ -72,6 +89,23 @@ class Line(CDLBlock):
             xLim = min(x2, u)
 
         # Compute output
-        y = a + b * xLim
+        return a + b * xLim
+
+    def fuse_with_limiter(self, uMin: float, uMax: float) -> FusedLineLimiter:
+        """
+        Fuse a Limiter feeding this block's u input into a single block.
 
-        return {'y': y}
+        Args:
+            uMin: Lower limit of the limiter
+            uMax: Upper limit of the limiter
+
+        Returns:
+            FusedLineLimiter computing the same output as the Limiter-Line chain
+        """
+        return FusedLineLimiter(
+            uMax=uMax,
+            uMin=uMin,
+            limitBelow=self.limitBelow,
+            limitAbove=self.limitAbove,
+            time_manager=self.time_manager,
+        )
@@ -33,9 +33,24 @@ class Log(CDLBlock):
         Returns:
             Dictionary with output 'y' = log(u)
 
+        Raises:
+            ValueError: If u <= 0
+        """
+        return {'y': self.compute_raw(u)}
+
+    def compute_raw(self, u: float) -> float:
+        """
+        Compute natural logarithm of input, returning the output value directly.
+
+        Args:
+            u: Input value (must be > 0)
+
+        Returns:
+            Output y = log(u)
+
         Raises:
             ValueError: If u <= 0
         """
         if u <= 0:
             raise ValueError(f"Log requires positive input, got {u}")
-        return {'y': math.log(u)}
+        return math.log(u)
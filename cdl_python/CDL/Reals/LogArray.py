@@ -0,0 +1,45 @@
+# ABOUTME: LogArray block - evaluates n Log blocks in one call.
+# ABOUTME: Structure-of-arrays counterpart of Log using a single np.log per step.
+
+from typing import Dict, Any
+import numpy as np
+from cdl_python.block_array import BlockArray
+
+
+class LogArray(BlockArray):
+    """
+    Array of n Log blocks evaluated together.
+
+    Outputs y[i] = log(u[i]) (natural logarithm, base e)
+    All inputs must be positive.
+
+    Parameters:
+        n: Number of blocks
+
+    Inputs:
+        u: Inputs for the logarithm function (array of length n, all > 0)
+
+    Outputs:
+        y: Natural logarithm of inputs
+
+    Raises:
+        ValueError: If any input is non-positive
+    """
+
+    def compute(self, u: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute natural logarithm of all inputs.
+
+        Args:
+            u: Input values (must all be > 0)
+
+        Returns:
+            Dictionary with output 'y' = log(u)
+
+        Raises:
+            ValueError: If any u <= 0
+        """
+        u = self._input_array('u', u)
+        if np.any(u <= 0):
+            raise ValueError(f"Log requires positive input, got {u}")
+        return {'y': np.log(u)}
@@ -1,6 +1,7 @@
 # ABOUTME: MatrixMax block - finds maximum value in a vector
 # ABOUTME: Returns the largest element from the input vector
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -11,13 +12,14 @@ class MatrixMax(CDLBlock):
     Finds and returns the maximum value from input vector.
 
     Inputs:
-        u: Input vector
+        u: Input vector (list or NumPy array; passing a float64 ndarray
+           avoids any conversion copy)
 
     Outputs:
         y: Maximum value from input vector
     """
 
-    def compute(self, u: List[float]) -> Dict[str, Any]:
+    def compute(self, u: Union[List[float], np.ndarray]) -> Dict[str, Any]:
         """
         Find maximum value in input vector.
 
@@ -27,7 +29,20 @@ class MatrixMax(CDLBlock):
         Returns:
             Dictionary with key 'y' containing maximum value
         """
-        if len(u) == 0:
+        return {'y': self.compute_raw(u)}
+
+    def compute_raw(self, u: Union[List[float], np.ndarray]) -> float:
+        """
+        Find maximum value in input vector, returning it directly.
+
+        Args:
+            u: Input vector
+
+        Returns:
+            Maximum value
+        """
+        arr = np.asarray(u, dtype=np.float64)
+        if arr.size == 0:
             raise ValueError("Input vector cannot be empty")
 
-        return {'y': max(u)}
+        return float(arr.max())
@@ -1,6 +1,7 @@
 # ABOUTME: MatrixMin block - finds minimum value in a vector
 # ABOUTME: Returns the smallest element from the input vector
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -11,13 +12,14 @@ class MatrixMin(CDLBlock):
     Finds and returns the minimum value from input vector.
 
     Inputs:
-        u: Input vector
+        u: Input vector (list or NumPy array; passing a float64 ndarray
+           avoids any conversion copy)
 
     Outputs:
         y: Minimum value from input vector
     """
 
-    def compute(self, u: List[float]) -> Dict[str, Any]:
+    def compute(self, u: Union[List[float], np.ndarray]) -> Dict[str, Any]:
         """
         Find minimum value in input vector.
 
@@ -27,7 +29,20 @@ class MatrixMin(CDLBlock):
         Returns:
             Dictionary with key 'y' containing minimum value
         """
-        if len(u) == 0:
+        return {'y': self.compute_raw(u)}
+
+    def compute_raw(self, u: Union[List[float], np.ndarray]) -> float:
+        """
+        Find minimum value in input vector, returning it directly.
+
+        Args:
+            u: Input vector
+
+        Returns:
+            Minimum value
+        """
+        arr = np.asarray(u, dtype=np.float64)
+        if arr.size == 0:
             raise ValueError("Input vector cannot be empty")
 
-        return {'y': min(u)}
+        return float(arr.min())
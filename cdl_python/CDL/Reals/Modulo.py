@@ -1,7 +1,8 @@
 # ABOUTME: Modulo block - computes remainder of division of two real inputs.
 # ABOUTME: Implements y = u1 mod u2 for CDL real-valued modulo operation.
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -20,6 +21,10 @@ class Modulo(CDLBlock):
 
     Raises:
         ZeroDivisionError: If u2 is zero
+
+    When the divisor is constant (for example a fixed period), call
+    bind_divisor(u2) once; compute() and compute_raw() then take only u1
+    and skip the per-call zero check.
     """
 
     def compute(self, u1: float, u2: float) -> Dict[str, Any]:
@@ -33,9 +38,95 @@ class Modulo(CDLBlock):
         Returns:
             Dictionary with output 'y' = u1 mod u2
 
+        Raises:
+            ZeroDivisionError: If u2 is zero
+        """
+        return {'y': self.compute_raw(u1, u2)}
+
+    def compute_raw(self, u1: float, u2: float) -> float:
+        """
+        Compute modulo operation, returning the output value directly.
+
+        Args:
+            u1: Dividend
+            u2: Divisor (must not be zero)
+
+        Returns:
+            Output y = u1 mod u2
+
         Raises:
             ZeroDivisionError: If u2 is zero
         """
         if u2 == 0:
             raise ZeroDivisionError("Modulo divisor cannot be zero")
-        return {'y': u1 % u2}
+        return u1 % u2
+
+    def bind_divisor(self, u2: float):
+        """
+        Fix the divisor and specialize compute() for it.
+
+        The divisor is validated once here. Afterwards compute(u1) uses the
+        bound divisor without checking it again.
+
+        Args:
+            u2: Divisor (must not be zero)
+
+        Raises:
+            ZeroDivisionError: If u2 is zero
+        """
+        if u2 == 0:
+            raise ZeroDivisionError("Modulo divisor cannot be zero")
+        self._u2 = u2
+        self.compute = self._compute_bound
+        self.compute_raw = self._compute_raw_bound
+        # The bound compute() takes u1 only; keep the input metadata in step
+        self._input_order = ('u1',)
+        self._REQUIRED = frozenset({'u1'})
+
+    def _compute_bound(self, u1: float) -> Dict[str, Any]:
+        """
+        Compute modulo operation with the divisor fixed by bind_divisor().
+
+        Args:
+            u1: Dividend
+
+        Returns:
+            Dictionary with output 'y' = u1 mod u2
+        """
+        return {'y': u1 % self._u2}
+
+    def _compute_raw_bound(self, u1: float) -> float:
+        """
+        Compute modulo operation with the bound divisor, returning the output value directly.
+
+        Args:
+            u1: Dividend
+
+        Returns:
+            Output y = u1 mod u2
+        """
+        return u1 % self._u2
+
+    def compute_batch(self, u1: np.ndarray, u2: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Compute modulo operation element-wise over arrays.
+
+        Args:
+            u1: Dividends
+            u2: Divisors (must not contain zero); defaults to the divisor
+                fixed by bind_divisor()
+
+        Returns:
+            Dictionary with output 'y' = u1 mod u2 as an array
+
+        Raises:
+            ZeroDivisionError: If any divisor is zero
+            ValueError: If u2 is omitted and no divisor was bound
+        """
+        if u2 is None:
+            if not hasattr(self, '_u2'):
+                raise ValueError("Modulo.compute_batch requires u2 unless bind_divisor() was called")
+            u2 = self._u2
+        elif np.any(np.asarray(u2) == 0):
+            raise ZeroDivisionError("Modulo divisor cannot be zero")
+        return {'y': np.mod(u1, u2)}
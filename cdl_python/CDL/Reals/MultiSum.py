@@ -1,7 +1,9 @@
 # ABOUTME: MultiSum block - weighted sum of multiple real inputs.
 # ABOUTME: Implements y = k[1]*u[1] + k[2]*u[2] + ... + k[n]*u[n] for CDL multi-input sum.
 
-from typing import Dict, Any, List
+import math
+from typing import Dict, Any, List, Union
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -14,21 +16,24 @@ class MultiSum(CDLBlock):
     Parameters:
         nin: Number of input signals (default: 0)
         k: Input gains (default: all ones)
+        exact: If true, sum the products k[i]*u[i] with math.fsum, which
+            rounds only once instead of after every addition (default: False)
 
     Inputs:
-        u: List of input values (length must match nin)
+        u: List or NumPy array of input values (length must match nin)
 
     Outputs:
         y: Sum of inputs times gains
     """
 
-    def __init__(self, nin: int = 0, k: List[float] = None, **kwargs):
+    def __init__(self, nin: int = 0, k: List[float] = None, exact: bool = False, **kwargs):
         """
         Initialize MultiSum.
 
         Args:
             nin: Number of inputs
             k: Gain coefficients (defaults to all ones if not provided)
+            exact: Use a correctly rounded sum instead of a dot product
             **kwargs: Additional arguments for CDLBlock
         """
         super().__init__(**kwargs)
@@ -39,13 +44,15 @@ class MultiSum(CDLBlock):
             if len(k) != nin:
                 raise ValueError(f"Length of k ({len(k)}) must match nin ({nin})")
             self.k = k
+        self.exact = exact
+        self._k_arr = np.asarray(self.k, dtype=np.float64)
 
-    def compute(self, u: List[float]) -> Dict[str, Any]:
+    def compute(self, u: Union[List[float], np.ndarray]) -> Dict[str, Any]:
         """
         Compute weighted sum of inputs.
 
         Args:
-            u: List of input values
+            u: List or NumPy array of input values
 
         Returns:
             Dictionary with output 'y' = sum(k[i] * u[i])
@@ -56,5 +63,10 @@ class MultiSum(CDLBlock):
         if len(u) != self.nin:
             raise ValueError(f"Expected {self.nin} inputs, got {len(u)}")
 
-        y = sum(ki * ui for ki, ui in zip(self.k, u))
+        if not isinstance(u, np.ndarray):
+            u = np.asarray(u, dtype=np.float64)
+        if self.exact:
+            y = math.fsum(self._k_arr * u)
+        else:
+            y = float(self._k_arr @ u)
         return {'y': y}
@@ -1,7 +1,7 @@
 # ABOUTME: Multiply block - outputs product of two real inputs.
 # ABOUTME: Implements y = u1 * u2 for CDL real-valued multiplication.
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 from cdl_python.base import CDLBlock
 
 
@@ -17,8 +17,21 @@ class Multiply(CDLBlock):
 
     Outputs:
         y: Product of the inputs
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the value must outlive the next call.
     """
 
+    def __init__(self, **kwargs):
+        """
+        Initialize Multiply block.
+
+        Args:
+            **kwargs: Additional arguments for CDLBlock
+        """
+        super().__init__(**kwargs)
+        self._out = {'y': 0.0}
+
     def compute(self, u1: float, u2: float) -> Dict[str, Any]:
         """
         Compute product of two inputs.
@@ -28,6 +41,17 @@ class Multiply(CDLBlock):
             u2: Second input value
 
         Returns:
-            Dictionary with output 'y' = u1 * u2
+            Dictionary with output 'y' = u1 * u2 (owned by the block)
+        """
+        out = self._out
+        out['y'] = u1 * u2
+        return out
+
+    def as_callable(self) -> Callable[[float, float], float]:
+        """
+        Return the block as a plain function of its inputs.
+
+        Returns:
+            Function f(u1, u2) returning the output y = u1 * u2
         """
-        return {'y': u1 * u2}
+        return lambda u1, u2: u1 * u2
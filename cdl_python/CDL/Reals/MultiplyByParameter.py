@@ -1,7 +1,7 @@
 # ABOUTME: MultiplyByParameter block - multiplies real input by parameter (gain).
 # ABOUTME: Implements y = k * u for CDL real-valued multiplication with parameter.
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 from cdl_python.base import CDLBlock
 
 
@@ -19,6 +19,9 @@ class MultiplyByParameter(CDLBlock):
 
     Outputs:
         y: Product of the parameter times the input
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the value must outlive the next call.
     """
 
     def __init__(self, k: float, **kwargs):
@@ -31,6 +34,7 @@ class MultiplyByParameter(CDLBlock):
         """
         super().__init__(**kwargs)
         self.k = k
+        self._out = {'y': 0.0}
 
     def compute(self, u: float) -> Dict[str, Any]:
         """
@@ -40,6 +44,21 @@ class MultiplyByParameter(CDLBlock):
             u: Input value
 
         Returns:
-            Dictionary with output 'y' = k * u
+            Dictionary with output 'y' = k * u (owned by the block)
+        """
+        out = self._out
+        out['y'] = self.k * u
+        return out
+
+    def as_callable(self) -> Callable[[float], float]:
+        """
+        Return the block as a plain function of its input.
+
+        The gain is captured when this is called; later changes to k are
+        not seen by the returned function.
+
+        Returns:
+            Function f(u) returning the output y = k * u
         """
-        return {'y': self.k * u}
+        k = self.k
+        return lambda u: k * u
@@ -15,6 +15,24 @@ class SimpleController(Enum):
     PID = "PID"
 
 
+def _gain_parameter(name: str) -> property:
+    """
+    Create a property for a parameter that the cached gains depend on.
+
+    Setting the parameter refreshes the cached gains of the controller.
+    """
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._update_gains()
+
+    return property(fget, fset)
+
+
 class PID(CDLBlock):
     """
     P, PI, PD, and PID controller.
@@ -49,6 +67,31 @@ class PID(CDLBlock):
         Maintains integrator state, derivative state, and last computation time
     """
 
+    __slots__ = (
+        'controllerType', '_k', '_Ti', '_Td', '_r', 'yMax', 'yMin', '_Ni', '_Nd',
+        'xi_start', 'yd_start', '_reverseActing', 'with_I', 'with_D',
+        '_k_over_Ti', '_k_Td', '_Nd_over_Td', '_inv_kNi', '_inv_r',
+        '_integral', '_last_error', '_derivative_filtered', '_last_time',
+        # Holds the compute() variant bound in __init__
+        '__dict__',
+    )
+
+    # Specialized compute() variant for each controller type
+    _COMPUTE_METHODS = {
+        SimpleController.P: '_compute_P',
+        SimpleController.PI: '_compute_PI',
+        SimpleController.PD: '_compute_PD',
+        SimpleController.PID: '_compute_PID',
+    }
+
+    k = _gain_parameter('k')
+    Ti = _gain_parameter('Ti')
+    Td = _gain_parameter('Td')
+    r = _gain_parameter('r')
+    Ni = _gain_parameter('Ni')
+    Nd = _gain_parameter('Nd')
+    reverseActing = _gain_parameter('reverseActing')
+
     def __init__(
         self,
         time_manager: Optional[TimeManager] = None,
@@ -91,34 +134,48 @@ class PID(CDLBlock):
             raise ValueError(f"yMin ({yMin}) must be less than yMax ({yMax})")
 
         self.controllerType = controllerType
-        self.k = k
-        self.Ti = Ti
-        self.Td = Td
-        self.r = r
+        self._k = k
+        self._Ti = Ti
+        self._Td = Td
+        self._r = r
         self.yMax = yMax
         self.yMin = yMin
-        self.Ni = Ni
-        self.Nd = Nd
+        self._Ni = Ni
+        self._Nd = Nd
         self.xi_start = xi_start
         self.yd_start = yd_start
-        self.reverseActing = reverseActing
+        self._reverseActing = reverseActing
 
         # Determine which terms to use
         self.with_I = controllerType in [SimpleController.PI, SimpleController.PID]
         self.with_D = controllerType in [SimpleController.PD, SimpleController.PID]
 
-        # Initialize state
-        self._state = {
-            'integral': xi_start,
-            'last_error': 0.0,
-            'derivative_filtered': yd_start,
-            'last_time': None
-        }
+        self._update_gains()
+
+        # Bind the compute() variant without the disabled terms
+        self.compute = getattr(self, self._COMPUTE_METHODS[controllerType])
+
+        # Initialize state (plain attributes, exposed through get_state/set_state)
+        self._integral = xi_start
+        self._last_error = 0.0
+        self._derivative_filtered = yd_start
+        self._last_time = None
+
+    def _update_gains(self):
+        """Precompute the constant gain ratios used in compute()"""
+        self._inv_r = (1.0 if self._reverseActing else -1.0) / self._r
+        self._k_over_Ti = self._k / self._Ti if self.with_I else 0.0
+        self._inv_kNi = 1.0 / (self._k * self._Ni) if self.with_I else 0.0
+        self._k_Td = self._k * self._Td
+        self._Nd_over_Td = self._Nd / self._Td if self.with_D else 0.0
 
     def compute(self, u_s: float, u_m: float) -> Dict[str, Any]:
         """
         Compute PID controller output.
 
+        __init__ replaces this method on the instance with the variant for
+        the controller type, so the disabled terms are never evaluated.
+
         Args:
             u_s: Setpoint
             u_m: Measurement
@@ -126,66 +183,167 @@ class PID(CDLBlock):
         Returns:
             Dictionary with output 'y' (controller output)
         """
+        return getattr(self, self._COMPUTE_METHODS[self.controllerType])(u_s, u_m)
+
+    def _compute_P(self, u_s: float, u_m: float) -> Dict[str, Any]:
+        """Compute output of a P controller (see compute())"""
         current_time = self.get_time()
 
-        # Compute error with reverse/direct acting
-        sign = 1.0 if self.reverseActing else -1.0
-        error = sign * (u_s - u_m) / self.r
+        # Compute error; _inv_r carries the sign for reverse/direct acting
+        error = (u_s - u_m) * self._inv_r
 
-        # First call - initialize
-        if self._state['last_time'] is None:
-            self._state['last_time'] = current_time
-            self._state['last_error'] = error
-            # P term only on first call
-            P = self.k * error
-            y = max(self.yMin, min(self.yMax, P))
-            return {'y': y}
+        y = max(self.yMin, min(self.yMax, self._k * error))
 
-        # Compute time step
-        dt = current_time - self._state['last_time']
+        # Update state
+        self._last_error = error
+        self._last_time = current_time
+
+        return {'y': y}
+
+    def _compute_PI(self, u_s: float, u_m: float) -> Dict[str, Any]:
+        """Compute output of a PI controller (see compute())"""
+        current_time = self.get_time()
+
+        # Compute error; _inv_r carries the sign for reverse/direct acting
+        error = (u_s - u_m) * self._inv_r
 
         # P term
-        P = self.k * error
+        P = self._k * error
+
+        last_time = self._last_time
+        self._last_error = error
+        self._last_time = current_time
+
+        # P term only on first call and when time has not advanced
+        if last_time is None:
+            return {'y': max(self.yMin, min(self.yMax, P))}
+        dt = current_time - last_time
+        if not dt > 0:
+            return {'y': max(self.yMin, min(self.yMax, P))}
 
         # I term
-        I = 0.0
-        if self.with_I and dt > 0:
-            self._state['integral'] += error * dt
-            I = self.k / self.Ti * self._state['integral']
+        integral = self._integral + error * dt
+        y_unlim = P + self._k_over_Ti * integral
+
+        # Apply limits
+        y = max(self.yMin, min(self.yMax, y_unlim))
+
+        # Anti-windup: back-calculate integral if saturated
+        if y != y_unlim:
+            integral -= (y_unlim - y) * self._inv_kNi * dt
+        self._integral = integral
+
+        return {'y': y}
+
+    def _compute_PD(self, u_s: float, u_m: float) -> Dict[str, Any]:
+        """Compute output of a PD controller (see compute())"""
+        current_time = self.get_time()
+
+        # Compute error; _inv_r carries the sign for reverse/direct acting
+        error = (u_s - u_m) * self._inv_r
+
+        # P term
+        P = self._k * error
+
+        last_time = self._last_time
+        last_error = self._last_error
+        self._last_error = error
+        self._last_time = current_time
+
+        # P term only on first call and when time has not advanced
+        if last_time is None:
+            return {'y': max(self.yMin, min(self.yMax, P))}
+        dt = current_time - last_time
+        if not dt > 0:
+            return {'y': max(self.yMin, min(self.yMax, P))}
 
         # D term (simplified first-order filter)
-        D = 0.0
-        if self.with_D and dt > 0:
-            # Simplified derivative with filter
-            derivative = (error - self._state['last_error']) / dt
-            # First-order filter: dy/dt = (derivative - y_filtered) * Nd / Td
-            alpha = dt * self.Nd / self.Td
-            self._state['derivative_filtered'] += alpha * (derivative - self._state['derivative_filtered'])
-            D = self.k * self.Td * self._state['derivative_filtered']
-
-        # Compute unlimited output
-        y_unlim = P + I + D
+        derivative = (error - last_error) / dt
+        # First-order filter: dy/dt = (derivative - y_filtered) * Nd / Td
+        alpha = dt * self._Nd_over_Td
+        derivative_filtered = self._derivative_filtered
+        derivative_filtered += alpha * (derivative - derivative_filtered)
+        self._derivative_filtered = derivative_filtered
 
         # Apply limits
+        return {'y': max(self.yMin, min(self.yMax, P + self._k_Td * derivative_filtered))}
+
+    def _compute_PID(self, u_s: float, u_m: float) -> Dict[str, Any]:
+        """Compute output of a PID controller (see compute())"""
+        current_time = self.get_time()
+
+        # Compute error; _inv_r carries the sign for reverse/direct acting
+        error = (u_s - u_m) * self._inv_r
+
+        # P term
+        P = self._k * error
+
+        last_time = self._last_time
+        last_error = self._last_error
+        self._last_error = error
+        self._last_time = current_time
+
+        # P term only on first call and when time has not advanced
+        if last_time is None:
+            return {'y': max(self.yMin, min(self.yMax, P))}
+        dt = current_time - last_time
+        if not dt > 0:
+            return {'y': max(self.yMin, min(self.yMax, P))}
+
+        # I term
+        integral = self._integral + error * dt
+        I = self._k_over_Ti * integral
+
+        # D term (simplified first-order filter)
+        derivative = (error - last_error) / dt
+        # First-order filter: dy/dt = (derivative - y_filtered) * Nd / Td
+        alpha = dt * self._Nd_over_Td
+        derivative_filtered = self._derivative_filtered
+        derivative_filtered += alpha * (derivative - derivative_filtered)
+        self._derivative_filtered = derivative_filtered
+        D = self._k_Td * derivative_filtered
+
+        # Compute unlimited output and apply limits
+        y_unlim = P + I + D
         y = max(self.yMin, min(self.yMax, y_unlim))
 
         # Anti-windup: back-calculate integral if saturated
-        if self.with_I and y != y_unlim and dt > 0:
-            # Back-calculate integral
-            delta_y = y_unlim - y
-            self._state['integral'] -= delta_y / (self.k * self.Ni) * dt
-
-        # Update state
-        self._state['last_error'] = error
-        self._state['last_time'] = current_time
+        if y != y_unlim:
+            integral -= (y_unlim - y) * self._inv_kNi * dt
+        self._integral = integral
 
         return {'y': y}
 
     def reset_state(self):
         """Reset controller to initial conditions"""
-        self._state = {
-            'integral': self.xi_start,
-            'last_error': 0.0,
-            'derivative_filtered': self.yd_start,
-            'last_time': None
+        self._integral = self.xi_start
+        self._last_error = 0.0
+        self._derivative_filtered = self.yd_start
+        self._last_time = None
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get current state of the controller.
+
+        Returns:
+            Dictionary with keys 'integral', 'last_error',
+            'derivative_filtered' and 'last_time'
+        """
+        return {
+            'integral': self._integral,
+            'last_error': self._last_error,
+            'derivative_filtered': self._derivative_filtered,
+            'last_time': self._last_time
         }
+
+    def set_state(self, state: Dict[str, Any]):
+        """
+        Restore controller state saved with get_state().
+
+        Args:
+            state: Dictionary containing the state to restore
+        """
+        self._integral = state['integral']
+        self._last_error = state['last_error']
+        self._derivative_filtered = state['derivative_filtered']
+        self._last_time = state['last_time']
@@ -3,6 +3,7 @@
 
 import math
 from typing import Dict, Any
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -50,8 +51,28 @@ class Round(CDLBlock):
         Returns:
             Dictionary with output 'y' = rounded value
         """
-        if u > 0:
-            y = math.floor(u * self.fac + 0.5) / self.fac
-        else:
-            y = math.ceil(u * self.fac - 0.5) / self.fac
+        # Round half away from zero without branching on the sign of u:
+        # truncating u*fac + 0.5*sign(u) equals floor(.+0.5) for u > 0 and
+        # ceil(.-0.5) for u < 0.
+        fac = self.fac
+        return {'y': math.trunc(u * fac + math.copysign(0.5, u)) / fac}
+
+    def compute_batch(self, u: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute rounded values element-wise over an array.
+
+        Uses the same half-away-from-zero rule as compute(); np.rint is not
+        used because it rounds halves to even.
+
+        Args:
+            u: Input values
+
+        Returns:
+            Dictionary with output 'y' containing an array of rounded values
+        """
+        fac = self.fac
+        y = np.multiply(u, fac, dtype=np.float64)
+        y += np.copysign(0.5, y)
+        np.trunc(y, out=y)
+        y /= fac
         return {'y': y}
@@ -3,6 +3,7 @@
 
 import math
 from typing import Dict, Any
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -17,8 +18,21 @@ class Sin(CDLBlock):
 
     Outputs:
         y: Sine of input
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the value must outlive the next call.
     """
 
+    def __init__(self, **kwargs):
+        """
+        Initialize Sin block.
+
+        Args:
+            **kwargs: Additional arguments for CDLBlock
+        """
+        super().__init__(**kwargs)
+        self._out = {'y': 0.0}
+
     def compute(self, u: float) -> Dict[str, Any]:
         """
         Compute sine of input.
@@ -27,6 +41,20 @@ class Sin(CDLBlock):
             u: Input value in radians
 
         Returns:
-            Dictionary with output 'y' = sin(u)
+            Dictionary with output 'y' = sin(u) (owned by the block)
+        """
+        out = self._out
+        out['y'] = math.sin(u)
+        return out
+
+    def compute_batch(self, u: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute sine element-wise over an array.
+
+        Args:
+            u: Input values in radians
+
+        Returns:
+            Dictionary with output 'y' containing an array of sin(u)
         """
-        return {'y': math.sin(u)}
+        return {'y': np.sin(u)}
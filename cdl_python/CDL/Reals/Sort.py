@@ -1,6 +1,6 @@
 # ABOUTME: Sort block - sorts elements in ascending or descending order
 # ABOUTME: Returns sorted values and indices
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import numpy as np
 from cdl_python.base import CDLBlock
 
@@ -14,6 +14,7 @@ class Sort(CDLBlock):
 
     Parameters:
         ascending: If true, sort in ascending order; otherwise descending (default: True)
+        k: If set, only output the first k elements of the sorted vector (default: None)
 
     Inputs:
         u: List of real values to sort
@@ -21,17 +22,30 @@ class Sort(CDLBlock):
     Outputs:
         y: Sorted values
         yIdx: 1-based indices of sorted elements with respect to original vector
+
+    With k set, the k smallest (or largest, if descending) elements are
+    selected with a partial sort and y and yIdx have length min(k, len(u)).
+
+    Raises:
+        ValueError: If k is smaller than 1
     """
 
-    def __init__(self, ascending: bool = True, **kwargs):
+    def __init__(self, ascending: bool = True, k: Optional[int] = None, **kwargs):
         """
         Initialize Sort block.
 
         Args:
             ascending: Sort order (True for ascending, False for descending)
+            k: Number of leading sorted elements to output (None for all)
+
+        Raises:
+            ValueError: If k is smaller than 1
         """
         super().__init__(**kwargs)
+        if k is not None and k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
         self.ascending = ascending
+        self.k = k
 
     def compute(self, u: List[float]) -> Dict[str, Any]:
         """
@@ -46,17 +60,21 @@ class Sort(CDLBlock):
         if len(u) == 0:
             return {'y': [], 'yIdx': []}
 
-        # Get indices that would sort the array (0-based)
-        indices = np.argsort(u)
-
-        # Reverse if descending
-        if not self.ascending:
-            indices = indices[::-1]
+        u_arr = np.asarray(u, dtype=np.float64)
+        k = self.k
 
-        # Sort the values
-        y = [u[i] for i in indices]
+        if k is not None and k < len(u_arr):
+            # Partition out the k leading elements, then sort only those
+            key = u_arr if self.ascending else -u_arr
+            indices = np.argpartition(key, k - 1)[:k]
+            indices = indices[np.argsort(key[indices])]
+        else:
+            # Get indices that would sort the array (0-based)
+            indices = np.argsort(u_arr)
 
-        # Convert to 1-based indices (Modelica convention)
-        yIdx = [i + 1 for i in indices]
+            # Reverse if descending
+            if not self.ascending:
+                indices = indices[::-1]
 
-        return {'y': y, 'yIdx': yIdx}
+        # Gather sorted values and convert to 1-based indices (Modelica convention)
+        return {'y': u_arr[indices].tolist(), 'yIdx': (indices + 1).tolist()}
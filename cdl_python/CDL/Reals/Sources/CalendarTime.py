@@ -4,28 +4,43 @@ Calendar time source block.
 Computes calendar time (year, month, day, hour, minute, weekday) from simulation time.
 """
 
-from typing import Dict, Any
+import math
+from typing import Dict, Any, Tuple
+import numpy as np
 from cdl_python.base import CDLBlock
 from cdl_python.time_manager import TimeManager
+from cdl_python.CDL.Types import ZeroTime
 from datetime import datetime, timedelta
-from enum import Enum
-
-
-class ZeroTime(Enum):
-    """Reference time definition for time = 0"""
-    NY2010 = "NY2010"  # New Year 2010
-    NY2011 = "NY2011"
-    NY2012 = "NY2012"
-    NY2013 = "NY2013"
-    NY2014 = "NY2014"
-    NY2015 = "NY2015"
-    NY2016 = "NY2016"
-    NY2017 = "NY2017"
-    NY2018 = "NY2018"
-    NY2019 = "NY2019"
-    NY2020 = "NY2020"
-    UNIX_TIME_STAMP = "UnixTimeStamp"  # 1970-01-01 00:00:00
-    CUSTOM = "Custom"
+
+
+def _civil_from_days(days: int) -> Tuple[int, int, int]:
+    """Convert days since 1970-01-01 to a proleptic Gregorian date
+
+    Works element-wise on integer arrays as well.
+
+    Args:
+        days: Number of days since 1970-01-01
+
+    Returns:
+        Tuple (year, month, day)
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 - 12 * (mp >= 10)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+# Record layout of the outputs returned by CalendarTime.compute_range()
+CALENDAR_TIME_DTYPE = np.dtype([
+    ('year', 'i4'), ('month', 'i1'), ('day', 'i1'), ('hour', 'i1'),
+    ('minute', 'f8'), ('weekDay', 'i1'),
+])
 
 
 class CalendarTime(CDLBlock):
@@ -36,7 +51,7 @@ class CalendarTime(CDLBlock):
 
     Parameters:
         zerTim: How reference time (time = 0) should be defined
-        yearRef: Year when time = 0 (used if zerTim=CUSTOM, default=2016)
+        yearRef: Year when time = 0 (used if zerTim=Custom, default=2016)
         offset: Offset in seconds added to time (for timezone adjustment, default=0)
 
     Outputs:
@@ -46,23 +61,10 @@ class CalendarTime(CDLBlock):
         hour: Hour of the day (0-23)
         minute: Minute of the hour (0-59.999...)
         weekDay: Day of week (1=Monday, 7=Sunday)
-    """
 
-    # Reference dates for each ZeroTime option
-    _REFERENCE_DATES = {
-        ZeroTime.NY2010: datetime(2010, 1, 1, 0, 0, 0),
-        ZeroTime.NY2011: datetime(2011, 1, 1, 0, 0, 0),
-        ZeroTime.NY2012: datetime(2012, 1, 1, 0, 0, 0),
-        ZeroTime.NY2013: datetime(2013, 1, 1, 0, 0, 0),
-        ZeroTime.NY2014: datetime(2014, 1, 1, 0, 0, 0),
-        ZeroTime.NY2015: datetime(2015, 1, 1, 0, 0, 0),
-        ZeroTime.NY2016: datetime(2016, 1, 1, 0, 0, 0),
-        ZeroTime.NY2017: datetime(2017, 1, 1, 0, 0, 0),
-        ZeroTime.NY2018: datetime(2018, 1, 1, 0, 0, 0),
-        ZeroTime.NY2019: datetime(2019, 1, 1, 0, 0, 0),
-        ZeroTime.NY2020: datetime(2020, 1, 1, 0, 0, 0),
-        ZeroTime.UNIX_TIME_STAMP: datetime(1970, 1, 1, 0, 0, 0),
-    }
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the values must outlive the next call.
+    """
 
     def __init__(self, time_manager: TimeManager, zerTim: ZeroTime = ZeroTime.NY2016,
                  yearRef: int = 2016, offset: float = 0.0):
@@ -71,7 +73,7 @@ class CalendarTime(CDLBlock):
         Args:
             time_manager: Time manager for getting current time
             zerTim: Reference time definition
-            yearRef: Year when time = 0 (used if zerTim=CUSTOM)
+            yearRef: Year when time = 0 (used if zerTim=Custom)
             offset: Offset in seconds (for timezone adjustment)
         """
         super().__init__(time_manager)
@@ -80,19 +82,26 @@ class CalendarTime(CDLBlock):
         self.yearRef = yearRef
         self.offset = offset
 
-        # Determine reference date
-        if zerTim == ZeroTime.CUSTOM:
+        # Reference date in whole seconds since 1970-01-01 (naive, no time zone)
+        if zerTim == ZeroTime.Custom:
             if not (2010 <= yearRef <= 2031):
                 raise ValueError(f"yearRef must be between 2010 and 2031, got {yearRef}")
-            self.reference_date = datetime(yearRef, 1, 1, 0, 0, 0)
+            self._ref_epoch = ZeroTime[f"NY{yearRef}"].epoch()
         else:
-            self.reference_date = self._REFERENCE_DATES[zerTim]
+            self._ref_epoch = zerTim.epoch()
+        self.reference_date = datetime(1970, 1, 1) + timedelta(seconds=self._ref_epoch)
+
+        self._out = {'year': 0, 'month': 0, 'day': 0, 'hour': 0,
+                     'minute': 0.0, 'weekDay': 0}
+
+        # Day number whose date and weekday are currently stored in _out
+        self._cached_day = None
 
     def compute(self) -> Dict[str, Any]:
         """Compute calendar time outputs
 
         Returns:
-            Dictionary with calendar time components:
+            Dictionary (owned by the block) with calendar time components:
                 'year': Year
                 'month': Month (1-12)
                 'day': Day of month (1-31)
@@ -100,30 +109,48 @@ class CalendarTime(CDLBlock):
                 'minute': Minute of hour (0.0-59.999...)
                 'weekDay': Day of week (1=Monday, 7=Sunday)
         """
-        current_time = self.get_time()
-
-        # Add offset
-        adjusted_time = current_time + self.offset
-
-        # Calculate actual datetime
-        dt = self.reference_date + timedelta(seconds=adjusted_time)
-
-        # Extract components
-        year = dt.year
-        month = dt.month
-        day = dt.day
-        hour = dt.hour
-        minute = dt.minute + dt.second / 60.0 + dt.microsecond / 60000000.0
-
-        # Weekday: Python's weekday() returns 0=Monday, 6=Sunday
-        # CDL expects 1=Monday, 7=Sunday
-        weekDay = dt.weekday() + 1
-
-        return {
-            'year': year,
-            'month': month,
-            'day': day,
-            'hour': hour,
-            'minute': minute,
-            'weekDay': weekDay
-        }
+        # Add offset and split into whole seconds since 1970-01-01 and a fraction
+        adjusted_time = self.get_time() + self.offset
+        whole = math.floor(adjusted_time)
+        frac = adjusted_time - whole
+
+        days, rem = divmod(self._ref_epoch + whole, 86400)
+        hour, rem = divmod(rem, 3600)
+        minute, sec = divmod(rem, 60)
+
+        out = self._out
+        # The date only changes once per day; recompute it when the day changes
+        if days != self._cached_day:
+            out['year'], out['month'], out['day'] = _civil_from_days(days)
+            # 1970-01-01 was a Thursday; CDL expects 1=Monday, 7=Sunday
+            out['weekDay'] = (days + 3) % 7 + 1
+            self._cached_day = days
+        out['hour'] = hour
+        out['minute'] = minute + (sec + frac) / 60.0
+
+        return out
+
+    def compute_range(self, t: np.ndarray) -> np.ndarray:
+        """Compute calendar time outputs for an array of simulation times
+
+        Args:
+            t: Simulation times in seconds
+
+        Returns:
+            Structured array of dtype CALENDAR_TIME_DTYPE with one record per
+            time; result['year'] etc. give the outputs as arrays.
+        """
+        adjusted_time = np.asarray(t, dtype=np.float64) + self.offset
+        whole = np.floor(adjusted_time)
+        frac = adjusted_time - whole
+
+        days, rem = np.divmod(whole.astype(np.int64) + self._ref_epoch, 86400)
+        hour, rem = np.divmod(rem, 3600)
+        minute, sec = np.divmod(rem, 60)
+
+        out = np.empty(adjusted_time.shape, dtype=CALENDAR_TIME_DTYPE)
+        out['year'], out['month'], out['day'] = _civil_from_days(days)
+        out['hour'] = hour
+        out['minute'] = minute + (sec + frac) / 60.0
+        out['weekDay'] = (days + 3) % 7 + 1
+        return out
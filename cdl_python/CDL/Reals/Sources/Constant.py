@@ -14,6 +14,9 @@ class Constant(CDLBlock):
 
     Outputs:
         y: Constant output signal (always equals k)
+
+    compute() returns the same output dictionary on every call; copy it if
+    it must outlive the next call.
     """
 
     def __init__(self, time_manager: Optional[TimeManager] = None, k: float = 0.0):
@@ -26,12 +29,15 @@ class Constant(CDLBlock):
         """
         super().__init__(time_manager)
         self.k = k
+        self._out = {'y': k}
 
     def compute(self) -> Dict[str, Any]:
         """
         Compute constant output.
 
         Returns:
-            Dictionary with 'y' containing the constant value k
+            Dictionary with 'y' containing the constant value k (owned by the block)
         """
-        return {'y': self.k}
+        out = self._out
+        out['y'] = self.k
+        return out
@@ -4,11 +4,35 @@ Real-valued pulse source block.
 Generates periodic real-valued pulse signals.
 """
 
+import math
 from typing import Dict, Any
 from cdl_python.base import CDLBlock
 from cdl_python.time_manager import TimeManager
 
 
+def _pulse_parameter(name: str) -> property:
+    """Create a property for a parameter that the derived constants depend on
+
+    Setting the parameter checks it and refreshes the derived constants of the
+    pulse; an invalid value raises ValueError and leaves the block unchanged.
+    """
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        previous = getattr(self, attr)
+        setattr(self, attr, value)
+        try:
+            self._update_constants()
+        except ValueError:
+            setattr(self, attr, previous)
+            raise
+
+    return property(fget, fset)
+
+
 class Pulse(CDLBlock):
     """Generate pulse signal of type Real
 
@@ -26,8 +50,13 @@ class Pulse(CDLBlock):
 
     Outputs:
         y: Output with pulse value
+
+    Assigning a parameter after construction takes effect on the next call.
     """
 
+    width = _pulse_parameter('width')
+    period = _pulse_parameter('period')
+
     def __init__(self, time_manager: TimeManager, amplitude: float = 1.0, width: float = 0.5,
                  period: float = 1.0, shift: float = 0.0, offset: float = 0.0):
         """Initialize Pulse block
@@ -42,16 +71,26 @@ class Pulse(CDLBlock):
         """
         super().__init__(time_manager)
 
-        if not (0 < width <= 1):
-            raise ValueError(f"width must be in (0, 1], got {width}")
-        if period <= 0:
-            raise ValueError(f"period must be > 0, got {period}")
-
         self.amplitude = amplitude
-        self.width = width
-        self.period = period
+        self._width = width
+        self._period = period
         self.shift = shift
         self.offset = offset
+        self._update_constants()
+
+    def _update_constants(self):
+        """Check width and period and derive the constants used on every step
+
+        Raises:
+            ValueError: If width is not in (0, 1] or period is not positive
+        """
+        if not (0 < self._width <= 1):
+            raise ValueError(f"width must be in (0, 1], got {self._width}")
+        if self._period <= 0:
+            raise ValueError(f"period must be > 0, got {self._period}")
+
+        self._inv_period = 1.0 / self._period
+        self._pulse_high_duration = self._width * self._period
 
     def compute(self) -> Dict[str, Any]:
         """Compute pulse output
@@ -69,11 +108,16 @@ class Pulse(CDLBlock):
             return {'y': self.offset}
 
         # Calculate position within current period
-        time_in_period = adjusted_time % self.period
+        period = self._period
+        time_in_period = adjusted_time - period * math.floor(adjusted_time * self._inv_period)
+        # adjusted_time * (1/period) can round across an integer at a period edge
+        if time_in_period >= period:
+            time_in_period -= period
+        elif time_in_period < 0:
+            time_in_period += period
 
         # Pulse is high for first (width * period) seconds of each period
-        pulse_high_duration = self.width * self.period
-        is_high = time_in_period < pulse_high_duration
+        is_high = time_in_period < self._pulse_high_duration
 
         if is_high:
             return {'y': self.offset + self.amplitude}
@@ -9,6 +9,29 @@ from cdl_python.base import CDLBlock
 from cdl_python.time_manager import TimeManager
 
 
+def _ramp_parameter(name: str) -> property:
+    """Create a property for a parameter that the derived constants depend on
+
+    Setting the parameter checks it and refreshes the derived constants of the
+    ramp; an invalid value raises ValueError and leaves the block unchanged.
+    """
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        previous = getattr(self, attr)
+        setattr(self, attr, value)
+        try:
+            self._update_constants()
+        except ValueError:
+            setattr(self, attr, previous)
+            raise
+
+    return property(fget, fset)
+
+
 class Ramp(CDLBlock):
     """Generate ramp signal
 
@@ -24,8 +47,15 @@ class Ramp(CDLBlock):
 
     Outputs:
         y: Ramp output signal
+
+    Assigning a parameter after construction takes effect on the next call.
     """
 
+    height = _ramp_parameter('height')
+    duration = _ramp_parameter('duration')
+    offset = _ramp_parameter('offset')
+    startTime = _ramp_parameter('startTime')
+
     def __init__(self, time_manager: TimeManager, height: float = 1.0, duration: float = 1.0,
                  offset: float = 0.0, startTime: float = 0.0):
         """Initialize Ramp block
@@ -39,13 +69,24 @@ class Ramp(CDLBlock):
         """
         super().__init__(time_manager)
 
-        if duration <= 0:
-            raise ValueError(f"duration must be > 0, got {duration}")
+        self._height = height
+        self._duration = duration
+        self._offset = offset
+        self._startTime = startTime
+        self._update_constants()
+
+    def _update_constants(self):
+        """Check duration and derive the constants used on every step
+
+        Raises:
+            ValueError: If duration is not positive
+        """
+        if self._duration <= 0:
+            raise ValueError(f"duration must be > 0, got {self._duration}")
 
-        self.height = height
-        self.duration = duration
-        self.offset = offset
-        self.startTime = startTime
+        self._slope = self._height / self._duration
+        self._end_time = self._startTime + self._duration
+        self._top = self._offset + self._height
 
     def compute(self) -> Dict[str, Any]:
         """Compute ramp output
@@ -55,15 +96,14 @@ class Ramp(CDLBlock):
         """
         current_time = self.get_time()
 
-        if current_time < self.startTime:
+        if current_time < self._startTime:
             # Before ramp starts
-            y = self.offset
-        elif current_time < (self.startTime + self.duration):
+            y = self._offset
+        elif current_time < self._end_time:
             # During ramp
-            elapsed = current_time - self.startTime
-            y = self.offset + (elapsed * self.height / self.duration)
+            y = self._offset + (current_time - self._startTime) * self._slope
         else:
             # After ramp completes
-            y = self.offset + self.height
+            y = self._top
 
         return {'y': y}
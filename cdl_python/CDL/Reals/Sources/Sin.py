@@ -2,6 +2,7 @@
 # ABOUTME: Time-based sine wave generator with configurable parameters
 import math
 from typing import Any, Dict, Optional
+import numpy as np
 from cdl_python.base import CDLBlock
 from cdl_python.time_manager import TimeManager
 
@@ -48,6 +49,9 @@ class Sin(CDLBlock):
         self.offset = offset
         self.startTime = startTime
 
+        # Angular frequency, 2*pi*freqHz
+        self._omega = 2.0 * math.pi * freqHz
+
     def compute(self) -> Dict[str, Any]:
         """
         Compute sine output at current time.
@@ -64,7 +68,28 @@ class Sin(CDLBlock):
             # Compute sine wave: offset + amplitude * sin(2*pi*freq*(t-t0) + phase)
             time_since_start = current_time - self.startTime
             y = self.offset + self.amplitude * math.sin(
-                2.0 * math.pi * self.freqHz * time_since_start + self.phase
+                self._omega * time_since_start + self.phase
             )
 
         return {'y': y}
+
+    def compute_range(self, t: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute sine output for an array of times.
+
+        Args:
+            t: Simulation times in seconds
+
+        Returns:
+            Dictionary with 'y' containing an array of sine wave values
+        """
+        t = np.asarray(t, dtype=np.float64)
+        y = t - self.startTime
+        y *= self._omega
+        y += self.phase
+        np.sin(y, out=y)
+        y *= self.amplitude
+        y += self.offset
+        # Before start time, output just the offset
+        y[t < self.startTime] = self.offset
+        return {'y': y}
@@ -4,6 +4,7 @@ Real-valued time table source block.
 Table look-up with respect to time with configurable interpolation and extrapolation.
 """
 
+import bisect
 from typing import Dict, Any, List
 import numpy as np
 from cdl_python.base import CDLBlock
@@ -11,6 +12,97 @@ from cdl_python.time_manager import TimeManager
 from enum import Enum
 
 
+# Tables with at least this many rows use an Eytzinger layout for batched lookups
+_EYTZINGER_MIN_SIZE = 256
+
+# Unsorted batches of this many times are sorted before searching small tables;
+# beyond the upper bound the sort costs more than the search saves
+_PRESORT_MIN_QUERIES = 1024
+_PRESORT_MAX_QUERIES = 1 << 18
+
+# Unsorted batches of at least _PRESORT_MIN_QUERIES times on tables with fewer
+# rows than this are searched by comparing against every time stamp
+_LINEAR_SCAN_MAX_SIZE = 16
+
+
+def _eytzinger_layout(sorted_values: np.ndarray):
+    """Arrange sorted values in Eytzinger (breadth-first) order
+
+    Node k of the implicit binary tree has children 2k and 2k+1, so the
+    first levels of every search share the same few cache lines. The
+    array is padded with -inf to a full tree so that a search can run a
+    fixed number of levels.
+
+    Args:
+        sorted_values: Values in ascending order
+
+    Returns:
+        Tuple (keys, index, depth): keys[k] is the value at node k, index[k]
+        its position in sorted_values (index[0] = len(sorted_values)), and
+        depth the number of tree levels
+    """
+    n = len(sorted_values)
+    depth = n.bit_length()
+    keys = np.full(2 << depth, -np.inf)
+    index = np.full(2 << depth, n, dtype=np.intp)
+
+    # In-order traversal of nodes 1..n visits them in ascending order
+    order = []
+    stack = []
+    k = 1
+    while stack or k <= n:
+        while k <= n:
+            stack.append(k)
+            k = 2 * k
+        k = stack.pop()
+        order.append(k)
+        k = 2 * k + 1
+
+    keys[order] = sorted_values
+    index[order] = np.arange(n)
+    return keys, index, depth
+
+
+def _table_array(table: List[List[float]]) -> np.ndarray:
+    """Check a time table and convert it to a read-only float array
+
+    Args:
+        table: Table matrix with time in first column and values in other columns
+
+    Returns:
+        Read-only 2-D float array
+
+    Raises:
+        ValueError: If the table has no rows or a row has fewer than 2 columns
+    """
+    if table is None or len(table) == 0:
+        raise ValueError("Table must have at least one row")
+
+    if any(len(row) < 2 for row in table):
+        raise ValueError("Table must have at least 2 columns (time + at least one value)")
+
+    table = np.array(table, dtype=float)
+    table.flags.writeable = False
+    return table
+
+
+def _table_parameter(name: str) -> property:
+    """Create a property for a parameter that the lookup caches depend on
+
+    Setting the parameter rebuilds the caches of the time table.
+    """
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._update_table()
+
+    return property(fget, fset)
+
+
 class Smoothness(Enum):
     """Table interpolation method"""
     LINEAR_SEGMENTS = "LinearSegments"
@@ -45,6 +137,10 @@ class TimeTable(CDLBlock):
         offset: Offset added to output values (list with length = number of output columns)
         timeScale: Time scale of first column (default=1, set to 3600 if time in hours)
 
+    Assigning table, offset, smoothness, extrapolation or timeScale after
+    construction takes effect on the next call. table and offset are returned
+    as read-only arrays, since their cached copies would not see in-place edits.
+
     Outputs:
         y: Output with tabulated values (list if multiple columns, single value if one column)
     """
@@ -66,36 +162,101 @@ class TimeTable(CDLBlock):
         """
         super().__init__(time_manager)
 
-        if not table or len(table) == 0:
-            raise ValueError("Table must have at least one row")
-
-        if any(len(row) < 2 for row in table):
-            raise ValueError("Table must have at least 2 columns (time + at least one value)")
-
-        # Convert to numpy array
-        self.table = np.array(table, dtype=float)
-        self.smoothness = smoothness
-        self.extrapolation = extrapolation
-        self.timeScale = timeScale
+        self._table = _table_array(table)
+        self._smoothness = smoothness
+        self._extrapolation = extrapolation
+        self._timeScale = timeScale
+        self._offset = None if offset is None else np.array(offset, dtype=float)
+        self._update_table()
+
+    @property
+    def table(self) -> np.ndarray:
+        """Table matrix (read-only array; assign a new table to change it)"""
+        return self._table
+
+    @table.setter
+    def table(self, table: List[List[float]]):
+        table = _table_array(table)
+        if self._offset is not None and len(self._offset) != table.shape[1] - 1:
+            raise ValueError(f"offset length ({len(self._offset)}) must match number of output columns ({table.shape[1] - 1})")
+        self._table = table
+        self._update_table()
+
+    @property
+    def offset(self) -> np.ndarray:
+        """Offset of each output column (read-only array; assign to change it)"""
+        return self._offset_array
+
+    @offset.setter
+    def offset(self, offset: List[float]):
+        offset = np.array(offset, dtype=float)
+        if len(offset) != self.nout:
+            raise ValueError(f"offset length ({len(offset)}) must match number of output columns ({self.nout})")
+        self._offset = offset
+        self._update_table()
+
+    smoothness = _table_parameter('smoothness')
+    extrapolation = _table_parameter('extrapolation')
+    timeScale = _table_parameter('timeScale')
+
+    def _update_table(self):
+        """Derive the lookup caches from the table and its parameters
+
+        Called from __init__ and whenever table, offset, smoothness,
+        extrapolation or timeScale is assigned.
+
+        Raises:
+            ValueError: If offset does not have one entry per output column
+        """
+        table = self._table
+        smoothness = self._smoothness
+        extrapolation = self._extrapolation
 
         # Extract time stamps and scale them
-        self.time_stamps = self.table[:, 0] * timeScale
+        self.time_stamps = table[:, 0] * self._timeScale
+        # Python float copy for scalar lookups with bisect
+        self._time_stamps_list = self.time_stamps.tolist()
+        # Eytzinger layout for batched lookups in large tables
+        if len(self.time_stamps) >= _EYTZINGER_MIN_SIZE:
+            self._eytz = _eytzinger_layout(self.time_stamps)
+        else:
+            self._eytz = None
         # Extract values
-        self.values = self.table[:, 1:]
+        self.values = table[:, 1:]
 
         # Number of outputs
         self.nout = self.values.shape[1]
+        # One contiguous Python float list per output column for the scalar path
+        self._value_cols = [self.values[:, j].tolist() for j in range(self.nout)]
+
+        # Per-interval 1/dt (0 for equal time stamps) and value differences,
+        # padded with a zero interval so a single-row table has one as well
+        dt = np.diff(self.time_stamps)
+        with np.errstate(divide='ignore'):
+            self._inv_dt = np.append(np.where(np.abs(dt) < 1e-12, 0.0, 1.0 / dt), 0.0)
+        self._dv = np.vstack([np.diff(self.values, axis=0), np.zeros((1, self.nout))])
+        self._inv_dt_list = self._inv_dt.tolist()
+        self._dv_cols = [self._dv[:, j].tolist() for j in range(self.nout)]
+        # Index of the last interval, used for extrapolation after the table
+        self._last_interval = max(len(self._time_stamps_list) - 2, 0)
 
         # Set offset
-        if offset is None:
-            self.offset = np.zeros(self.nout)
+        if self._offset is None:
+            offset = np.zeros(self.nout)
         else:
-            if len(offset) != self.nout:
-                raise ValueError(f"offset length ({len(offset)}) must match number of output columns ({self.nout})")
-            self.offset = np.array(offset)
-
-        # Time range
-        self.time_range = self.time_stamps[-1] - self.time_stamps[0]
+            if len(self._offset) != self.nout:
+                raise ValueError(f"offset length ({len(self._offset)}) must match number of output columns ({self.nout})")
+            offset = self._offset.copy()
+        offset.flags.writeable = False
+        self._offset_array = offset
+        self._offset_list = offset.tolist()
+        # With the default all-zero offset, adding it can be skipped
+        self._has_offset = any(self._offset_list)
+
+        # Table bounds and time range as Python floats for the scalar path
+        self._t_first = self._time_stamps_list[0]
+        self._t_last = self._time_stamps_list[-1]
+        self.time_range = self._t_last - self._t_first
 
         # For periodic extrapolation, compute t0
         if extrapolation == Extrapolation.PERIODIC and self.time_range > 0:
@@ -104,75 +265,236 @@ class TimeTable(CDLBlock):
         else:
             self.t0 = 0.0
 
-    def _interpolate(self, t: float) -> np.ndarray:
+        # Bind the interpolation and extrapolation rules once, so the scalar
+        # path does not compare the enums on every call
+        self._constant_segments = smoothness == Smoothness.CONSTANT_SEGMENTS
+        if self._constant_segments:
+            self._interpolate_in_range = self._interpolate_constant
+        else:
+            self._interpolate_in_range = self._interpolate_linear
+        if extrapolation == Extrapolation.LAST_TWO_POINTS:
+            self._extrapolate_below = self._extrapolate_first_two
+            self._extrapolate_above = self._extrapolate_last_two
+        elif extrapolation == Extrapolation.PERIODIC and self.time_range > 0:
+            self._extrapolate_below = self._extrapolate_above = self._wrap_periodic
+        else:
+            # HOLD_LAST_POINT, or PERIODIC with all time stamps equal
+            self._extrapolate_below = self._hold_first
+            self._extrapolate_above = self._hold_last
+
+        # Bracket [time_stamps[i], time_stamps[i+1]) found by the last lookup
+        self._last_idx = 0
+        self._bracket_lo = float('inf')
+        self._bracket_hi = float('-inf')
+
+        # Tables with one value column work on plain floats throughout
+        if self.nout == 1:
+            self._vals = self._value_cols[0]
+            self._dvals = self._dv_cols[0]
+            self._offset0 = self._offset_list[0]
+            self.compute = self._compute_single
+        else:
+            vars(self).pop('compute', None)
+
+    def _interpolate(self, t: float) -> List[float]:
         """Interpolate table values at time t
 
         Args:
             t: Time value
 
         Returns:
-            Interpolated values as numpy array
+            Interpolated value of each output column (without offset)
         """
-        # Handle extrapolation
-        if t < self.time_stamps[0]:
-            # Before first point
-            if self.extrapolation == Extrapolation.HOLD_LAST_POINT:
-                return self.values[0, :]
-            elif self.extrapolation == Extrapolation.LAST_TWO_POINTS:
-                # Extrapolate using first two points
-                if len(self.time_stamps) >= 2:
-                    dt = self.time_stamps[1] - self.time_stamps[0]
-                    dv = self.values[1, :] - self.values[0, :]
-                    dt_extrap = t - self.time_stamps[0]
-                    return self.values[0, :] + (dt_extrap / dt) * dv
-                else:
-                    return self.values[0, :]
-            else:  # PERIODIC
-                # Wrap time into periodic range
-                if self.time_range > 0:
-                    t = self.time_stamps[0] + ((t - self.time_stamps[0]) % self.time_range)
-                else:
-                    return self.values[0, :]
-
-        elif t > self.time_stamps[-1]:
-            # After last point
-            if self.extrapolation == Extrapolation.HOLD_LAST_POINT:
-                return self.values[-1, :]
-            elif self.extrapolation == Extrapolation.LAST_TWO_POINTS:
-                # Extrapolate using last two points
-                if len(self.time_stamps) >= 2:
-                    dt = self.time_stamps[-1] - self.time_stamps[-2]
-                    dv = self.values[-1, :] - self.values[-2, :]
-                    dt_extrap = t - self.time_stamps[-1]
-                    return self.values[-1, :] + (dt_extrap / dt) * dv
-                else:
-                    return self.values[-1, :]
-            else:  # PERIODIC
-                # Wrap time into periodic range
-                if self.time_range > 0:
-                    t = self.time_stamps[0] + ((t - self.time_stamps[0]) % self.time_range)
-                else:
-                    return self.values[-1, :]
-
-        # t is within table range - find surrounding points
-        idx = np.searchsorted(self.time_stamps, t, side='right') - 1
-        idx = max(0, min(idx, len(self.time_stamps) - 2))
+        if t < self._t_first:
+            return self._extrapolate_below(t)
+        if t > self._t_last:
+            return self._extrapolate_above(t)
+        return self._interpolate_in_range(t)
+
+    def _interpolate_constant(self, t: float) -> List[float]:
+        """Zero-order hold (constant segments) for t within the table range"""
+        idx = self._find_interval(t)
+        return [col[idx] for col in self._value_cols]
+
+    def _interpolate_linear(self, t: float) -> List[float]:
+        """Linear interpolation for t within the table range"""
+        idx = self._find_interval(t)
+        # Equal time stamps have 1/dt = 0 and return the first value
+        alpha = (t - self._time_stamps_list[idx]) * self._inv_dt_list[idx]
+        return [col[idx] + alpha * dcol[idx] for col, dcol in zip(self._value_cols, self._dv_cols)]
+
+    def _hold_first(self, t: float) -> List[float]:
+        """Hold the first table row before the table range"""
+        return [col[0] for col in self._value_cols]
+
+    def _hold_last(self, t: float) -> List[float]:
+        """Hold the last table row after the table range"""
+        return [col[-1] for col in self._value_cols]
+
+    def _extrapolate_first_two(self, t: float) -> List[float]:
+        """Extrapolate before the table range using the first two points"""
+        scale = (t - self._t_first) * self._inv_dt_list[0]
+        return [col[0] + scale * dcol[0] for col, dcol in zip(self._value_cols, self._dv_cols)]
+
+    def _extrapolate_last_two(self, t: float) -> List[float]:
+        """Extrapolate after the table range using the last two points"""
+        last = self._last_interval
+        scale = (t - self._t_last) * self._inv_dt_list[last]
+        return [col[-1] + scale * dcol[last] for col, dcol in zip(self._value_cols, self._dv_cols)]
+
+    def _wrap_periodic(self, t: float) -> List[float]:
+        """Wrap t outside the table range into it and interpolate there"""
+        return self._interpolate_in_range(self._t_first + ((t - self._t_first) % self.time_range))
+
+    def _find_interval(self, t: float) -> int:
+        """Find the index i of the table interval containing time t
+
+        Simulation time advances monotonically, so the interval of the
+        previous lookup and the one after it are tried before a binary
+        search of the Python list copy of the time stamps.
+
+        Args:
+            t: Time value within the table range
+
+        Returns:
+            Index i with time_stamps[i] <= t < time_stamps[i+1], clipped to
+            [0, len(time_stamps) - 2]
+        """
+        if self._bracket_lo <= t < self._bracket_hi:
+            return self._last_idx
+
+        time_stamps = self._time_stamps_list
+        n = len(time_stamps)
+        idx = self._last_idx + 1
+        if not (idx + 1 < n and time_stamps[idx] <= t < time_stamps[idx + 1]):
+            idx = bisect.bisect_right(time_stamps, t) - 1
+            idx = max(0, min(idx, n - 2))
+
+        # Only cache a proper bracket; t == time_stamps[-1] is clipped into the last interval
+        if idx + 1 < n and time_stamps[idx] <= t < time_stamps[idx + 1]:
+            self._last_idx = idx
+            self._bracket_lo = time_stamps[idx]
+            self._bracket_hi = time_stamps[idx + 1]
+        return idx
+
+    def _search_batch(self, t: np.ndarray) -> np.ndarray:
+        """Count the time stamps less than or equal to each time
+
+        Equivalent to np.searchsorted(time_stamps, t, side='right').
+        np.searchsorted is fastest on ascending times, so these are searched
+        directly. Large unsorted batches on tables with only a few rows count
+        the time stamps with one vectorized comparison per row, and mid-sized
+        ones on other small tables are sorted first. Unsorted batches on
+        large tables descend the Eytzinger layout one level at a time for all
+        times at once instead of running independent binary searches.
+
+        Args:
+            t: Time values (1-D array)
+
+        Returns:
+            Integer array of insertion indices
+        """
+        if t.size < 2 or (t[1:] >= t[:-1]).all():
+            return np.searchsorted(self.time_stamps, t, side='right')
+
+        if self._eytz is None:
+            if t.size >= _PRESORT_MIN_QUERIES and len(self._time_stamps_list) < _LINEAR_SCAN_MAX_SIZE:
+                idx = np.zeros(t.shape, dtype=np.intp)
+                for time_stamp in self._time_stamps_list:
+                    idx += t >= time_stamp
+                return idx
+            if _PRESORT_MIN_QUERIES <= t.size <= _PRESORT_MAX_QUERIES:
+                order = np.argsort(t)
+                idx = np.empty(t.shape, dtype=np.intp)
+                idx[order] = np.searchsorted(self.time_stamps, t[order], side='right')
+                return idx
+            return np.searchsorted(self.time_stamps, t, side='right')
+
+        keys, index, depth = self._eytz
+        k = np.ones(t.shape, dtype=np.intp)
+        for _ in range(depth):
+            right = t >= keys[k]
+            k *= 2
+            k += right
+        # Drop the trailing right turns and the last left turn to get the
+        # node of the first time stamp greater than t (0 if there is none)
+        k //= 2 * ((k + 1) & ~k)
+        return index[k]
+
+    def _interpolate_batch(self, t: np.ndarray) -> np.ndarray:
+        """Interpolate table values at an array of times
+
+        Vectorized counterpart of _interpolate with the same interpolation
+        and extrapolation rules.
+
+        Args:
+            t: Time values (1-D array)
+
+        Returns:
+            Interpolated values as array of shape (len(t), nout)
+        """
+        t = np.asarray(t, dtype=float)
+        time_stamps = self.time_stamps
+        values = self.values
+        n = len(time_stamps)
+
+        below = t < time_stamps[0]
+        above = t > time_stamps[-1]
+
+        # Handle periodic extrapolation by wrapping time into the table range
+        if self.extrapolation == Extrapolation.PERIODIC and self.time_range > 0:
+            # np.mod rounds exactly like the scalar path's float %; wrap all
+            # times in one buffer and restore the ones within the range
+            inside = ~(below | above)
+            wrapped = np.subtract(t, self._t_first)
+            np.mod(wrapped, self.time_range, out=wrapped)
+            wrapped += self._t_first
+            np.copyto(wrapped, t, where=inside)
+            t = wrapped
+            below = above = None
+
+        # Find surrounding points
+        idx = self._search_batch(t) - 1
+        np.clip(idx, 0, max(n - 2, 0), out=idx)
 
         if self.smoothness == Smoothness.CONSTANT_SEGMENTS:
             # Zero-order hold (constant segments)
-            return self.values[idx, :]
+            y = values[idx]
         else:
-            # Linear interpolation
-            t0, t1 = self.time_stamps[idx], self.time_stamps[idx + 1]
-            v0, v1 = self.values[idx, :], self.values[idx + 1, :]
-
-            if abs(t1 - t0) < 1e-12:
-                # Time stamps are equal, return first value
-                return v0
+            # Linear interpolation; equal time stamps have 1/dt = 0 and return the first value
+            alpha = (t - time_stamps[idx]) * self._inv_dt[idx]
+            y = values[idx] + alpha[:, None] * self._dv[idx]
+
+        # Handle hold and two-point extrapolation
+        if below is not None:
+            if self.extrapolation == Extrapolation.LAST_TWO_POINTS:
+                scale = (t[below] - time_stamps[0]) * self._inv_dt[0]
+                y[below] = values[0, :] + scale[:, None] * self._dv[0]
+                last = self._last_interval
+                scale = (t[above] - time_stamps[-1]) * self._inv_dt[last]
+                y[above] = values[-1, :] + scale[:, None] * self._dv[last]
             else:
-                # Linear interpolation
-                alpha = (t - t0) / (t1 - t0)
-                return v0 + alpha * (v1 - v0)
+                y[below] = values[0, :]
+                y[above] = values[-1, :]
+
+        return y
+
+    def compute_range(self, t: np.ndarray) -> Dict[str, Any]:
+        """Compute table output for an array of times
+
+        Args:
+            t: Simulation times in seconds
+
+        Returns:
+            Dictionary with 'y': array of table values (with offset applied),
+            of shape (len(t),) for one output column or (len(t), nout) otherwise
+        """
+        values = self._interpolate_batch(np.atleast_1d(t))
+        if self._has_offset:
+            values += self.offset
+        if self.nout == 1:
+            return {'y': values[:, 0]}
+        return {'y': values}
 
     def compute(self) -> Dict[str, Any]:
         """Compute table output
@@ -185,11 +507,37 @@ class TimeTable(CDLBlock):
         # Interpolate
         values = self._interpolate(current_time)
 
-        # Apply offset
-        values = values + self.offset
-
-        # Return single value if only one output, otherwise return array
+        # Apply offset; return single value if only one output, otherwise a list
         if self.nout == 1:
-            return {'y': float(values[0])}
+            return {'y': values[0] + self._offset_list[0]}
+        else:
+            # _interpolate returns a new list on every call, so add the offset in place
+            if self._has_offset:
+                offsets = self._offset_list
+                for j in range(self.nout):
+                    values[j] += offsets[j]
+            return {'y': values}
+
+    def _compute_single(self) -> Dict[str, Any]:
+        """Compute table output for a table with one value column
+
+        Bound as compute() in __init__ when nout == 1. Lookups within the
+        table range are done inline on Python floats; extrapolation goes
+        through _interpolate.
+
+        Returns:
+            Dictionary with 'y': table value at current time (with offset applied)
+        """
+        t = self.get_time()
+
+        if self._t_first <= t <= self._t_last:
+            idx = self._find_interval(t)
+            vals = self._vals
+            if self._constant_segments:
+                y = vals[idx]
+            else:
+                y = vals[idx] + (t - self._time_stamps_list[idx]) * self._inv_dt_list[idx] * self._dvals[idx]
         else:
-            return {'y': values.tolist()}
+            y = self._interpolate(t)[0]
+
+        return {'y': y + self._offset0}
@@ -3,6 +3,7 @@
 
 import math
 from typing import Dict, Any
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -13,6 +14,12 @@ class Sqrt(CDLBlock):
     Outputs y = sqrt(u)
     Input u must be non-negative.
 
+    Parameters:
+        checked: If true (default), negative inputs are rejected with a
+            descriptive error. If false, compute() leaves the check to
+            math.sqrt, and compute_batch() returns NaN for negative inputs
+            so a whole batch can be checked afterwards with np.isnan.
+
     Inputs:
         u: Input to square root function (must be >= 0)
 
@@ -23,6 +30,20 @@ class Sqrt(CDLBlock):
         ValueError: If input is negative
     """
 
+    def __init__(self, checked: bool = True, **kwargs):
+        """
+        Initialize Sqrt block.
+
+        Args:
+            checked: Validate inputs before taking the square root
+            **kwargs: Additional arguments for CDLBlock
+        """
+        super().__init__(**kwargs)
+        self.checked = checked
+        if not checked:
+            self.compute = self._compute_unchecked
+            self.compute_raw = self._compute_raw_unchecked
+
     def compute(self, u: float) -> Dict[str, Any]:
         """
         Compute square root of input.
@@ -33,9 +54,77 @@ class Sqrt(CDLBlock):
         Returns:
             Dictionary with output 'y' = sqrt(u)
 
+        Raises:
+            ValueError: If u < 0
+        """
+        return {'y': self.compute_raw(u)}
+
+    def compute_raw(self, u: float) -> float:
+        """
+        Compute square root of input, returning the output value directly.
+
+        Args:
+            u: Input value (must be >= 0)
+
+        Returns:
+            Output y = sqrt(u)
+
         Raises:
             ValueError: If u < 0
         """
         if u < 0:
             raise ValueError(f"Sqrt requires non-negative input, got {u}")
+        return math.sqrt(u)
+
+    def compute_batch(self, u: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute square roots element-wise over an array.
+
+        Args:
+            u: Input values (must all be >= 0)
+
+        Returns:
+            Dictionary with output 'y' containing an array of square roots
+            (NaN for negative elements if checked is false)
+
+        Raises:
+            ValueError: If any element of u is negative and checked is true
+        """
+        u = np.asarray(u, dtype=np.float64)
+        if not self.checked:
+            with np.errstate(invalid='ignore'):
+                return {'y': np.sqrt(u)}
+        if (u < 0).any():
+            raise ValueError(f"Sqrt requires non-negative input, got {u[u < 0][0]}")
+        return {'y': np.sqrt(u)}
+
+    def _compute_unchecked(self, u: float) -> Dict[str, Any]:
+        """
+        Compute square root of input without the explicit sign check.
+
+        Args:
+            u: Input value
+
+        Returns:
+            Dictionary with output 'y' = sqrt(u)
+
+        Raises:
+            ValueError: If u < 0 (math domain error from math.sqrt)
+        """
         return {'y': math.sqrt(u)}
+
+    def _compute_raw_unchecked(self, u: float) -> float:
+        """
+        Compute square root of input without the explicit sign check,
+        returning the output value directly.
+
+        Args:
+            u: Input value
+
+        Returns:
+            Output y = sqrt(u)
+
+        Raises:
+            ValueError: If u < 0 (math domain error from math.sqrt)
+        """
+        return math.sqrt(u)
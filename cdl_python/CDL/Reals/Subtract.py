@@ -3,6 +3,7 @@
 
 from typing import Dict, Any
 from cdl_python.base import CDLBlock
+from cdl_python.CDL.Reals.FusedSubtractSqrtTan import FusedSubtractSqrtTan
 
 
 class Subtract(CDLBlock):
@@ -30,4 +31,26 @@ class Subtract(CDLBlock):
         Returns:
             Dictionary with output 'y' = u1 - u2
         """
-        return {'y': u1 - u2}
+        return {'y': self.compute_raw(u1, u2)}
+
+    def compute_raw(self, u1: float, u2: float) -> float:
+        """
+        Compute difference of two inputs, returning the output value directly.
+
+        Args:
+            u1: Minuend value
+            u2: Subtrahend value
+
+        Returns:
+            Output y = u1 - u2
+        """
+        return u1 - u2
+
+    def fuse_with_sqrt_tan(self) -> FusedSubtractSqrtTan:
+        """
+        Fuse a Sqrt and a Tan fed by this block's output into a single block.
+
+        Returns:
+            FusedSubtractSqrtTan computing the same output as the Subtract-Sqrt-Tan chain
+        """
+        return FusedSubtractSqrtTan(time_manager=self.time_manager)
@@ -2,6 +2,7 @@
 # ABOUTME: Implements y = u1 if u2 else u3 for CDL real-valued conditional switching.
 
 from typing import Dict, Any
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -33,4 +34,34 @@ class Switch(CDLBlock):
         Returns:
             Dictionary with output 'y' = u1 if u2 else u3
         """
-        return {'y': u1 if u2 else u3}
+        return {'y': self.compute_raw(u1, u2, u3)}
+
+    def compute_raw(self, u1: float, u2: bool, u3: float) -> float:
+        """
+        Compute switch output, returning the output value directly.
+
+        Args:
+            u1: First input value
+            u2: Boolean selector
+            u3: Second input value
+
+        Returns:
+            Output y = u1 if u2 else u3
+        """
+        return u1 if u2 else u3
+
+    def compute_batch(self, u1: np.ndarray, u2: np.ndarray, u3: np.ndarray) -> Dict[str, Any]:
+        """
+        Compute switch outputs element-wise over arrays.
+
+        Scalars are broadcast, so a constant u1 or u3 can be passed as a float.
+
+        Args:
+            u1: First input values
+            u2: Boolean selectors
+            u3: Second input values
+
+        Returns:
+            Dictionary with output 'y' = where(u2, u1, u3) as an array
+        """
+        return {'y': np.where(np.asarray(u2, dtype=bool), u1, u3)}
@@ -29,4 +29,16 @@ class Tan(CDLBlock):
         Returns:
             Dictionary with output 'y' = tan(u)
         """
-        return {'y': math.tan(u)}
+        return {'y': self.compute_raw(u)}
+
+    def compute_raw(self, u: float) -> float:
+        """
+        Compute tangent of input, returning the output value directly.
+
+        Args:
+            u: Input value in radians
+
+        Returns:
+            Output y = tan(u)
+        """
+        return math.tan(u)
@@ -12,16 +12,21 @@ from cdl_python.CDL.Reals.Average import Average
 from cdl_python.CDL.Reals.Cos import Cos
 from cdl_python.CDL.Reals.Divide import Divide
 from cdl_python.CDL.Reals.Exp import Exp
+from cdl_python.CDL.Reals.FusedLineLimiter import FusedLineLimiter
+from cdl_python.CDL.Reals.FusedSubtractSqrtTan import FusedSubtractSqrtTan
 from cdl_python.CDL.Reals.Greater import Greater
+from cdl_python.CDL.Reals.GreaterArray import GreaterArray
 from cdl_python.CDL.Reals.GreaterThreshold import GreaterThreshold
 from cdl_python.CDL.Reals.Hysteresis import Hysteresis
 from cdl_python.CDL.Reals.IntegratorWithReset import IntegratorWithReset
 from cdl_python.CDL.Reals.Less import Less
 from cdl_python.CDL.Reals.LessThreshold import LessThreshold
 from cdl_python.CDL.Reals.Limiter import Limiter
+from cdl_python.CDL.Reals.LimiterArray import LimiterArray
 from cdl_python.CDL.Reals.Line import Line
 from cdl_python.CDL.Reals.Log import Log
 from cdl_python.CDL.Reals.Log10 import Log10
+from cdl_python.CDL.Reals.LogArray import LogArray
 from cdl_python.CDL.Reals.MatrixGain import MatrixGain
 from cdl_python.CDL.Reals.MatrixMax import MatrixMax
 from cdl_python.CDL.Reals.MatrixMin import MatrixMin
@@ -58,16 +63,21 @@ __all__ = [
     "Cos",
     "Divide",
     "Exp",
+    "FusedLineLimiter",
+    "FusedSubtractSqrtTan",
     "Greater",
+    "GreaterArray",
     "GreaterThreshold",
     "Hysteresis",
     "IntegratorWithReset",
     "Less",
     "LessThreshold",
     "Limiter",
+    "LimiterArray",
     "Line",
     "Log",
     "Log10",
+    "LogArray",
     "MatrixGain",
     "MatrixMax",
     "MatrixMin",
@@ -1,5 +1,6 @@
 # ABOUTME: BooleanVectorFilter - Filter boolean vector by boolean mask
 from typing import Any, Dict, List
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -27,14 +28,19 @@ class BooleanVectorFilter(CDLBlock):
         if true_count != nout:
             raise ValueError(f"nout must equal True count in mask (got nout={nout}, True count={true_count})")
 
+        # Indices of the kept elements, as a list and as an index array
+        self._keep = [i for i in range(nin) if self.msk[i]]
+        self._keep_idx = np.array(self._keep, dtype=np.intp)
+
     def compute(self, u: List[bool]) -> Dict[str, Any]:
         """Filter u by mask
 
         Args:
-            u: Input vector
+            u: Input vector (list, or numpy array for an array output)
 
         Returns:
             Dictionary with 'y': filtered vector
         """
-        y = [u[i] for i in range(self.nin) if self.msk[i]]
-        return {'y': y}
+        if isinstance(u, np.ndarray):
+            return {'y': u[self._keep_idx]}
+        return {'y': [u[i] for i in self._keep]}
@@ -1,6 +1,7 @@
 # ABOUTME: RealScalarReplicator - Replicate scalar to vector
 # ABOUTME: Returns array filled with input value
 from typing import Any, Dict, List
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -41,3 +42,17 @@ class RealScalarReplicator(CDLBlock):
             Dictionary with 'y' containing [u, u, ..., u]
         """
         return {'y': [u] * self.nout}
+
+    def compute_batch(self, u: np.ndarray) -> Dict[str, Any]:
+        """
+        Replicate a batch of scalars without copying.
+
+        Args:
+            u: Scalar inputs, one per step (1-D array)
+
+        Returns:
+            Dictionary with 'y' containing a read-only view of shape
+            (len(u), nout) whose row i repeats u[i]
+        """
+        u = np.asarray(u, dtype=np.float64)
+        return {'y': np.broadcast_to(u[:, None], (u.shape[0], self.nout))}
@@ -1,6 +1,7 @@
 # ABOUTME: RealVectorFilter - Filter vector by boolean mask
 # ABOUTME: Extracts elements where mask is True
 from typing import Any, Dict, List
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -39,15 +40,20 @@ class RealVectorFilter(CDLBlock):
         if true_count != nout:
             raise ValueError(f"nout={nout} must equal number of True values in mask ({true_count})")
 
+        # Indices of the kept elements, as a list and as an index array
+        self._keep = [i for i in range(nin) if self.msk[i]]
+        self._keep_idx = np.array(self._keep, dtype=np.intp)
+
     def compute(self, u: List[float]) -> Dict[str, Any]:
         """
         Filter vector by mask.
 
         Args:
-            u: Input vector
+            u: Input vector (list, or numpy array for an array output)
 
         Returns:
             Dictionary with 'y' containing filtered values
         """
-        y = [u[i] for i in range(self.nin) if self.msk[i]]
-        return {'y': y}
+        if isinstance(u, np.ndarray):
+            return {'y': u[self._keep_idx]}
+        return {'y': [u[i] for i in self._keep]}
@@ -1,5 +1,6 @@
 # ABOUTME: RealVectorReplicator - Replicate real vector multiple times
 from typing import Any, Dict, List
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -33,3 +34,14 @@ class RealVectorReplicator(CDLBlock):
         """
         y = u * self.nrep  # [u1, u2] * 2 = [u1, u2, u1, u2]
         return {'y': y}
+
+    def compute_batch(self, u: np.ndarray) -> Dict[str, Any]:
+        """Replicate a batch of input vectors nrep times
+
+        Args:
+            u: Input vectors, one row per step (shape (N, nin))
+
+        Returns:
+            Dictionary with 'y': array of shape (N, nin * nrep)
+        """
+        return {'y': np.tile(np.asarray(u, dtype=np.float64), (1, self.nrep))}
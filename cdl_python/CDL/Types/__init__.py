@@ -1,5 +1,6 @@
 # ABOUTME: CDL Types package - Enumerations for CDL blocks
 # ABOUTME: Defines type enumerations used across CDL packages
+from datetime import date
 from enum import Enum, auto
 
 
@@ -70,6 +71,34 @@ class ZeroTime(Enum):
     NY2048 = "NY2048"
     NY2049 = "NY2049"
     NY2050 = "NY2050"
+    # Aliases kept for code written against the former CalendarTime enum
+    UNIX_TIME_STAMP = "UnixTimeStamp"
+    CUSTOM = "Custom"
+
+    def epoch(self) -> int:
+        """Seconds from 1970-01-01 00:00:00 to the date of this member
+
+        Counted on the same clock as the member itself (no time zone
+        conversion), so NY2010.epoch() is 1262304000 on every machine.
+        Looked up in a table built once at import.
+
+        Returns:
+            Whole seconds since 1970-01-01 00:00:00
+
+        Raises:
+            ValueError: For Custom, whose date depends on the reference year
+        """
+        try:
+            return _EPOCH[self]
+        except KeyError:
+            raise ValueError(f"{self} has no fixed epoch; it depends on the reference year") from None
+
+
+# Epoch of each ZeroTime member with a fixed date, in whole seconds since 1970-01-01
+_EPOCH = {ZeroTime.UnixTimeStamp: 0, ZeroTime.UnixTimeStampGMT: 0}
+for _year in range(2010, 2051):
+    _EPOCH[ZeroTime[f"NY{_year}"]] = (date(_year, 1, 1) - date(1970, 1, 1)).days * 86400
+del _year
 
 
 class OperationModes(Enum):
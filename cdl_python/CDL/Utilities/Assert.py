@@ -1,6 +1,8 @@
 # ABOUTME: Assert - Print warning when condition becomes false
+import sys
 from typing import Any, Dict
 import warnings
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
@@ -14,8 +16,16 @@ class Assert(CDLBlock):
     - Detecting unexpected conditions in control logic
     - Validating assumptions during simulation
     - Debugging control sequences
+
+    Warnings are attributed to the line that created the block, which is
+    looked up once at construction instead of walking the stack on every
+    failing call. Each block keeps its own warning registry, so under the
+    default filter a block warns once; use warnings.simplefilter('always')
+    to see every failure.
     """
 
+    __slots__ = ('message', '_filename', '_lineno', '_module', '_registry')
+
     def __init__(self, message: str = "Assertion failed"):
         """Initialize Assert block
 
@@ -25,6 +35,12 @@ class Assert(CDLBlock):
         super().__init__()
         self.message = message
 
+        caller = sys._getframe(1)
+        self._filename = caller.f_code.co_filename
+        self._lineno = caller.f_lineno
+        self._module = caller.f_globals.get('__name__', '<unknown>')
+        self._registry = {}
+
     def compute(self, u: bool) -> Dict[str, Any]:
         """Check assertion and print warning if false
 
@@ -35,5 +51,25 @@ class Assert(CDLBlock):
             Empty dictionary (block has no outputs)
         """
         if not u:
-            warnings.warn(self.message, UserWarning, stacklevel=2)
+            warnings.warn_explicit(self.message, UserWarning, self._filename,
+                                   self._lineno, self._module, self._registry)
+        return {}
+
+    def compute_batch(self, u: np.ndarray) -> Dict[str, Any]:
+        """Check assertion over an array of inputs
+
+        Issues a single warning for the whole batch if any input is false,
+        naming the index of the first failure.
+
+        Args:
+            u: Boolean inputs to check
+
+        Returns:
+            Empty dictionary (block has no outputs)
+        """
+        u = np.asarray(u, dtype=bool)
+        if not u.all():
+            idx = int(np.argmin(u))
+            warnings.warn_explicit(f"{self.message} (first failure at index {idx})", UserWarning,
+                                   self._filename, self._lineno, self._module, self._registry)
         return {}
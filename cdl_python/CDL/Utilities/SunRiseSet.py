@@ -1,9 +1,74 @@
 # ABOUTME: SunRiseSet - Compute sunrise and sunset times
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 import math
+import os
+import numpy as np
 from cdl_python.base import CDLBlock
 
 
+# Reciprocal of the day length, to find the day by multiplication
+_INV_SECONDS_PER_DAY = 1.0 / 86400.0
+
+# Unit conversions, hoisted so each is a single multiplication
+_DEG2RAD = math.pi / 180.0
+_RAD2MINUTES = 720.0 / math.pi  # hour angle in radians to minutes of time
+_TWO_PI_OVER_365 = 2.0 * math.pi / 365.0
+
+# Smallest number of elements given to one thread by compute_batch_parallel
+_PARALLEL_MIN_CHUNK = 1 << 16
+
+
+def _sun_rise_set(tan_lat: float, tan_decl: float, eqtime: float,
+                  longitude: float) -> Tuple[float, float]:
+    """Compute sunrise and sunset times from the per-day solar quantities
+
+    Plain float function holding the per-step math of SunRiseSet.compute,
+    so it runs without attribute lookups (and compiles to C when the
+    package is built with Cython).
+
+    Args:
+        tan_lat: Tangent of the latitude
+        tan_decl: Tangent of the solar declination
+        eqtime: Equation of time in minutes
+        longitude: Longitude in degrees (east positive)
+
+    Returns:
+        Tuple (tSunRis, tSunSet) in seconds since midnight (local solar time)
+    """
+    # Hour angle at sunrise/sunset (sun at horizon, zenith = 90°)
+    # cos(hour_angle) = -tan(lat) * tan(decl)
+    cos_ha = -tan_lat * tan_decl
+
+    # Check for polar day/night
+    if cos_ha > 1.0:
+        # Polar night (sun never rises)
+        return 0.0, 0.0
+    elif cos_ha < -1.0:
+        # Polar day (sun never sets)
+        return 0.0, 86400.0
+
+    # Hour angle converted from radians to minutes
+    ha_minutes = math.acos(cos_ha) * _RAD2MINUTES
+
+    # Solar noon (local solar time) in minutes
+    solar_noon = 720.0 - 4.0 * longitude - eqtime
+
+    # Sunrise and sunset in seconds since midnight, clamped to [0, 86400]
+    # with comparisons rather than min()/max() calls
+    tSunRis = (solar_noon - ha_minutes) * 60.0
+    tSunSet = (solar_noon + ha_minutes) * 60.0
+    if tSunRis < 0.0:
+        tSunRis = 0.0
+    elif tSunRis > 86400.0:
+        tSunRis = 86400.0
+    if tSunSet < 0.0:
+        tSunSet = 0.0
+    elif tSunSet > 86400.0:
+        tSunSet = 86400.0
+    return tSunRis, tSunSet
+
+
 class SunRiseSet(CDLBlock):
     """Compute sunrise and sunset times for a given location and date
 
@@ -19,6 +84,12 @@ class SunRiseSet(CDLBlock):
     - tSunRis: Sunrise time in seconds since midnight (local solar time)
     - tSunSet: Sunset time in seconds since midnight (local solar time)
 
+    compute_batch() evaluates the same outputs for arrays of inputs, and
+    compute_batch_parallel() splits large arrays across threads.
+
+    compute() returns the same output dictionary on every call, updated in
+    place; copy it if the values must outlive the next call.
+
     Used for:
     - Daylighting control strategies
     - Shading device control
@@ -26,6 +97,12 @@ class SunRiseSet(CDLBlock):
     - Solar tracking systems
     """
 
+    __slots__ = (
+        '_year', '_is_leap_year', '_max_days', '_decl_table', '_eqtime_table',
+        '_tan_decl_table', '_tan_decl_array', '_eqtime_array',
+        '_cached_day', '_cached_latitude', '_cached_longitude', '_out',
+    )
+
     def __init__(self, year: int = 2024):
         """Initialize SunRiseSet block
 
@@ -34,7 +111,34 @@ class SunRiseSet(CDLBlock):
         """
         super().__init__()
         self.year = year
-        self._is_leap_year = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+        # Declination and equation of time only change once per day; tabulate
+        # them for every day of a leap year (indexed by day_of_year - 1)
+        harmonics = [self._harmonics(d) for d in range(1, 367)]
+        self._decl_table = [decl for decl, _ in harmonics]
+        self._eqtime_table = [eqtime for _, eqtime in harmonics]
+        self._tan_decl_table = [math.tan(decl) for decl in self._decl_table]
+        self._tan_decl_array = np.array(self._tan_decl_table)
+        self._eqtime_array = np.array(self._eqtime_table)
+
+        # The outputs depend only on the day and the location, which normally
+        # stay the same for a whole day of steps; keep the last result in the
+        # output dictionary and only update it when they change
+        self._cached_day = None
+        self._cached_latitude = None
+        self._cached_longitude = None
+        self._out = {'tSunRis': 0.0, 'tSunSet': 0.0}
+
+    @property
+    def year(self) -> int:
+        """Year for calculations (affects leap year handling)"""
+        return self._year
+
+    @year.setter
+    def year(self, value: int):
+        self._year = value
+        self._is_leap_year = (value % 4 == 0 and value % 100 != 0) or (value % 400 == 0)
+        self._max_days = 366 if self._is_leap_year else 365
 
     def _day_of_year(self, time: float) -> int:
         """Calculate day of year from time in seconds
@@ -45,50 +149,41 @@ class SunRiseSet(CDLBlock):
         Returns:
             Day of year (1-365 or 1-366 for leap years)
         """
-        seconds_per_day = 86400
-        day = int(time / seconds_per_day) + 1
-        max_days = 366 if self._is_leap_year else 365
-        return min(max(day, 1), max_days)
+        day = int(time * _INV_SECONDS_PER_DAY) + 1
+        # Clamp with comparisons rather than min()/max() calls
+        if day < 1:
+            return 1
+        if day > self._max_days:
+            return self._max_days
+        return day
+
+    def _harmonics(self, day_of_year: int) -> Tuple[float, float]:
+        """Calculate solar declination and equation of time
 
-    def _solar_declination(self, day_of_year: int) -> float:
-        """Calculate solar declination angle
+        Both Spencer (1971) series use the first harmonics of the same day
+        angle, so its sine and cosine are evaluated once and the second and
+        third harmonics are derived with the angle-sum identities.
 
         Args:
             day_of_year: Day of year (1-365/366)
 
         Returns:
-            Declination angle in radians
+            Tuple (declination in radians, equation of time in minutes)
         """
-        # Simplified formula (Spencer 1971)
         # Day angle in radians
-        gamma = 2.0 * math.pi * (day_of_year - 1) / 365.0
-
-        # Declination in radians
-        decl = 0.006918 - 0.399912 * math.cos(gamma) + 0.070257 * math.sin(gamma) \
-               - 0.006758 * math.cos(2 * gamma) + 0.000907 * math.sin(2 * gamma) \
-               - 0.002697 * math.cos(3 * gamma) + 0.00148 * math.sin(3 * gamma)
-
-        return decl
-
-    def _equation_of_time(self, day_of_year: int) -> float:
-        """Calculate equation of time (correction for solar time)
-
-        Args:
-            day_of_year: Day of year (1-365/366)
+        gamma = _TWO_PI_OVER_365 * (day_of_year - 1)
+        c1, s1 = math.cos(gamma), math.sin(gamma)
+        c2, s2 = 2.0 * c1 * c1 - 1.0, 2.0 * s1 * c1
+        c3, s3 = c1 * c2 - s1 * s2, s1 * c2 + c1 * s2
 
-        Returns:
-            Equation of time in minutes
-        """
-        # Day angle
-        gamma = 2.0 * math.pi * (day_of_year - 1) / 365.0
+        decl = 0.006918 - 0.399912 * c1 + 0.070257 * s1 \
+            - 0.006758 * c2 + 0.000907 * s2 \
+            - 0.002697 * c3 + 0.00148 * s3
 
-        # Equation of time in minutes (Spencer 1971)
-        eqtime = 229.18 * (0.000075 + 0.001868 * math.cos(gamma)
-                          - 0.032077 * math.sin(gamma)
-                          - 0.014615 * math.cos(2 * gamma)
-                          - 0.040849 * math.sin(2 * gamma))
+        eqtime = 229.18 * (0.000075 + 0.001868 * c1 - 0.032077 * s1
+                           - 0.014615 * c2 - 0.040849 * s2)
 
-        return eqtime
+        return decl, eqtime
 
     def compute(self, time: float, latitude: float, longitude: float) -> Dict[str, Any]:
         """Compute sunrise and sunset times
@@ -99,56 +194,125 @@ class SunRiseSet(CDLBlock):
             longitude: Longitude in degrees (-180 to 180, east positive)
 
         Returns:
-            Dictionary with:
+            Dictionary (owned by the block) with:
                 - 'tSunRis': Sunrise time in seconds since midnight (local solar time)
                 - 'tSunSet': Sunset time in seconds since midnight (local solar time)
         """
-        # Convert angles to radians
-        lat_rad = math.radians(latitude)
+        day_index = self._day_of_year(time) - 1
+        if (day_index != self._cached_day or latitude != self._cached_latitude
+                or longitude != self._cached_longitude):
+            out = self._out
+            out['tSunRis'], out['tSunSet'] = _sun_rise_set(
+                math.tan(latitude * _DEG2RAD),
+                self._tan_decl_table[day_index],
+                self._eqtime_table[day_index],
+                longitude,
+            )
+            self._cached_day = day_index
+            self._cached_latitude = latitude
+            self._cached_longitude = longitude
+
+        return self._out
+
+    def compute_batch(self, time: np.ndarray, latitude: np.ndarray,
+                      longitude: np.ndarray) -> Dict[str, Any]:
+        """Compute sunrise and sunset times element-wise over arrays
+
+        Inputs are broadcast against each other, so e.g. an array of times
+        can be combined with a scalar location or an array of locations with
+        a scalar time.
 
-        # Get day of year
-        day_of_year = self._day_of_year(time)
+        Args:
+            time: Times in seconds since start of year
+            latitude: Latitudes in degrees (-90 to 90, north positive)
+            longitude: Longitudes in degrees (-180 to 180, east positive)
 
-        # Calculate solar declination
-        decl = self._solar_declination(day_of_year)
+        Returns:
+            Dictionary with:
+                - 'tSunRis': Array of sunrise times in seconds since midnight
+                - 'tSunSet': Array of sunset times in seconds since midnight
+        """
+        time, latitude, longitude = np.broadcast_arrays(
+            np.asarray(time, dtype=np.float64),
+            np.asarray(latitude, dtype=np.float64),
+            np.asarray(longitude, dtype=np.float64),
+        )
 
-        # Calculate hour angle at sunrise/sunset (sun at horizon, zenith = 90°)
-        # cos(hour_angle) = -tan(lat) * tan(decl)
-        cos_ha = -math.tan(lat_rad) * math.tan(decl)
+        # Day of year - 1, as in _day_of_year, to index the per-day tables
+        day_index = np.clip(np.trunc(time * _INV_SECONDS_PER_DAY), 0, self._max_days - 1).astype(np.intp)
+        tan_decl = self._tan_decl_array[day_index]
+        eqtime = self._eqtime_array[day_index]
 
-        # Check for polar day/night
-        if cos_ha > 1.0:
-            # Polar night (sun never rises)
-            return {'tSunRis': 0.0, 'tSunSet': 0.0}
-        elif cos_ha < -1.0:
-            # Polar day (sun never sets)
-            return {'tSunRis': 0.0, 'tSunSet': 86400.0}
+        # Hour angle at sunrise/sunset; clipped here, polar cases set below
+        cos_ha = -np.tan(latitude * _DEG2RAD) * tan_decl
+        ha_minutes = np.arccos(np.clip(cos_ha, -1.0, 1.0)) * _RAD2MINUTES
 
-        # Hour angle in radians
-        ha = math.acos(cos_ha)
+        solar_noon = 720.0 - 4.0 * longitude - eqtime
+        tSunRis = np.clip((solar_noon - ha_minutes) * 60.0, 0.0, 86400.0)
+        tSunSet = np.clip((solar_noon + ha_minutes) * 60.0, 0.0, 86400.0)
 
-        # Convert hour angle to time (radians to hours)
-        ha_hours = ha * 12.0 / math.pi
+        # Polar night (sun never rises) and polar day (sun never sets)
+        polar_night = cos_ha > 1.0
+        polar_day = cos_ha < -1.0
+        tSunRis[polar_night | polar_day] = 0.0
+        tSunSet[polar_night] = 0.0
+        tSunSet[polar_day] = 86400.0
 
-        # Equation of time correction
-        eqtime = self._equation_of_time(day_of_year)
+        return {
+            'tSunRis': tSunRis,
+            'tSunSet': tSunSet
+        }
 
-        # Solar noon (local solar time) in minutes
-        solar_noon = 720.0 - 4.0 * longitude - eqtime
+    def compute_batch_parallel(self, time: np.ndarray, latitude: np.ndarray,
+                               longitude: np.ndarray,
+                               workers: Optional[int] = None) -> Dict[str, Any]:
+        """Compute sunrise and sunset times over arrays on several threads
 
-        # Sunrise and sunset in minutes since midnight
-        sunrise_minutes = solar_noon - ha_hours * 60.0
-        sunset_minutes = solar_noon + ha_hours * 60.0
+        Splits the broadcast inputs into contiguous chunks evaluated by
+        compute_batch() in a thread pool. The NumPy operations release the
+        GIL and the per-day tables are only read, so the chunks run in
+        parallel. Inputs too small to fill two chunks of
+        _PARALLEL_MIN_CHUNK elements are evaluated on the calling thread.
 
-        # Convert to seconds
-        tSunRis = sunrise_minutes * 60.0
-        tSunSet = sunset_minutes * 60.0
+        Args:
+            time: Times in seconds since start of year
+            latitude: Latitudes in degrees (-90 to 90, north positive)
+            longitude: Longitudes in degrees (-180 to 180, east positive)
+            workers: Number of threads (default: number of CPUs)
 
-        # Clamp to valid range [0, 86400]
-        tSunRis = max(0.0, min(86400.0, tSunRis))
-        tSunSet = max(0.0, min(86400.0, tSunSet))
+        Returns:
+            Dictionary with:
+                - 'tSunRis': Array of sunrise times in seconds since midnight
+                - 'tSunSet': Array of sunset times in seconds since midnight
+        """
+        time, latitude, longitude = np.broadcast_arrays(
+            np.asarray(time, dtype=np.float64),
+            np.asarray(latitude, dtype=np.float64),
+            np.asarray(longitude, dtype=np.float64),
+        )
+        shape = time.shape
+        n = time.size
+        if workers is None:
+            workers = os.cpu_count() or 1
+        n_chunks = min(workers, n // _PARALLEL_MIN_CHUNK)
+        if n_chunks < 2:
+            return self.compute_batch(time, latitude, longitude)
+
+        time, latitude, longitude = time.ravel(), latitude.ravel(), longitude.ravel()
+        tSunRis = np.empty(n)
+        tSunSet = np.empty(n)
+        bounds = np.linspace(0, n, n_chunks + 1).astype(np.intp)
+
+        def run(k: int):
+            lo, hi = bounds[k], bounds[k + 1]
+            out = self.compute_batch(time[lo:hi], latitude[lo:hi], longitude[lo:hi])
+            tSunRis[lo:hi] = out['tSunRis']
+            tSunSet[lo:hi] = out['tSunSet']
+
+        with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+            list(pool.map(run, range(n_chunks)))
 
         return {
-            'tSunRis': tSunRis,
-            'tSunSet': tSunSet
+            'tSunRis': tSunRis.reshape(shape),
+            'tSunSet': tSunSet.reshape(shape)
         }
@@ -1,9 +1,11 @@
 # ABOUTME: CDLPython library - Python implementation of Control Description Language blocks.
 # ABOUTME: Provides elementary blocks for building control sequences with simulation and real-time execution support.
 
+import importlib
+
 from cdl_python.time_manager import TimeManager, ExecutionMode
 from cdl_python.base import CDLBlock
-from cdl_python.checkpoint import CheckpointManager, AutoCheckpointer
+from cdl_python.block_array import BlockArray
 
 __version__ = "0.1.0"
 
@@ -11,10 +13,25 @@ __all__ = [
     "TimeManager",
     "ExecutionMode",
     "CDLBlock",
+    "BlockArray",
     "CheckpointManager",
     "AutoCheckpointer",
     "CDL",
 ]
 
-# Package-level imports for convenience
-from cdl_python import CDL
+# Names imported on first access (PEP 562), mapped to the module defining them
+_LAZY_IMPORTS = {
+    "CheckpointManager": "cdl_python.checkpoint",
+    "AutoCheckpointer": "cdl_python.checkpoint",
+}
+
+
+def __getattr__(name):
+    """Import the checkpoint classes and the CDL package on first access"""
+    if name == "CDL":
+        return importlib.import_module("cdl_python.CDL")
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,8 @@
 # ABOUTME: Base class for all CDL blocks providing common interface and state management.
 # ABOUTME: Separates control logic from time management using TimeManager queries.
 
-from typing import Any, Dict, Optional
+import inspect
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 from cdl_python.time_manager import TimeManager
 
 
@@ -15,8 +16,56 @@ class CDLBlock:
     - Common interface for all blocks
 
     Subclasses must implement compute() method.
+
+    Single-output blocks may also provide compute_raw(), which takes the
+    same inputs as compute() but returns the value of 'y' directly instead
+    of wrapping it in a dictionary. Schedulers that know the output name
+    can call it to skip the per-call dictionary allocation. Stateless
+    blocks whose whole computation is a single expression may further
+    provide as_callable(), returning a plain function of the inputs that
+    can be called without any attribute lookup on the block.
+
+    Each subclass records the input names of its compute() in declaration
+    order in _input_order, so a scheduler holding the input values in that
+    order can call block.compute(*values) instead of passing keywords.
+    The inputs without a default value are recorded in _REQUIRED. A block
+    that rebinds compute() on an instance with a different signature must
+    set both attributes on that instance as well.
+
+    The base attributes live in __slots__. Subclasses that do not declare
+    __slots__ of their own still get a per-instance __dict__; those that do
+    must list every attribute they set, plus '__dict__' if they bind
+    methods such as compute() on the instance.
     """
 
+    __slots__ = ('time_manager', '_state')
+
+    _input_order: Tuple[str, ...] = ()
+    _REQUIRED: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Derive _input_order and _REQUIRED from the signature of the
+        subclass's compute().
+
+        Args:
+            **kwargs: Passed on to object.__init_subclass__
+        """
+        super().__init_subclass__(**kwargs)
+        if 'compute' not in cls.__dict__:
+            return
+        params = list(inspect.signature(cls.compute).parameters.values())[1:]
+        if '_input_order' not in cls.__dict__:
+            cls._input_order = tuple(
+                p.name for p in params
+                if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+            )
+        if '_REQUIRED' not in cls.__dict__:
+            cls._REQUIRED = frozenset(
+                p.name for p in params
+                if p.default is p.empty and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+            )
+
     def __init__(self, time_manager: Optional[TimeManager] = None):
         """
         Initialize CDL block.
@@ -59,6 +108,9 @@ class CDLBlock:
         """
         Get current time from TimeManager.
 
+        In REALTIME mode this is the wall-clock time latched by the
+        TimeManager's last tick() or advance().
+
         Returns:
             Current time in seconds
 
@@ -71,22 +123,24 @@ class CDLBlock:
             )
         return self.time_manager.get_time()
 
-    def _validate_inputs(self, required_inputs: list, provided_inputs: dict):
+    def _validate_inputs(self, provided_inputs: dict):
         """
-        Validate that all required inputs are provided.
+        Validate that all required inputs (_REQUIRED) are provided.
+
+        Skipped entirely when Python runs with -O.
 
         Args:
-            required_inputs: List of required input names
             provided_inputs: Dictionary of provided inputs
 
         Raises:
             ValueError: If required inputs are missing
         """
-        missing = set(required_inputs) - set(provided_inputs.keys())
-        if missing:
-            raise ValueError(
-                f"{self.__class__.__name__} missing required inputs: {missing}"
-            )
+        if __debug__:
+            missing = self._REQUIRED.difference(provided_inputs)
+            if missing:
+                raise ValueError(
+                    f"{self.__class__.__name__} missing required inputs: {set(missing)}"
+                )
 
     def _initialize_state_if_needed(self, **defaults):
         """
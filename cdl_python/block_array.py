@@ -0,0 +1,90 @@
+# ABOUTME: Base class for evaluating a whole layer of identical CDL blocks in one call.
+# ABOUTME: Stores per-block parameters and state as aligned NumPy arrays (structure-of-arrays).
+
+from typing import Any, Optional
+import numpy as np
+from cdl_python.base import CDLBlock
+from cdl_python.time_manager import TimeManager
+
+
+class BlockArray(CDLBlock):
+    """
+    Base class for arrays of identical CDL blocks.
+
+    Instead of N independent block objects that are each called once per
+    step, a BlockArray holds the parameters and state of all N blocks in
+    parallel NumPy arrays of length n and evaluates the whole layer with a
+    single compute() call on input arrays of length n.
+
+    Parameters may be given as a scalar (shared by every block in the array)
+    or as a sequence of length n (one value per block).
+
+    Subclasses must implement compute() method, returning a dictionary of
+    output names to NumPy arrays of length n.
+    """
+
+    def __init__(self, n: int, time_manager: Optional[TimeManager] = None):
+        """
+        Initialize block array.
+
+        Args:
+            n: Number of blocks in the array (must be >= 1)
+            time_manager: TimeManager instance (optional)
+
+        Raises:
+            ValueError: If n < 1
+        """
+        super().__init__(time_manager)
+        if n < 1:
+            raise ValueError(f"Number of blocks n must be >= 1, got {n}")
+        self.n = n
+
+    def _parameter_array(self, name: str, value: Any, dtype=np.float64) -> np.ndarray:
+        """
+        Broadcast a parameter to an array with one entry per block.
+
+        Args:
+            name: Parameter name (used in error messages)
+            value: Scalar or sequence of length n
+            dtype: NumPy dtype of the resulting array
+
+        Returns:
+            Array of shape (n,)
+
+        Raises:
+            ValueError: If value is neither scalar nor of length n
+        """
+        arr = np.asarray(value, dtype=dtype)
+        if arr.ndim == 0:
+            return np.full(self.n, arr, dtype=dtype)
+        if arr.shape != (self.n,):
+            raise ValueError(
+                f"{self.__class__.__name__} parameter {name} must be scalar or "
+                f"have length {self.n}, got shape {arr.shape}"
+            )
+        return arr.copy()
+
+    def _input_array(self, name: str, value: Any, dtype=np.float64) -> np.ndarray:
+        """
+        Convert an input to an array with one entry per block.
+
+        Passing an ndarray of the right dtype avoids any copy.
+
+        Args:
+            name: Input name (used in error messages)
+            value: Scalar or sequence of length n
+            dtype: NumPy dtype of the resulting array
+
+        Returns:
+            Array of shape (n,) or a 0-d array for scalar inputs
+
+        Raises:
+            ValueError: If value is neither scalar nor of length n
+        """
+        arr = np.asarray(value, dtype=dtype)
+        if arr.ndim != 0 and arr.shape != (self.n,):
+            raise ValueError(
+                f"{self.__class__.__name__} input {name} must be scalar or "
+                f"have length {self.n}, got shape {arr.shape}"
+            )
+        return arr
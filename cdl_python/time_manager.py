@@ -2,6 +2,7 @@
 # ABOUTME: Provides unified time interface that blocks query during execution.
 
 import time
+from contextlib import nullcontext
 from enum import Enum
 from typing import Optional
 from threading import Lock
@@ -21,7 +22,13 @@ class TimeManager:
     - SIMULATION: Manual time advancement with fixed or variable timesteps
     - REALTIME: Wall-clock time for actual building control
 
-    Thread-safe for future CPRE asynchronous operation.
+    In REALTIME mode the wall clock is read once per scheduler pass by
+    tick() (or advance()), and get_time() returns that time to every block.
+
+    Locking is opt-in: pass thread_safe=True when another thread reads or
+    advances the time concurrently (e.g. a CheckpointManager writer or
+    asynchronous CPRE operation). Without it, get_time() is a plain
+    attribute read.
 
     Example:
         # Simulation mode
@@ -30,14 +37,16 @@ class TimeManager:
 
         # Real-time mode
         tm = TimeManager(mode=ExecutionMode.REALTIME)
-        current = tm.get_time()  # Returns wall-clock time
+        tm.tick()  # Reads the wall clock once per pass
+        current = tm.get_time()  # Returns the wall-clock time of the pass
     """
 
     def __init__(
         self,
         mode: ExecutionMode = ExecutionMode.REALTIME,
         start_time: Optional[float] = None,
-        time_step: Optional[float] = None
+        time_step: Optional[float] = None,
+        thread_safe: bool = False
     ):
         """
         Initialize TimeManager.
@@ -46,10 +55,15 @@ class TimeManager:
             mode: ExecutionMode.SIMULATION or ExecutionMode.REALTIME
             start_time: Initial time (default: 0.0 for simulation, wall-clock for realtime)
             time_step: Default timestep for simulation mode (seconds)
+            thread_safe: Guard the time with a lock for concurrent access
         """
         self.mode = mode
         self.time_step = time_step
-        self._lock = Lock()
+        self.thread_safe = thread_safe
+        # A no-op context manager stands in for the lock when not thread-safe
+        self._lock = Lock() if thread_safe else nullcontext()
+        if not thread_safe:
+            self.get_time = self._get_time_unlocked
 
         if start_time is not None:
             self._current_time = start_time
@@ -59,15 +73,48 @@ class TimeManager:
             else:
                 self._current_time = time.time()
 
+    @property
+    def mode(self) -> ExecutionMode:
+        """Execution mode; setting it also updates the _is_realtime flag"""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: ExecutionMode):
+        self._mode = mode
+        self._is_realtime = mode == ExecutionMode.REALTIME
+
     def get_time(self) -> float:
         """
         Get current time.
 
+        In REALTIME mode this is the wall-clock time latched by the last
+        tick() or advance(), so all blocks evaluated in one scheduler pass
+        see the same time. Bound to an unlocked variant in __init__ unless
+        thread_safe is set.
+
         Returns:
             Current time in seconds (simulation time or wall-clock time)
         """
         with self._lock:
-            if self.mode == ExecutionMode.REALTIME:
+            return self._current_time
+
+    def _get_time_unlocked(self) -> float:
+        """Get current time without locking"""
+        return self._current_time
+
+    def tick(self) -> float:
+        """
+        Start a scheduler pass.
+
+        In REALTIME mode reads the wall clock once and keeps it as the
+        current time until the next tick() or advance(); call it at the top
+        of every pass. In SIMULATION mode the time is left unchanged.
+
+        Returns:
+            Current time
+        """
+        with self._lock:
+            if self._is_realtime:
                 self._current_time = time.time()
             return self._current_time
 
@@ -88,17 +135,16 @@ class TimeManager:
             ValueError: If in SIMULATION mode and neither dt nor time_step is set
         """
         with self._lock:
-            if self.mode == ExecutionMode.SIMULATION:
-                if dt is not None:
-                    self._current_time += dt
-                elif self.time_step is not None:
-                    self._current_time += self.time_step
-                else:
-                    raise ValueError(
-                        "SIMULATION mode requires dt parameter or time_step to be set"
-                    )
-            else:  # REALTIME
+            if self._is_realtime:
                 self._current_time = time.time()
+            elif dt is not None:
+                self._current_time += dt
+            elif self.time_step is not None:
+                self._current_time += self.time_step
+            else:
+                raise ValueError(
+                    "SIMULATION mode requires dt parameter or time_step to be set"
+                )
 
             return self._current_time
 
@@ -112,11 +158,10 @@ class TimeManager:
         with self._lock:
             if start_time is not None:
                 self._current_time = start_time
+            elif self._is_realtime:
+                self._current_time = time.time()
             else:
-                if self.mode == ExecutionMode.SIMULATION:
-                    self._current_time = 0.0
-                else:
-                    self._current_time = time.time()
+                self._current_time = 0.0
 
     def set_mode(self, mode: ExecutionMode, start_time: Optional[float] = None):
         """
@@ -130,7 +175,7 @@ class TimeManager:
             self.mode = mode
             if start_time is not None:
                 self._current_time = start_time
-            elif mode == ExecutionMode.REALTIME:
+            elif self._is_realtime:
                 self._current_time = time.time()
 
     def get_state(self) -> dict:
@@ -151,7 +196,7 @@ class TimeManager:
         """
         with self._lock:
             return {
-                'mode': self.mode.value,
+                'mode': self._mode.value,
                 'current_time': self._current_time,
                 'time_step': self.time_step
             }
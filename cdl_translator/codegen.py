@@ -3,13 +3,20 @@
 Generates executable Python code from CDLModel internal representation.
 """
 
+import hashlib
 import os
 from pathlib import Path
 from typing import Dict, Any, List, Set
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from cdl_translator import model as _model
 from cdl_translator.model import CDLModel, BlockInstance, Connection
 
 
+# Sources the generated code depends on besides the templates: this module
+# and the model, which decides imports, time manager use and block order
+_FINGERPRINT_SOURCES = (Path(__file__), Path(_model.__file__))
+
+
 class CodeGenerator:
     """Generate Python code from CDLModel
 
@@ -37,6 +44,29 @@ class CodeGenerator:
             lstrip_blocks=True,
         )
 
+        # Digest returned by fingerprint(), computed on first use
+        self._fingerprint = None
+
+    def fingerprint(self) -> bytes:
+        """Digest of what the generated code depends on besides its inputs
+
+        Covers the source of this module and of cdl_translator.model, and
+        the templates, so code cached under it is regenerated when any of
+        them changes.
+
+        Returns:
+            Digest bytes
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for path in _FINGERPRINT_SOURCES:
+                digest.update(path.read_bytes())
+            for path in sorted(self.template_dir.glob("*.jinja2")):
+                digest.update(path.name.encode())
+                digest.update(path.read_bytes())
+            self._fingerprint = digest.digest()
+        return self._fingerprint
+
     def generate(self, model: CDLModel, custom_imports: set = None) -> str:
         """Generate complete Python code from model
 
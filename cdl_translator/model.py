@@ -4,11 +4,26 @@ This module defines data structures for representing parsed CDL models
 in a format suitable for Python code generation.
 """
 
+import heapq
+import operator
+import re
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Set, Tuple, Optional
 from enum import Enum
 
 
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _same_items(cached: tuple, items: list) -> bool:
+    """Check that a list still holds exactly the objects of a cached tuple"""
+    return len(cached) == len(items) and all(map(operator.is_, cached, items))
+
+
 class PortType(Enum):
     """Type of port (input/output connector)"""
     REAL = "Real"
@@ -16,7 +31,11 @@ class PortType(Enum):
     BOOLEAN = "Boolean"
 
 
-@dataclass
+# Valid Parameter.type values
+_PARAM_TYPES = frozenset({'Real', 'Integer', 'Boolean'})
+
+
+@dataclass(**_SLOTS)
 class Parameter:
     """Model or block parameter
 
@@ -30,11 +49,11 @@ class Parameter:
 
     def __post_init__(self):
         """Validate parameter"""
-        if self.type not in ['Real', 'Integer', 'Boolean']:
+        if self.type not in _PARAM_TYPES:
             raise ValueError(f"Invalid parameter type: {self.type}")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Port:
     """Input or output port"""
     name: str
@@ -42,42 +61,66 @@ class Port:
     description: str = ""
 
     def __post_init__(self):
-        """Convert string type to PortType if needed"""
+        """Convert string type to PortType if needed
+
+        The parser passes PortType members already, so this only converts
+        ports created by hand.
+        """
         if isinstance(self.type, str):
             self.type = PortType[self.type.upper()]
 
 
+# Simple name of a custom block type: the text after the first ':', then
+# after the first '#', then after the last '.'
+_CUSTOM_BLOCK_NAME = re.compile(r'(?:[^:]*:)?(?:[^#]*#)?(?:.*\.)?(.*)', re.DOTALL)
+
+# CDL packages that have blocks requiring TimeManager
+_STATEFUL_PACKAGES = {
+    'Reals': {
+        'Derivative', 'IntegratorWithReset', 'Integrator',
+        'LimitSlewRate', 'MovingAverage', 'PID', 'PIDWithReset',
+        'LimPID'
+    },
+    'Logical': {
+        'FallingEdge', 'RisingEdge', 'Timer', 'TrueDelay',
+        'TrueFalseHold', 'TrueHoldWithReset', 'OnCounter',
+        'Proof', 'VariablePulse'
+    },
+    'Discrete': {
+        'Sampler', 'FirstOrderHold', 'ZeroOrderHold',
+        'UnitDelay', 'TriggeredMax', 'TriggeredMovingMean',
+        'TriggeredSampler'
+    },
+    'Utilities': {
+        'SunRiseSet'
+    }
+}
+
+# The same blocks as (package, class name) pairs, for a single set lookup
+_STATEFUL_BLOCKS = frozenset(
+    (package, class_name)
+    for package, class_names in _STATEFUL_PACKAGES.items()
+    for class_name in class_names
+)
+
+
 @dataclass
 class BlockInstance:
     """Instance of a CDL block
 
     Represents a single block instantiation within a model.
+
+    Results derived from block_type (its dotted parts, the position of
+    'CDL' in them, the Python import path, the custom block name, whether
+    a TimeManager is needed) are computed on first use and cached on the
+    instance; block_type is not changed after creation.
     """
     instance_name: str  # e.g., "gain", "adder"
     block_type: str     # e.g., "Buildings.Controls.OBC.CDL.Reals.Add"
     parameters: Dict[str, Any] = field(default_factory=dict)
 
     # CDL packages that have blocks requiring TimeManager
-    STATEFUL_PACKAGES = {
-        'Reals': {
-            'Derivative', 'IntegratorWithReset', 'Integrator',
-            'LimitSlewRate', 'MovingAverage', 'PID', 'PIDWithReset',
-            'LimPID'
-        },
-        'Logical': {
-            'FallingEdge', 'RisingEdge', 'Timer', 'TrueDelay',
-            'TrueFalseHold', 'TrueHoldWithReset', 'OnCounter',
-            'Proof', 'VariablePulse'
-        },
-        'Discrete': {
-            'Sampler', 'FirstOrderHold', 'ZeroOrderHold',
-            'UnitDelay', 'TriggeredMax', 'TriggeredMovingMean',
-            'TriggeredSampler'
-        },
-        'Utilities': {
-            'SunRiseSet'
-        }
-    }
+    STATEFUL_PACKAGES = _STATEFUL_PACKAGES
 
     def is_standard_cdl_block(self) -> bool:
         """Check if this is a standard CDL library block
@@ -86,7 +129,7 @@ class BlockInstance:
             True if block type contains 'CDL' (standard library block)
             False otherwise (custom/user-defined block)
         """
-        return 'CDL' in self.block_type.split('.')
+        return not self._is_custom
 
     def is_custom_block(self) -> bool:
         """Check if this is a custom/user-defined block
@@ -94,7 +137,7 @@ class BlockInstance:
         Returns:
             True if not a standard CDL block
         """
-        return not self.is_standard_cdl_block()
+        return self._is_custom
 
     def get_custom_block_name(self) -> str:
         """Extract the simple name from a custom block type
@@ -107,38 +150,39 @@ class BlockInstance:
         Returns:
             Simple block name without namespace or path
         """
-        block_type = self.block_type
+        return self._custom_name
 
-        # Strip namespace prefix (e.g., "ex:")
-        if ':' in block_type:
-            block_type = block_type.split(':', 1)[1]
+    @cached_property
+    def _type_parts(self) -> Tuple[str, ...]:
+        """Dotted parts of block_type"""
+        return tuple(self.block_type.split('.'))
 
-        # Extract after # for URIs
-        if '#' in block_type:
-            block_type = block_type.split('#', 1)[1]
+    @cached_property
+    def _cdl_idx(self) -> int:
+        """Index of 'CDL' in the dotted parts of block_type, or -1"""
+        try:
+            return self._type_parts.index('CDL')
+        except ValueError:
+            return -1
 
-        # Get last part after dots
-        if '.' in block_type:
-            return block_type.split('.')[-1]
+    @cached_property
+    def _is_custom(self) -> bool:
+        """Whether block_type is not a standard CDL library block"""
+        return self._cdl_idx < 0
 
-        return block_type
+    @cached_property
+    def _custom_name(self) -> str:
+        """Simple name of block_type without namespace or path"""
+        return _CUSTOM_BLOCK_NAME.fullmatch(self.block_type).group(1)
 
-    def get_python_import_path(self) -> Tuple[str, str]:
-        """Convert CDL path to Python import path
-
-        Returns:
-            Tuple of (module_path, class_name)
-
-        Example:
-            "Buildings.Controls.OBC.CDL.Reals.Add"
-            -> ("cdl_python.CDL.Reals", "Add")
-        """
-        parts = self.block_type.split('.')
+    @cached_property
+    def _import_path(self) -> Tuple[str, str]:
+        """(module_path, class_name) for a standard CDL block"""
+        parts = self._type_parts
 
         # Find CDL in the path
-        try:
-            cdl_idx = parts.index('CDL')
-        except ValueError:
+        cdl_idx = self._cdl_idx
+        if cdl_idx < 0:
             raise ValueError(f"Invalid CDL block type: {self.block_type}")
 
         # Extract package and class name
@@ -150,6 +194,32 @@ class BlockInstance:
 
         return (module_path, class_name)
 
+    @cached_property
+    def _needs_tm(self) -> bool:
+        """Whether this block requires a TimeManager"""
+        # Custom blocks don't require time manager from parent
+        # (they manage their own if needed)
+        if self._is_custom:
+            return False
+
+        # (package, class name), e.g. ("Reals", "PID")
+        return self._type_parts[-2:] in _STATEFUL_BLOCKS
+
+    def get_python_import_path(self) -> Tuple[str, str]:
+        """Convert CDL path to Python import path
+
+        Returns:
+            Tuple of (module_path, class_name)
+
+        Raises:
+            ValueError: If block_type is not a standard CDL block
+
+        Example:
+            "Buildings.Controls.OBC.CDL.Reals.Add"
+            -> ("cdl_python.CDL.Reals", "Add")
+        """
+        return self._import_path
+
     def needs_time_manager(self) -> bool:
         """Check if this block requires a TimeManager
 
@@ -158,22 +228,10 @@ class BlockInstance:
 
         Custom blocks are assumed to handle their own time management internally.
         """
-        # Custom blocks don't require time manager from parent
-        # (they manage their own if needed)
-        if self.is_custom_block():
-            return False
-
-        _, class_name = self.get_python_import_path()
-        module_path, _ = self.get_python_import_path()
+        return self._needs_tm
 
-        # Extract package name (e.g., "Reals" from "cdl_python.CDL.Reals")
-        package = module_path.split('.')[-1]
 
-        return package in self.STATEFUL_PACKAGES and \
-               class_name in self.STATEFUL_PACKAGES[package]
-
-
-@dataclass
+@dataclass(**_SLOTS)
 class Connection:
     """Connection between ports
 
@@ -223,6 +281,14 @@ class CDLModel:
     instances: List[BlockInstance] = field(default_factory=list)
     connections: List[Connection] = field(default_factory=list)
 
+    # Result of the last topological sort (order or cycle error), with the
+    # instances and connections it was computed for
+    _order_cache: Optional[Tuple[tuple, tuple, Any]] = field(
+        default=None, init=False, repr=False, compare=False)
+    # Instances by name, with the instances it was built for
+    _by_name_cache: Optional[Tuple[tuple, Dict[str, BlockInstance]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
     def get_required_imports(self) -> Dict[str, Set[str]]:
         """Get all CDL imports needed (only standard blocks)
 
@@ -235,20 +301,18 @@ class CDLModel:
 
         Note: Custom blocks are not included - they are imported separately
         """
-        imports = {}
+        imports = defaultdict(set)
 
         for instance in self.instances:
             # Skip custom blocks - they're handled separately
-            if instance.is_custom_block():
+            if instance._is_custom:
                 continue
 
-            module_path, class_name = instance.get_python_import_path()
-
-            if module_path not in imports:
-                imports[module_path] = set()
-
+            module_path, class_name = instance._import_path
             imports[module_path].add(class_name)
 
+        imports = dict(imports)
+
         # Add enum type imports
         enum_imports = self._get_enum_imports()
         if enum_imports:
@@ -302,41 +366,147 @@ class CDLModel:
         Returns blocks in order such that all dependencies are
         computed before their dependents.
 
+        The sort runs once and its result is reused by later calls (e.g.
+        from validate() and the code generator). It is redone when
+        instances or connections are added, removed or replaced; call
+        invalidate_caches() after changing the fields of one in place.
+
         Returns:
             List of BlockInstance in computation order
 
         Raises:
             ValueError: If circular dependency detected
         """
-        # Build dependency graph: instance -> set of instances it depends on
+        result = self._cached_order()
+        if isinstance(result, ValueError):
+            raise ValueError(str(result))
+        return list(result)
+
+    def _cached_order(self, graph: Optional[tuple] = None) -> Any:
+        """Computation order (or cycle error), sorted only if not cached
+
+        Args:
+            graph: Result of _build_graph() to sort, if already built
+
+        Returns:
+            List of BlockInstance in computation order, or the ValueError
+            for a circular dependency
+        """
+        cached = self._order_cache
+        if (cached is None or not _same_items(cached[0], self.instances)
+                or not _same_items(cached[1], self.connections)):
+            try:
+                result = self._sort_instances(graph or self._build_graph())
+            except ValueError as e:
+                result = e
+            cached = self._order_cache = (
+                tuple(self.instances), tuple(self.connections), result)
+        return cached[2]
+
+    def invalidate_caches(self):
+        """Discard the cached computation order and instance lookup
+
+        Needed only after the fields of an instance or connection are
+        changed in place; adding, removing or replacing list items is
+        detected automatically.
+        """
+        self._order_cache = None
+        self._by_name_cache = None
+
+    def _instances_by_name(self) -> Dict[str, BlockInstance]:
+        """Map instance names to instances (the first one for a repeated name)
+
+        Built once and rebuilt when instances are added, removed or replaced.
+        """
+        cached = self._by_name_cache
+        if cached is None or not _same_items(cached[0], self.instances):
+            by_name = {}
+            for instance in self.instances:
+                by_name.setdefault(instance.instance_name, instance)
+            cached = self._by_name_cache = (tuple(self.instances), by_name)
+        return cached[1]
+
+    def _build_graph(self) -> Tuple[Dict[str, Set[str]], Dict[str, List[str]], List[str]]:
+        """Walk the connections once for both sorting and validation
+
+        Returns:
+            Tuple of (dependencies, dependents, errors):
+                dependencies: instance name -> names of the instances it depends on
+                dependents: instance name -> names of the instances depending on it
+                errors: messages for connections referencing unknown blocks or ports
+        """
+        metadata = self.metadata
+
+        # Build dependency graph: instance -> set of instances it depends on,
+        # and the reverse: instance -> instances that depend on it
         dependencies = {instance.instance_name: set() for instance in self.instances}
+        dependents = {}
+        errors = []
+
+        # Model-level ports (a connection may use either an input or an output)
+        port_names = {port.name for port in metadata.inputs}
+        port_names.update(port.name for port in metadata.outputs)
 
         for conn in self.connections:
-            # Skip connections from/to model inputs/outputs
-            if conn.is_from_input() or conn.is_to_output():
+            from_input = conn.is_from_input()
+            to_output = conn.is_to_output()
+
+            # Check source
+            if from_input:
+                if conn.source_port not in port_names:
+                    errors.append(f"Connection references unknown model port: {conn.source_port}")
+            elif conn.source_block not in dependencies:
+                errors.append(f"Connection references unknown source block: {conn.source_block}")
+
+            # Check target
+            if to_output:
+                if conn.target_port not in port_names:
+                    errors.append(f"Connection references unknown model port: {conn.target_port}")
+            elif conn.target_block not in dependencies:
+                errors.append(f"Connection references unknown target block: {conn.target_block}")
+
+            # Connections from/to model inputs/outputs add no dependency
+            if from_input or to_output:
                 continue
 
-            # target depends on source
-            if conn.target_block in dependencies:
-                dependencies[conn.target_block].add(conn.source_block)
+            # target depends on source; count each pair of blocks once
+            deps = dependencies.get(conn.target_block)
+            if deps is not None and conn.source_block not in deps:
+                deps.add(conn.source_block)
+                dependents.setdefault(conn.source_block, []).append(conn.target_block)
+
+        return dependencies, dependents, errors
+
+    def _sort_instances(self, graph: tuple) -> List[BlockInstance]:
+        """Kahn's topological sort behind get_computation_order()
+
+        Args:
+            graph: Result of _build_graph()
+
+        Returns:
+            List of BlockInstance in computation order
+
+        Raises:
+            ValueError: If circular dependency detected
+        """
+        dependencies, dependents, _ = graph
 
-        # Kahn's algorithm for topological sort
+        # Kahn's algorithm for topological sort; the heap always yields the
+        # smallest ready name, for deterministic output
         in_degree = {name: len(deps) for name, deps in dependencies.items()}
-        queue = [name for name, degree in in_degree.items() if degree == 0]
+        heap = [name for name, degree in in_degree.items() if degree == 0]
+        heapq.heapify(heap)
         result = []
 
-        while queue:
-            # Sort for deterministic output
-            queue.sort()
-            current = queue.pop(0)
+        while heap:
+            current = heapq.heappop(heap)
             result.append(current)
 
             # Reduce in-degree for dependents
-            for name, deps in dependencies.items():
-                if current in deps:
-                    in_degree[name] -= 1
-                    if in_degree[name] == 0:
-                        queue.append(name)
+            for name in dependents.get(current, ()):
+                in_degree[name] -= 1
+                if in_degree[name] == 0:
+                    heapq.heappush(heap, name)
 
         # Check for cycles
         if len(result) != len(self.instances):
@@ -344,7 +514,7 @@ class CDLModel:
             raise ValueError(f"Circular dependency detected involving: {remaining}")
 
         # Return instances in computed order
-        instance_map = {inst.instance_name: inst for inst in self.instances}
+        instance_map = self._instances_by_name()
         return [instance_map[name] for name in result]
 
     def validate(self) -> Tuple[bool, List[str]]:
@@ -359,48 +529,18 @@ class CDLModel:
         Returns:
             Tuple of (is_valid, list of error messages)
         """
-        errors = []
-
-        # Build set of valid instance names
-        instance_names = {inst.instance_name for inst in self.instances}
-        input_names = {port.name for port in self.metadata.inputs}
-        output_names = {port.name for port in self.metadata.outputs}
-
-        # Validate connections
-        for conn in self.connections:
-            # Check source
-            if not conn.is_from_input():
-                # Connection from instance block
-                if conn.source_block not in instance_names:
-                    errors.append(f"Connection references unknown source block: {conn.source_block}")
-            else:
-                # Connection from model-level port (could be input or output)
-                # Check if it's a valid model-level port (either input or output)
-                if conn.source_port not in input_names and conn.source_port not in output_names:
-                    errors.append(f"Connection references unknown model port: {conn.source_port}")
-
-            # Check target
-            if not conn.is_to_output():
-                # Connection to instance block
-                if conn.target_block not in instance_names:
-                    errors.append(f"Connection references unknown target block: {conn.target_block}")
-            else:
-                # Connection to model-level port (could be input or output)
-                # Check if it's a valid model-level port (either input or output)
-                if conn.target_port not in input_names and conn.target_port not in output_names:
-                    errors.append(f"Connection references unknown model port: {conn.target_port}")
+        # Connections referencing unknown blocks or ports, checked on every
+        # call; the same walk feeds the sort if it is not cached
+        graph = self._build_graph()
+        errors = list(graph[2])
 
         # Check for circular dependencies
-        try:
-            self.get_computation_order()
-        except ValueError as e:
-            errors.append(str(e))
+        order = self._cached_order(graph)
+        if isinstance(order, ValueError):
+            errors.append(str(order))
 
         return (len(errors) == 0, errors)
 
     def get_instance(self, name: str) -> Optional[BlockInstance]:
         """Get block instance by name"""
-        for instance in self.instances:
-            if instance.instance_name == name:
-                return instance
-        return None
+        return self._instances_by_name().get(name)
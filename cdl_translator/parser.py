@@ -25,6 +25,29 @@ from cdl_translator.model import (
     PortType,
 )
 
+# orjson parses large CXF graphs several times faster; fall back to the
+# standard library when it is not installed. Both take bytes and raise a
+# json.JSONDecodeError subclass for invalid input.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def read_cxf_json(path: Path) -> Any:
+    """Read and decode a CXF JSON file
+
+    Args:
+        path: Path to the CXF JSON file
+
+    Returns:
+        Decoded JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return _json_loads(Path(path).read_bytes())
+
 
 class CXFParser:
     """Parser for CXF JSON files
@@ -191,10 +214,7 @@ class CXFParser:
         if not path.exists():
             raise FileNotFoundError(f"CXF file not found: {cxf_path}")
 
-        with open(path, 'r') as f:
-            cxf_data = json.load(f)
-
-        return self.parse_dict(cxf_data)
+        return self.parse_dict(read_cxf_json(path))
 
     def parse_dict(self, cxf_data: Dict[str, Any]) -> CDLModel:
         """Parse CXF data from dictionary
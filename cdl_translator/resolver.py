@@ -3,12 +3,33 @@
 This module provides utilities to find CXF files for custom blocks.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
+
+# CXF file extensions, in order of preference
+_CXF_EXTS: Tuple[str, ...] = ('.jsonld', '.json')
+
+
+@lru_cache(maxsize=None)
+def _find_cxf_root(path: Path) -> Optional[Path]:
+    """Find the root CXF directory by walking up the tree from path"""
+    current = path
+    while current.parent != current:  # Stop at filesystem root
+        if current.name == 'cxf':
+            return current
+        current = current.parent
+    return None
 
 
 class CXFResolver:
-    """Resolves CXF file paths for custom blocks"""
+    """Resolves CXF file paths for custom blocks
+
+    Each directory tree that is searched recursively is walked once and
+    indexed by block name. The tree is walked again when a block is not in
+    its index or its indexed file is gone, so files added or removed later,
+    at any depth, are still found.
+    """
 
     def __init__(self, search_paths: Optional[List[Path]] = None):
         """Initialize resolver with optional search paths
@@ -16,7 +37,12 @@ class CXFResolver:
         Args:
             search_paths: Additional directories to search for CXF files
         """
-        self.search_paths = search_paths or []
+        # Resolved once here rather than on every lookup
+        self.search_paths = [Path(path).resolve() for path in search_paths or []]
+        # Same paths as a set, for constant-time duplicate checks
+        self._search_set = set(self.search_paths)
+        # Root directory -> block name -> CXF file, from the last walk
+        self._index_cache: Dict[Path, Dict[str, Path]] = {}
 
     def resolve(self, block_name: str, base_dir: Path) -> Optional[Path]:
         """Find CXF file for a custom block
@@ -30,18 +56,19 @@ class CXFResolver:
         Args:
             block_name: Simple name of the custom block (e.g., "SubController")
             base_dir: Directory of the file that references this block
+                (resolved first if relative)
 
         Returns:
             Path to CXF file if found, None otherwise
         """
-        # Normalize base directory
-        base_dir = Path(base_dir).resolve()
-
-        # Try different file extensions
-        extensions = ['.jsonld', '.json']
+        # Normalize base directory; the translator passes directories of
+        # already resolved files, which need no further system calls
+        base_dir = Path(base_dir)
+        if not base_dir.is_absolute():
+            base_dir = base_dir.resolve()
 
         # Search in base directory first (fast path)
-        for ext in extensions:
+        for ext in _CXF_EXTS:
             candidate = base_dir / f"{block_name}{ext}"
             if candidate.exists():
                 return candidate
@@ -50,14 +77,13 @@ class CXFResolver:
         # Start from the CXF root (find the top-level 'cxf' directory)
         cxf_root = self._find_cxf_root(base_dir)
         if cxf_root:
-            result = self._recursive_search(block_name, cxf_root, extensions)
+            result = self._find_in_tree(cxf_root, block_name)
             if result:
                 return result
 
         # Search in additional search paths (recursively)
         for search_path in self.search_paths:
-            search_path = Path(search_path).resolve()
-            result = self._recursive_search(block_name, search_path, extensions)
+            result = self._find_in_tree(search_path, block_name)
             if result:
                 return result
 
@@ -72,32 +98,48 @@ class CXFResolver:
         Returns:
             Path to CXF root directory, or None if not found
         """
-        current = path
-        while current.parent != current:  # Stop at filesystem root
-            if current.name == 'cxf':
-                return current
-            current = current.parent
-        return None
+        return _find_cxf_root(path)
 
-    def _recursive_search(self, block_name: str, root: Path, extensions: List[str]) -> Optional[Path]:
-        """Recursively search for a block in a directory tree
+    def _find_in_tree(self, root: Path, block_name: str) -> Optional[Path]:
+        """Find the CXF file of a block anywhere in a directory tree
+
+        Uses the tree's index while it holds an existing file for the block,
+        and walks the tree again otherwise, since files may have been added
+        or removed in any subdirectory since it was indexed.
 
         Args:
-            block_name: Block name to search for
-            root: Root directory to search from
-            extensions: File extensions to try
+            root: Root directory of the tree
+            block_name: Simple name of the custom block
 
         Returns:
             Path to CXF file if found, None otherwise
         """
-        # Use glob to search recursively for matching files
-        for ext in extensions:
-            pattern = f"**/{block_name}{ext}"
-            matches = list(root.glob(pattern))
-            if matches:
-                # Return the first match
-                return matches[0]
-        return None
+        index = self._index_cache.get(root)
+        if index is not None:
+            path = index.get(block_name)
+            if path is not None and path.exists():
+                return path
+        return self._index_root(root).get(block_name)
+
+    def _index_root(self, root: Path) -> Dict[str, Path]:
+        """Map block names to CXF files anywhere in a directory tree
+
+        Walks the tree and keeps the result for later lookups. A .jsonld file
+        takes precedence over a .json file of the same name, and otherwise
+        the first file found wins.
+
+        Args:
+            root: Root directory to index
+
+        Returns:
+            Dictionary from block name (file stem) to CXF file path
+        """
+        index: Dict[str, Path] = {}
+        for ext in _CXF_EXTS:
+            for path in root.rglob(f"*{ext}"):
+                index.setdefault(path.stem, path)
+        self._index_cache[root] = index
+        return index
 
     def add_search_path(self, path: Path):
         """Add a directory to the search paths
@@ -106,5 +148,6 @@ class CXFResolver:
             path: Directory to add to search paths
         """
         path = Path(path).resolve()
-        if path.is_dir() and path not in self.search_paths:
+        if path.is_dir() and path not in self._search_set:
             self.search_paths.append(path)
+            self._search_set.add(path)
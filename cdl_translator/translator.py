@@ -4,12 +4,14 @@ This module provides the main translator class that handles recursive
 translation of CDL models with custom blocks.
 """
 
-import json
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, List, Optional
+from typing import Any, Dict, Set, List, Optional, Tuple
 from collections import defaultdict
 
-from .parser import CXFParser
+from .parser import CXFParser, read_cxf_json
 from .codegen import CodeGenerator
 from .model import CDLModel, BlockInstance
 from .resolver import CXFResolver
@@ -18,11 +20,23 @@ from .resolver import CXFResolver
 class RecursiveTranslator:
     """Translates CDL models recursively, handling custom blocks"""
 
-    def __init__(self, search_paths: Optional[List[Path]] = None):
+    def __init__(
+        self,
+        search_paths: Optional[List[Path]] = None,
+        workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None
+    ):
         """Initialize translator
 
         Args:
             search_paths: Additional directories to search for custom block CXF files
+            workers: Maximum number of threads reading the CXF files of a
+                model's custom blocks, and writing the generated files,
+                concurrently (default: the ThreadPoolExecutor default;
+                1 reads and writes them one at a time)
+            cache_dir: Optional directory in which generated code is kept
+                between runs (e.g. output_dir / ".cdl_cache"); a block whose
+                parsed model is unchanged is then not generated again
         """
         self.parser = CXFParser()
         self.codegen = CodeGenerator()
@@ -34,8 +48,21 @@ class RecursiveTranslator:
         # Store generated code: block_name -> python_code
         self.generated_code: Dict[str, str] = {}
 
-        # Track dependency chain to detect circular dependencies
+        # Track dependency chain to detect circular dependencies; the set
+        # holds the same names for constant-time membership checks
         self.dependency_chain: List[str] = []
+        self._chain_set: Set[str] = set()
+
+        # Parsed models by CXF file, with the file's mtime_ns when parsed;
+        # kept across translations, so a file is parsed again only if it
+        # has changed since
+        self._parsed_models: Dict[Path, Tuple[int, CDLModel]] = {}
+
+        # Decoded CXF files read ahead of parsing, by CXF file
+        self.workers = workers
+        self._prefetched: Dict[Path, Any] = {}
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def translate_file(
         self,
@@ -64,13 +91,12 @@ class RecursiveTranslator:
         self.translated.clear()
         self.generated_code.clear()
         self.dependency_chain.clear()
+        self._chain_set.clear()
+        self._prefetched.clear()
 
         # Translate recursively
         base_dir = cxf_path.parent
-        with open(cxf_path, 'r') as f:
-            cxf_data = json.load(f)
-
-        model = self.parser.parse_dict(cxf_data)
+        model = self.load_model(cxf_path)
         self._translate_model_recursive(model, base_dir)
 
         # Write files if output directory specified
@@ -78,13 +104,32 @@ class RecursiveTranslator:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            for block_name, code in self.generated_code.items():
-                output_file = output_dir / f"{block_name}.py"
-                with open(output_file, 'w') as f:
-                    f.write(code)
+            self._write_files(output_dir)
 
         return self.generated_code
 
+    def _write_files(self, output_dir: Path) -> None:
+        """Write each generated module to output_dir/{block_name}.py
+
+        Several files are written concurrently by up to `workers` threads.
+
+        Args:
+            output_dir: Existing directory to write the files to
+        """
+        def write(item):
+            block_name, code = item
+            (output_dir / f"{block_name}.py").write_text(code)
+
+        items = list(self.generated_code.items())
+        if len(items) < 2 or self.workers == 1:
+            for item in items:
+                write(item)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # Consume the results so that write errors are raised here
+            list(executor.map(write, items))
+
     def _translate_model_recursive(self, model: CDLModel, base_dir: Path):
         """Recursively translate a model and its dependencies
 
@@ -98,7 +143,7 @@ class RecursiveTranslator:
         model_name = model.metadata.name
 
         # Check for circular dependency
-        if model_name in self.dependency_chain:
+        if model_name in self._chain_set:
             chain_str = ' -> '.join(self.dependency_chain + [model_name])
             raise ValueError(f"Circular dependency detected: {chain_str}")
 
@@ -108,20 +153,21 @@ class RecursiveTranslator:
 
         # Add to dependency chain
         self.dependency_chain.append(model_name)
+        self._chain_set.add(model_name)
 
         try:
             # Find all custom blocks used by this model
             custom_blocks = self._find_custom_blocks(model)
 
-            # Recursively translate custom block dependencies first
+            # Find the CXF files of the custom blocks not translated yet
+            pending: Dict[str, Path] = {}
             for custom_instance in custom_blocks:
                 block_name = custom_instance.get_custom_block_name()
 
                 # Skip if already translated
-                if block_name in self.translated:
+                if block_name in self.translated or block_name in pending:
                     continue
 
-                # Find CXF file for this custom block
                 cxf_path = self.resolver.resolve(block_name, base_dir)
 
                 if cxf_path is None:
@@ -131,11 +177,19 @@ class RecursiveTranslator:
                         f"Expected files: {block_name}.jsonld or {block_name}.json"
                     )
 
-                # Parse and translate recursively
-                with open(cxf_path, 'r') as f:
-                    custom_cxf_data = json.load(f)
+                pending[block_name] = cxf_path
+
+            # Read the files together; parsing and translation stay in order
+            self._prefetch(pending.values())
 
-                custom_model = self.parser.parse_dict(custom_cxf_data)
+            # Recursively translate custom block dependencies first
+            for block_name, cxf_path in pending.items():
+                # May have been translated as a dependency of an earlier block
+                if block_name in self.translated:
+                    continue
+
+                # Parse and translate recursively
+                custom_model = self.load_model(cxf_path)
                 custom_base_dir = cxf_path.parent
 
                 # Recursive call
@@ -152,6 +206,55 @@ class RecursiveTranslator:
         finally:
             # Remove from dependency chain
             self.dependency_chain.pop()
+            self._chain_set.discard(model_name)
+
+    def load_model(self, cxf_path: Path) -> CDLModel:
+        """Read and parse a CXF file, reusing the model if already parsed
+
+        The model is parsed again when the file's modification time has
+        changed since it was parsed.
+
+        Args:
+            cxf_path: Path to the CXF file
+
+        Returns:
+            Parsed CDL model
+        """
+        cxf_path = Path(cxf_path)
+        if not cxf_path.is_absolute():
+            cxf_path = cxf_path.resolve()
+
+        mtime = cxf_path.stat().st_mtime_ns
+        cached = self._parsed_models.get(cxf_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        cxf_data = self._prefetched.pop(cxf_path, None)
+        if cxf_data is None:
+            cxf_data = read_cxf_json(cxf_path)
+        model = self.parser.parse_dict(cxf_data)
+        self._parsed_models[cxf_path] = (mtime, model)
+        return model
+
+    def _prefetch(self, cxf_paths) -> None:
+        """Read and decode CXF files concurrently ahead of load_model()
+
+        Files already parsed or read are skipped. With fewer than two files
+        to read, or workers set to 1, nothing is done and load_model()
+        reads the file itself.
+
+        Args:
+            cxf_paths: Paths of the CXF files about to be loaded
+        """
+        paths = [path for path in cxf_paths
+                 if path not in self._parsed_models and path not in self._prefetched]
+        if len(paths) < 2 or self.workers == 1:
+            return
+
+        # The parser keeps state between calls, so only reading and JSON
+        # decoding (which need no parser) run in the threads
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            self._prefetched.update(zip(paths, executor.map(read_cxf_json, paths)))
 
     def _find_custom_blocks(self, model: CDLModel) -> List[BlockInstance]:
         """Find all custom block instances in a model
@@ -181,17 +284,41 @@ class RecursiveTranslator:
         # Get custom block names for imports
         custom_block_names = set(block.get_custom_block_name() for block in custom_blocks)
 
-        # Generate code using modified code generator
-        # We need to pass custom block information
+        if self.cache_dir is None:
+            # Generate code using modified code generator
+            # We need to pass custom block information
+            return self.codegen.generate(model, custom_imports=custom_block_names)
+
+        # The code depends only on the model, the custom block names and
+        # the code generator itself
+        digest = hashlib.blake2b(self.codegen.fingerprint(), digest_size=16)
+        digest.update(repr(model).encode())
+        digest.update(repr(sorted(custom_block_names)).encode())
+        cache_file = self.cache_dir / f"{model.metadata.name}-{digest.hexdigest()}.py"
+
+        try:
+            return cache_file.read_text()
+        except FileNotFoundError:
+            pass
+
         code = self.codegen.generate(model, custom_imports=custom_block_names)
 
+        # Write to a temporary file first, so other translations never see
+        # a partly written entry
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        temp_file.write_text(code)
+        temp_file.replace(cache_file)
+
         return code
 
 
 def translate_cxf(
     cxf_path: Path,
     output_dir: Optional[Path] = None,
-    search_paths: Optional[List[Path]] = None
+    search_paths: Optional[List[Path]] = None,
+    workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None
 ) -> Dict[str, str]:
     """Translate a CXF file to Python code
 
@@ -203,6 +330,10 @@ def translate_cxf(
         cxf_path: Path to the main CXF file
         output_dir: Optional directory to write generated files
         search_paths: Additional directories to search for custom blocks
+        workers: Maximum number of threads reading custom block CXF files
+            and writing generated files (see RecursiveTranslator)
+        cache_dir: Optional directory keeping generated code between runs
+            (see RecursiveTranslator)
 
     Returns:
         Dictionary mapping block names to generated Python code
@@ -216,7 +347,7 @@ def translate_cxf(
         >>> generated = translate_cxf('MyController.jsonld', output_dir='generated/')
         >>> # Creates: generated/SubController.py, generated/MyController.py
     """
-    translator = RecursiveTranslator(search_paths)
+    translator = RecursiveTranslator(search_paths, workers, cache_dir)
     return translator.translate_file(cxf_path, output_dir)
 
 
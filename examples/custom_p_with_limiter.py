@@ -25,6 +25,8 @@ Note: This example requires the cdl_python package to be installed.
       Install with: pip install -e .
 """
 
+import numpy as np
+
 from cdl_python.CDL.Reals import MultiplyByParameter, Min
 
 
@@ -45,23 +47,48 @@ class CustomPWithLimiter:
         y (float): Control signal = min(yMax, k * e)
     """
 
-    def __init__(self, k=2.0):
+    def __init__(self, k=2.0, debug=False):
         """
         Initialize the P controller with limiter.
 
         Args:
             k: Constant gain (default: 2.0)
+            debug: Evaluate compute() through the gain and minValue blocks,
+                so their outputs can be inspected (default: False)
         """
         self.k = k
+        # Gain as used by the blocks below, which fix it at construction
+        self._k = float(k)
 
         # Instantiate CDL blocks (matches Modelica model structure)
         self.gain = MultiplyByParameter(k=self.k)  # Multiply error by gain
         self.min_value = Min()  # Take minimum of two inputs
 
+        if debug:
+            self.compute = self.compute_blocks
+
     def compute(self, e, yMax):
         """
         Compute the control output.
 
+        Evaluates the gain and minValue blocks as one expression, without
+        calling them; compute_blocks() gives the same result through them.
+
+        Args:
+            e: Control error
+            yMax: Maximum value of output signal
+
+        Returns:
+            dict: {'y': control signal output}
+        """
+        # y = min(yMax, k*e)
+        ke = self._k * e
+        return {'y': ke if ke < yMax else yMax}
+
+    def compute_blocks(self, e, yMax):
+        """
+        Compute the control output by connecting the CDL blocks.
+
         Args:
             e: Control error
             yMax: Maximum value of output signal
@@ -79,6 +106,20 @@ class CustomPWithLimiter:
         # minValue.y → y
         return {'y': min_output['y']}
 
+    def compute_batch(self, e, yMax):
+        """
+        Compute the control output for a whole series of inputs at once.
+
+        Args:
+            e: Control errors (array)
+            yMax: Maximum values of output signal (array, or one value for all)
+
+        Returns:
+            dict: {'y': array of control signal outputs}
+        """
+        # gain and minValue evaluated in one NumPy expression
+        return {'y': np.minimum(yMax, self._k * np.asarray(e, dtype=np.float64))}
+
 
 def main():
     """Example usage of CustomPWithLimiter"""
@@ -140,13 +181,13 @@ def main():
     print("-" * 60)
 
     # Simulate approaching setpoint
-    measured_values = [0.0, 5.0, 10.0, 15.0, 18.0, 19.0, 19.5, 20.0]
+    measured_values = np.array([0.0, 5.0, 10.0, 15.0, 18.0, 19.0, 19.5, 20.0])
 
-    for t, measured in enumerate(measured_values):
-        error = setpoint - measured  # Control error
-        result = controller.compute(e=error, yMax=yMax)
-        output = result['y']
+    # Compute the whole series in one call
+    errors = setpoint - measured_values  # Control error
+    outputs = controller.compute_batch(e=errors, yMax=yMax)['y']
 
+    for t, (measured, error, output) in enumerate(zip(measured_values, errors, outputs)):
         print(f"{t:<8} {measured:<12.1f} {error:<12.1f} {output:<12.2f}")
 
     print("-" * 60)
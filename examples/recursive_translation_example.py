@@ -37,8 +37,8 @@ Simple Model Structure:
 
 from pathlib import Path
 from cdl_translator.translator import translate_cxf, RecursiveTranslator
+from cdl_translator.parser import CXFParser
 import sys
-import json
 
 # Example 1: Unified translation (handles both simple and complex models)
 print("=" * 70)
@@ -173,14 +173,9 @@ print("Example 5: Model Structure Analysis")
 print("=" * 70)
 print()
 
-from cdl_translator.parser import CXFParser
-
-# Parse and analyze MyController
-with open(fixtures_dir / "MyController.jsonld", 'r') as f:
-    data = json.load(f)
-
-parser = CXFParser()
-model = parser.parse_dict(data)
+# Analyze MyController; the translator from Example 4 has already parsed
+# it and returns the same model without reading the file again
+model = translator.load_model(fixtures_dir / "MyController.jsonld")
 
 print("MyController Model Structure:")
 print()
@@ -6,13 +6,40 @@ Installation:
 
 For development:
     pip install -e ".[dev]"
+
+Compiled Reals blocks and SunRiseSet (optional, requires Cython and a C compiler):
+    CDL_PYTHON_CYTHONIZE=1 pip install -e .
 """
 
+import os
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the Reals blocks and SunRiseSet with Cython in pure-Python mode.
+# The .py sources are unchanged and remain the fallback when not compiled.
+# Annotations are not used as C types, nor to infer them, so the compiled
+# modules accept the same inputs (e.g. numpy arrays where a float, int or list
+# is annotated).
+ext_modules = []
+if os.environ.get("CDL_PYTHON_CYTHONIZE"):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            "cdl_python/CDL/Reals/*.py",
+            "cdl_python/CDL/Reals/Sources/*.py",
+            "cdl_python/CDL/Utilities/SunRiseSet.py",
+        ],
+        exclude=["cdl_python/CDL/Reals/__init__.py", "cdl_python/CDL/Reals/Sources/__init__.py"],
+        compiler_directives={
+            "language_level": 3,
+            "annotation_typing": False,
+            "infer_types": False,
+        },
+    )
+
 setup(
     name="cdl_python",
     version="0.1.0",
@@ -22,6 +49,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/CDLPython",
     packages=find_packages(exclude=["tests", "tests.*", "examples", "examples.*"]),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -43,6 +71,12 @@ setup(
             "pytest>=7.0",
             "pytest-cov>=3.0",
         ],
+        "compiled": [
+            "cython>=3.0",
+        ],
+        "fast": [
+            "orjson>=3.0",
+        ],
         "docs": [
             "sphinx>=5.0",
             "sphinx-rtd-theme>=1.0",
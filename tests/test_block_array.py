@@ -0,0 +1,90 @@
+# ABOUTME: Unit tests for BlockArray blocks (GreaterArray, LimiterArray, LogArray).
+# ABOUTME: Verifies array evaluation matches the equivalent scalar blocks element by element.
+
+import pytest
+import numpy as np
+from cdl_python.CDL.Reals import Greater, GreaterArray, Limiter, LimiterArray, Log, LogArray
+
+
+class TestGreaterArray:
+    """Tests for GreaterArray block"""
+
+    def test_matches_scalar_blocks(self):
+        """Test GreaterArray matches n independent Greater blocks"""
+        h = [0.0, 0.5, 1.0]
+        scalars = [Greater(h=hi) for hi in h]
+        array = GreaterArray(n=3, h=h)
+
+        u2 = np.zeros(3)
+        for u in [1.0, 0.2, -0.3, -0.7, -1.2, 0.1, 0.4]:
+            u1 = np.full(3, u)
+            result = array.compute(u1=u1, u2=u2)
+            expected = [b.compute(u1=u, u2=0.0)['y'] for b in scalars]
+            assert result['y'].tolist() == expected
+
+    def test_pre_y_start_per_block(self):
+        """Test per-block initial outputs"""
+        array = GreaterArray(n=2, h=1.0, pre_y_start=[True, False])
+        result = array.compute(u1=[-0.5, -0.5], u2=[0.0, 0.0])
+        assert result['y'].tolist() == [True, False]
+
+    def test_reset_state(self):
+        """Test reset restores initial outputs"""
+        array = GreaterArray(n=2, h=1.0)
+        array.compute(u1=[1.0, 1.0], u2=[0.0, 0.0])
+        array.reset_state()
+        result = array.compute(u1=[-0.5, -0.5], u2=[0.0, 0.0])
+        assert result['y'].tolist() == [False, False]
+
+    def test_negative_hysteresis_raises(self):
+        """Test negative hysteresis raises error"""
+        with pytest.raises(ValueError):
+            GreaterArray(n=2, h=[0.0, -1.0])
+
+    def test_wrong_input_length_raises(self):
+        """Test inputs of the wrong length raise error"""
+        array = GreaterArray(n=3)
+        with pytest.raises(ValueError):
+            array.compute(u1=[1.0, 2.0], u2=[0.0, 0.0])
+
+
+class TestLimiterArray:
+    """Tests for LimiterArray block"""
+
+    def test_matches_scalar_blocks(self):
+        """Test LimiterArray matches n independent Limiter blocks"""
+        uMax = [1.0, 2.0, 3.0]
+        uMin = [-1.0, 0.0, 2.5]
+        array = LimiterArray(n=3, uMax=uMax, uMin=uMin)
+        u = np.array([5.0, -5.0, 2.7])
+
+        result = array.compute(u=u)
+        expected = [Limiter(uMax=hi, uMin=lo).compute(u=ui)['y']
+                    for hi, lo, ui in zip(uMax, uMin, u)]
+        assert np.allclose(result['y'], expected)
+
+    def test_invalid_limits_raise(self):
+        """Test uMin >= uMax raises error"""
+        with pytest.raises(ValueError):
+            LimiterArray(n=2, uMax=[1.0, 0.0], uMin=0.0)
+
+    def test_wrong_parameter_length_raises(self):
+        """Test parameters of the wrong length raise error"""
+        with pytest.raises(ValueError):
+            LimiterArray(n=3, uMax=[1.0, 2.0], uMin=0.0)
+
+
+class TestLogArray:
+    """Tests for LogArray block"""
+
+    def test_matches_scalar_blocks(self):
+        """Test LogArray matches n independent Log blocks"""
+        u = np.array([0.5, 1.0, np.e, 10.0])
+        result = LogArray(n=4).compute(u=u)
+        expected = [Log().compute(u=ui)['y'] for ui in u]
+        assert np.allclose(result['y'], expected)
+
+    def test_non_positive_input_raises(self):
+        """Test non-positive input raises error"""
+        with pytest.raises(ValueError):
+            LogArray(n=2).compute(u=[1.0, 0.0])
@@ -0,0 +1,26 @@
+# ABOUTME: Checks that the opt-in Cython build is the one imported when requested.
+# ABOUTME: Runs only with CDL_PYTHON_CYTHONIZE set, after building the extensions in place.
+
+import importlib
+import importlib.machinery
+import os
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("CDL_PYTHON_CYTHONIZE"),
+    reason="CDL_PYTHON_CYTHONIZE not set; testing the pure-Python install",
+)
+
+
+class TestCompiledBuild:
+    """Tests for the compiled Reals blocks and SunRiseSet"""
+
+    @pytest.mark.parametrize("module", [
+        "cdl_python.CDL.Reals.Add",
+        "cdl_python.CDL.Reals.Sources.TimeTable",
+        "cdl_python.CDL.Utilities.SunRiseSet",
+    ])
+    def test_module_is_extension(self, module):
+        """Test the compiled extension is imported instead of the .py source"""
+        path = importlib.import_module(module).__file__
+        assert path.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
@@ -1,6 +1,7 @@
 # ABOUTME: Test suite for Discrete blocks
 # ABOUTME: Tests sampling, delay, and triggered operations
 import pytest
+import numpy as np
 from cdl_python.time_manager import TimeManager, ExecutionMode
 from cdl_python.CDL.Discrete import (
     Sampler,
@@ -52,6 +53,23 @@ class TestUnitDelay:
         result = delay.compute(u=10.0)
         assert result['y'] == -5.0
 
+    def test_compute_sequence_matches_compute(self):
+        """compute_sequence matches step-by-step compute and keeps the state"""
+        delay = UnitDelay(y_start=-1.0)
+        result = delay.compute_sequence(np.array([1.0, 2.0, 3.0]))
+        assert result['y'].tolist() == [-1.0, 1.0, 2.0]
+        assert delay.compute(u=4.0)['y'] == 3.0
+        assert delay.compute_sequence([5.0])['y'].tolist() == [4.0]
+
+    def test_compute_raw_and_output_dict_reused(self):
+        """compute_raw returns the value; compute reuses its dictionary"""
+        delay = UnitDelay(y_start=0.0)
+        assert delay.compute_raw(1.0) == 0.0
+        first = delay.compute(u=2.0)
+        second = delay.compute(u=3.0)
+        assert first is second
+        assert second['y'] == 2.0
+
 
 # =====================================================
 # ZeroOrderHold Tests
@@ -107,6 +125,41 @@ class TestZeroOrderHold:
         result = zoh.compute(u=20.0)
         assert result['y'] == 20.0
 
+    def test_compute_raw_passes_through_before_start(self):
+        """compute_raw returns the input until the first sample"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        zoh = ZeroOrderHold(time_manager=tm, samplePeriod=1.0, startTime=2.0)
+        assert zoh.compute_raw(7.0) == 7.0
+        tm.advance(dt=2.0)
+        assert zoh.compute_raw(8.0) == 8.0
+        tm.advance(dt=0.5)
+        assert zoh.compute_raw(9.0) == 8.0
+
+    def test_compute_sequence_matches_compute(self):
+        """compute_sequence gives the outputs of one compute per time step"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        zoh = ZeroOrderHold(time_manager=tm, samplePeriod=0.5, startTime=0.3)
+        u = np.arange(20, dtype=float)
+
+        times, expected = [], []
+        for value in u:
+            times.append(tm.get_time())
+            expected.append(zoh.compute(u=value)['y'])
+            tm.advance()
+
+        seq = ZeroOrderHold(time_manager=tm, samplePeriod=0.5, startTime=0.3)
+        y = np.concatenate([seq.compute_sequence(u[:7], times[:7])['y'],
+                            seq.compute_sequence(u[7:], times[7:])['y']])
+        assert y.tolist() == expected
+        assert seq._next_sample_time == zoh._next_sample_time
+
+    def test_compute_sequence_rejects_decreasing_times(self):
+        """Times must not go backwards"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        zoh = ZeroOrderHold(time_manager=tm, samplePeriod=1.0)
+        with pytest.raises(ValueError, match="non-decreasing"):
+            zoh.compute_sequence([1.0, 2.0], [1.0, 0.5])
+
     def test_invalid_sample_period(self):
         """Should raise error for non-positive samplePeriod"""
         tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
@@ -140,6 +193,14 @@ class TestSampler:
         result = sampler.compute(u=3.0)
         assert result['y'] == 3.0
 
+    def test_compute_sequence_samples_first_call(self):
+        """compute_sequence samples on the first call even before startTime"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.5)
+        sampler = Sampler(time_manager=tm, samplePeriod=1.0, startTime=1.0)
+        result = sampler.compute_sequence([1.0, 2.0, 3.0, 4.0, 5.0],
+                                          [0.0, 0.5, 1.0, 1.5, 2.0])
+        assert result['y'].tolist() == [1.0, 1.0, 3.0, 3.0, 5.0]
+
     def test_behaves_like_zero_order_hold(self):
         """Sampler should behave identically to ZeroOrderHold"""
         tm1 = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
@@ -312,6 +373,21 @@ class TestTriggeredMax:
         result = tmax.compute(u=-20.0, trigger=False)
         assert result['y'] == -5.0
 
+    def test_compute_sequence_matches_compute(self):
+        """compute_sequence should match repeated compute, keeping state"""
+        u = np.array([10.0, 20.0, 15.0, 5.0, 8.0, 3.0, 30.0, 1.0])
+        trigger = np.array([False, False, False, True, False, True, True, False])
+
+        scalar = TriggeredMax()
+        expected = [scalar.compute(u=x, trigger=t)['y'] for x, t in zip(u, trigger)]
+
+        tmax = TriggeredMax()
+        first = tmax.compute_sequence(u[:5], trigger[:5])['y']
+        second = tmax.compute_sequence(u[5:], trigger[5:])['y']
+        assert np.concatenate((first, second)).tolist() == expected
+        assert first.tolist() == [10.0, 20.0, 20.0, 5.0, 8.0]
+        assert tmax.compute(u=0.0, trigger=False)['y'] == 30.0
+
 
 # =====================================================
 # TriggeredMovingMean Tests
@@ -2,6 +2,7 @@
 # ABOUTME: Tests stateful block behavior, time management integration, and reset functionality.
 
 import pytest
+import numpy as np
 from cdl_python.CDL.Reals.IntegratorWithReset import IntegratorWithReset
 from cdl_python.time_manager import TimeManager, ExecutionMode
 
@@ -143,3 +144,31 @@ class TestIntegratorWithReset:
 
         with pytest.raises(RuntimeError, match="requires a TimeManager"):
             integrator.compute(u=1.0, trigger=False, y_reset_in=0.0)
+
+    def test_compute_sequence_matches_compute(self):
+        """Test compute_sequence matches repeated compute, keeping state"""
+        u = np.array([2.0, 2.0, 2.0, 2.0, 2.0, -1.0, 3.0])
+        trigger = np.array([False, False, False, True, True, False, True])
+        y_reset_in = np.array([0.0, 0.0, 0.0, 10.0, 7.0, 0.0, -4.0])
+
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        scalar = IntegratorWithReset(time_manager=tm, k=0.5, y_start=1.0)
+        t, expected = [], []
+        for i in range(u.size):
+            t.append(tm.get_time())
+            expected.append(scalar.compute(u=u[i], trigger=trigger[i], y_reset_in=y_reset_in[i])['y'])
+            tm.advance()
+
+        integrator = IntegratorWithReset(k=0.5, y_start=1.0)
+        first = integrator.compute_sequence(u[:4], t[:4], trigger[:4], y_reset_in[:4])['y']
+        second = integrator.compute_sequence(u[4:], t[4:], trigger[4:], y_reset_in[4:])['y']
+        assert np.concatenate((first, second)).tolist() == expected
+        assert first[3] == 10.0
+        assert integrator.get_state() == scalar.get_state()
+
+    def test_compute_sequence_scalar_reset_value(self):
+        """Test compute_sequence accepts a single reset value for all calls"""
+        integrator = IntegratorWithReset(y_start=5.0)
+        result = integrator.compute_sequence([1.0, 1.0, 1.0], [0.0, 1.0, 2.0],
+                                             [False, True, False], 0.0)
+        assert result['y'].tolist() == [5.0, 0.0, 1.0]
@@ -1,8 +1,11 @@
-# ABOUTME: Test suite for additional real blocks (Hysteresis, Sort, Line, MatrixGain, etc.)
+# ABOUTME: Test suite for additional real blocks (Hysteresis, Sort, Line, MatrixGain, Round, Sin, Sqrt, Switch, fused blocks, etc.)
 # ABOUTME: Tests real-valued operations including sorting, interpolation, and matrix operations
 import pytest
 import numpy as np
-from cdl_python.CDL.Reals import Hysteresis, Sort, Line, MatrixGain, MatrixMax, MatrixMin
+from cdl_python.CDL.Reals import (
+    Hysteresis, Sort, Line, Limiter, MatrixGain, MatrixMax, MatrixMin, MultiSum, Round, Sin,
+    Sqrt, Switch, Subtract, Tan
+)
 
 
 class TestHysteresis:
@@ -55,6 +58,34 @@ class TestSort:
         expected = [4.0, 3.0, 1.5, 1.0]
         assert np.allclose(result['y'], expected)
 
+    def test_sort_array_input(self):
+        """Test Sort accepts a NumPy array and returns lists"""
+        sort_block = Sort(ascending=False)
+        result = sort_block.compute(u=np.array([3.0, 1.0, 4.0, 1.5]))
+        assert result['y'] == [4.0, 3.0, 1.5, 1.0]
+        assert result['yIdx'] == [3, 1, 4, 2]
+
+    def test_sort_top_k(self):
+        """Test Sort with k outputs only the k leading elements"""
+        u = [3.0, 1.0, 4.0, 1.5, 9.0, 2.0]
+        result = Sort(ascending=True, k=2).compute(u=u)
+        assert result['y'] == [1.0, 1.5]
+        assert result['yIdx'] == [2, 4]
+
+        result = Sort(ascending=False, k=3).compute(u=u)
+        assert result['y'] == [9.0, 4.0, 3.0]
+        assert result['yIdx'] == [5, 3, 1]
+
+    def test_sort_k_at_least_length(self):
+        """Test Sort with k >= len(u) sorts the whole vector"""
+        result = Sort(k=10).compute(u=[2.0, 1.0])
+        assert result['y'] == [1.0, 2.0]
+
+    def test_sort_invalid_k_raises(self):
+        """Test Sort rejects k < 1"""
+        with pytest.raises(ValueError):
+            Sort(k=0)
+
     def test_sort_empty(self):
         """Test Sort with empty input"""
         sort_block = Sort()
@@ -94,6 +125,78 @@ class TestLine:
         assert result['y'] == pytest.approx(10.0)
 
 
+class TestFusedLineLimiter:
+    """Test the Limiter-Line fused block"""
+
+    def test_matches_limiter_then_line(self):
+        """Test fused block matches a Limiter feeding a Line"""
+        line = Line(limitBelow=True, limitAbove=True)
+        limiter = Limiter(uMax=6.0, uMin=-1.0)
+        fused = line.fuse_with_limiter(uMin=-1.0, uMax=6.0)
+        for u in [-5.0, 0.0, 1.5, 4.0, 7.0, 12.0]:
+            expected = line.compute(x1=1.0, f1=2.0, x2=8.0, f2=16.0,
+                                    u=limiter.compute(u=u)['y'])
+            result = fused.compute(x1=1.0, f1=2.0, x2=8.0, f2=16.0, u=u)
+            assert result['y'] == pytest.approx(expected['y'])
+
+    def test_disjoint_limits(self):
+        """Test limiter range entirely below the line range"""
+        fused = Line().fuse_with_limiter(uMin=-3.0, uMax=-2.0)
+        result = fused.compute(x1=0.0, f1=1.0, x2=10.0, f2=21.0, u=5.0)
+        # Limiter gives -2.0, line then limits to x1 = 0.0
+        assert result['y'] == pytest.approx(1.0)
+
+    def test_compute_batch(self):
+        """Test fused block over arrays"""
+        fused = Line(limitBelow=False, limitAbove=True).fuse_with_limiter(uMin=0.0, uMax=4.0)
+        u = np.array([-2.0, 1.0, 3.0, 9.0])
+        result = fused.compute_batch(x1=0.0, f1=0.0, x2=2.0, f2=4.0, u=u)
+        assert np.allclose(result['y'], [0.0, 2.0, 4.0, 4.0])
+
+    def test_compute_batch_scalar_inputs(self):
+        """Test fused block over scalar inputs and scalar u with array points"""
+        fused = Line(limitBelow=False, limitAbove=False).fuse_with_limiter(uMin=0.0, uMax=4.0)
+        result = fused.compute_batch(0.0, 0.0, 1.0, 2.0, 0.5)
+        assert result['y'] == pytest.approx(1.0)
+        result = fused.compute_batch(np.array([0.0, 1.0]), 0.0, 2.0, 4.0, 1.5)
+        assert np.allclose(result['y'], [3.0, 2.0])
+
+    def test_compute_batch_int_inputs(self):
+        """Test fused block over integer inputs and integer limits"""
+        fused = Line(limitBelow=False, limitAbove=False).fuse_with_limiter(uMin=0, uMax=4)
+        result = fused.compute_batch(0.0, 0.0, 2.0, 1.0, np.array([-1, 1, 3, 6]))
+        assert np.allclose(result['y'], [0.0, 0.5, 1.5, 2.0])
+
+
+class TestFusedSubtractSqrtTan:
+    """Test the Subtract-Sqrt-Tan fused block"""
+
+    def test_matches_subtract_sqrt_tan(self):
+        """Test fused block matches a Subtract feeding a Sqrt feeding a Tan"""
+        subtract = Subtract()
+        sqrt = Sqrt()
+        tan = Tan()
+        fused = subtract.fuse_with_sqrt_tan()
+        for u1, u2 in [(1.0, 1.0), (2.0, 0.5), (3.0, -1.0)]:
+            expected = tan.compute(u=sqrt.compute(u=subtract.compute(u1=u1, u2=u2)['y'])['y'])
+            assert fused.compute(u1=u1, u2=u2)['y'] == expected['y']
+
+    def test_negative_difference_raises(self):
+        """Test that a negative difference raises error"""
+        fused = Subtract().fuse_with_sqrt_tan()
+        with pytest.raises(ValueError):
+            fused.compute(u1=1.0, u2=2.0)
+        with pytest.raises(ValueError):
+            fused.compute_batch(np.array([1.0, 1.0]), np.array([0.0, 2.0]))
+
+    def test_compute_batch(self):
+        """Test fused block over arrays"""
+        fused = Subtract().fuse_with_sqrt_tan()
+        u1 = np.array([1.0, 2.0, 4.0])
+        expected = [fused.compute_raw(a, 0.5) for a in u1]
+        assert np.allclose(fused.compute_batch(u1, 0.5)['y'], expected)
+
+
 class TestMatrixGain:
     """Test the MatrixGain block"""
 
@@ -133,6 +236,13 @@ class TestMatrixMax:
         result = mm.compute(u=[1.0, 5.0, 3.0, 9.0, 2.0])
         assert result['y'] == 9.0
 
+    def test_matrix_max_ndarray(self):
+        """Test MatrixMax with a NumPy array input"""
+        mm = MatrixMax()
+        result = mm.compute(u=np.array([1.0, 5.0, 3.0, 9.0, 2.0]))
+        assert result['y'] == 9.0
+        assert isinstance(result['y'], float)
+
     def test_matrix_max_negative(self):
         """Test MatrixMax with negative values"""
         mm = MatrixMax()
@@ -155,6 +265,13 @@ class TestMatrixMin:
         result = mm.compute(u=[5.0, 1.0, 9.0, 3.0, 2.0])
         assert result['y'] == 1.0
 
+    def test_matrix_min_ndarray(self):
+        """Test MatrixMin with a NumPy array input"""
+        mm = MatrixMin()
+        result = mm.compute(u=np.array([5.0, 1.0, 9.0, 3.0, 2.0]))
+        assert result['y'] == 1.0
+        assert isinstance(result['y'], float)
+
     def test_matrix_min_negative(self):
         """Test MatrixMin with negative values"""
         mm = MatrixMin()
@@ -166,3 +283,135 @@ class TestMatrixMin:
         mm = MatrixMin()
         result = mm.compute(u=[42.0])
         assert result['y'] == 42.0
+
+
+class TestMultiSum:
+    """Test the real-valued MultiSum block"""
+
+    def test_multisum_weighted(self):
+        """Test weighted sum of a list input"""
+        ms = MultiSum(nin=3, k=[0.5, -1.0, 2.0])
+        result = ms.compute(u=[4.0, 1.5, 0.25])
+        assert result['y'] == pytest.approx(0.5 * 4.0 - 1.5 + 2.0 * 0.25)
+
+    def test_multisum_ndarray(self):
+        """Test weighted sum of a NumPy array input"""
+        ms = MultiSum(nin=4)
+        result = ms.compute(u=np.arange(4.0))
+        assert result['y'] == pytest.approx(6.0)
+
+    def test_multisum_exact(self):
+        """Test exact summation does not lose small terms to cancellation"""
+        u = [1e16, 1.0, -1e16, 1.0]
+        assert MultiSum(nin=4, exact=True).compute(u=u)['y'] == 2.0
+        assert MultiSum(nin=4, k=[0.5] * 4, exact=True).compute(u=u)['y'] == 1.0
+
+    def test_multisum_wrong_length_raises(self):
+        """Test input length must match nin"""
+        ms = MultiSum(nin=2)
+        with pytest.raises(ValueError):
+            ms.compute(u=[1.0, 2.0, 3.0])
+
+
+class TestRound:
+    """Test the Round block"""
+
+    def test_round_half_away_from_zero(self):
+        """Test halves round away from zero for both signs"""
+        block = Round(n=0)
+        assert block.compute(u=2.5)['y'] == 3.0
+        assert block.compute(u=-2.5)['y'] == -3.0
+        assert block.compute(u=2.3)['y'] == 2.0
+        assert block.compute(u=-2.3)['y'] == -2.0
+
+    def test_round_zero(self):
+        """Test zero rounds to zero"""
+        block = Round(n=2)
+        assert block.compute(u=0.0)['y'] == 0.0
+        assert block.compute(u=-0.0)['y'] == 0.0
+
+    def test_round_to_digits(self):
+        """Test rounding to decimal places and to multiples of ten"""
+        assert Round(n=1).compute(u=2.34)['y'] == 2.3
+        assert Round(n=1).compute(u=-2.36)['y'] == -2.4
+        assert Round(n=-1).compute(u=149.0)['y'] == 150.0
+        assert Round(n=-1).compute(u=-144.0)['y'] == -140.0
+
+    def test_compute_batch_matches_scalar(self):
+        """Test compute_batch matches compute element by element"""
+        u = np.array([-2.5, -2.3, -0.5, 0.0, 0.5, 1.25, 2.5, 149.0])
+        for n in [-1, 0, 1]:
+            block = Round(n=n)
+            expected = [block.compute(u=ui)['y'] for ui in u]
+            assert block.compute_batch(u)['y'].tolist() == expected
+
+
+class TestSin:
+    """Test the Sin block"""
+
+    def test_sin(self):
+        """Test sine of input in radians"""
+        block = Sin()
+        assert block.compute(u=0.0)['y'] == 0.0
+        assert block.compute(u=np.pi / 2)['y'] == pytest.approx(1.0)
+
+    def test_compute_batch_matches_scalar(self):
+        """Test compute_batch matches compute element by element"""
+        block = Sin()
+        u = np.linspace(-4.0, 4.0, 17)
+        expected = [block.compute(u=ui)['y'] for ui in u]
+        assert np.allclose(block.compute_batch(u)['y'], expected)
+
+
+class TestSqrt:
+    """Test the Sqrt block"""
+
+    def test_sqrt(self):
+        """Test square root of a non-negative input"""
+        block = Sqrt()
+        assert block.compute(u=4.0)['y'] == 2.0
+        assert block.compute_raw(0.0) == 0.0
+
+    def test_negative_input_raises(self):
+        """Test that a negative input raises error"""
+        block = Sqrt()
+        with pytest.raises(ValueError):
+            block.compute(u=-1.0)
+
+    def test_compute_batch(self):
+        """Test compute_batch matches compute and rejects negative inputs"""
+        block = Sqrt()
+        u = np.array([0.0, 0.25, 2.0, 9.0])
+        expected = [block.compute(u=ui)['y'] for ui in u]
+        assert block.compute_batch(u)['y'].tolist() == expected
+        with pytest.raises(ValueError):
+            block.compute_batch(np.array([1.0, -1.0]))
+
+    def test_unchecked(self):
+        """Test unchecked mode matches checked results and gives NaN in batches"""
+        block = Sqrt(checked=False)
+        assert block.compute(u=4.0)['y'] == 2.0
+        assert block.compute_raw(9.0) == 3.0
+        with pytest.raises(ValueError):
+            block.compute(u=-1.0)
+        y = block.compute_batch(np.array([4.0, -1.0]))['y']
+        assert y[0] == 2.0
+        assert np.isnan(y[1])
+
+
+class TestSwitch:
+    """Test the Reals Switch block"""
+
+    def test_switch(self):
+        """Test Switch selects u1 when u2 is true, else u3"""
+        block = Switch()
+        assert block.compute(u1=1.0, u2=True, u3=2.0)['y'] == 1.0
+        assert block.compute_raw(1.0, False, 2.0) == 2.0
+
+    def test_compute_batch(self):
+        """Test compute_batch matches compute and broadcasts a constant input"""
+        block = Switch()
+        u1 = np.array([1.0, 2.0, 3.0, 4.0])
+        u2 = np.array([True, False, False, True])
+        expected = [block.compute(u1=a, u2=b, u3=0.5)['y'] for a, b in zip(u1, u2)]
+        assert block.compute_batch(u1, u2, 0.5)['y'].tolist() == expected
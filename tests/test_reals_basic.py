@@ -1,11 +1,35 @@
 # ABOUTME: Unit tests for basic real-valued CDL blocks.
-# ABOUTME: Tests arithmetic operations (Add, Subtract, Multiply, Divide).
+# ABOUTME: Tests arithmetic operations (Add, Subtract, Multiply, Divide, Modulo).
 
 import pytest
+import numpy as np
 from cdl_python.CDL.Reals.Add import Add
 from cdl_python.CDL.Reals.Subtract import Subtract
 from cdl_python.CDL.Reals.Multiply import Multiply
+from cdl_python.CDL.Reals.MultiplyByParameter import MultiplyByParameter
 from cdl_python.CDL.Reals.Divide import Divide
+from cdl_python.CDL.Reals.Modulo import Modulo
+from cdl_python.CDL.Reals import (
+    Greater, IntegratorWithReset, LimitSlewRate, Limiter, Line, Log, MatrixMax, MatrixMin,
+)
+from cdl_python.time_manager import TimeManager, ExecutionMode
+
+
+def _assert_raw_matches(make, calls, tm=None):
+    """Check compute_raw(*args) == compute(*args)['y'] over a sequence of calls
+
+    Three blocks from make() receive the same calls: one through compute(),
+    one through compute_raw() and one alternating between the two, so any
+    state compute_raw() fails to carry to the next call shows up.
+    """
+    ref, raw, mixed = make(), make(), make()
+    for i, args in enumerate(calls):
+        expected = ref.compute(*args)['y']
+        assert raw.compute_raw(*args) == expected, (i, args)
+        got = mixed.compute_raw(*args) if i % 2 else mixed.compute(*args)['y']
+        assert got == expected, (i, args)
+        if tm is not None:
+            tm.advance()
 
 
 class TestAdd:
@@ -75,6 +99,11 @@ class TestSubtract:
         result = block.compute(u1=5.0, u2=0.0)
         assert result['y'] == 5.0
 
+    def test_compute_raw(self):
+        """Test compute_raw returns the output value directly"""
+        block = Subtract()
+        assert block.compute_raw(u1=5.0, u2=3.0) == 2.0
+
 
 class TestMultiply:
     """Tests for Multiply block"""
@@ -115,6 +144,37 @@ class TestMultiply:
         result = block.compute(u1=2.5, u2=4.0)
         assert result['y'] == 10.0
 
+    def test_as_callable(self):
+        """Test as_callable returns a function computing the product"""
+        f = Multiply().as_callable()
+        assert f(2.5, 4.0) == 10.0
+
+    def test_output_dict_reused(self):
+        """Test compute returns the same dictionary, updated in place"""
+        block = Multiply()
+        first = block.compute(u1=2.0, u2=3.0)
+        second = block.compute(u1=4.0, u2=5.0)
+        assert first is second
+        assert second['y'] == 20.0
+
+
+class TestMultiplyByParameter:
+    """Tests for MultiplyByParameter block"""
+
+    def test_multiply_by_gain(self):
+        """Test multiplying input by the gain"""
+        block = MultiplyByParameter(k=2.5)
+        result = block.compute(u=4.0)
+        assert result['y'] == 10.0
+
+    def test_as_callable_captures_gain(self):
+        """Test as_callable uses the gain at the time it was created"""
+        block = MultiplyByParameter(k=2.0)
+        f = block.as_callable()
+        block.k = 3.0
+        assert f(4.0) == 8.0
+        assert block.as_callable()(4.0) == 12.0
+
 
 class TestDivide:
     """Tests for Divide block"""
@@ -160,3 +220,145 @@ class TestDivide:
         block = Divide()
         result = block.compute(u1=7.0, u2=2.0)
         assert result['y'] == 3.5
+
+
+class TestModulo:
+    """Tests for Modulo block"""
+
+    def test_modulo_positive_numbers(self):
+        """Test modulo of positive numbers"""
+        block = Modulo()
+        result = block.compute(u1=7.5, u2=2.0)
+        assert result['y'] == 1.5
+
+    def test_modulo_negative_dividend(self):
+        """Test modulo takes the sign of the divisor"""
+        block = Modulo()
+        result = block.compute(u1=-1.0, u2=3.0)
+        assert result['y'] == 2.0
+
+    def test_modulo_by_zero_raises(self):
+        """Test that modulo by zero raises error"""
+        block = Modulo()
+        with pytest.raises(ZeroDivisionError):
+            block.compute(u1=5.0, u2=0.0)
+
+    def test_compute_raw(self):
+        """Test compute_raw returns the output value directly"""
+        block = Modulo()
+        assert block.compute_raw(u1=7.5, u2=2.0) == 1.5
+
+    def test_bind_divisor(self):
+        """Test compute with a bound divisor takes only the dividend"""
+        block = Modulo()
+        block.bind_divisor(3.0)
+        assert block.compute(u1=10.0)['y'] == 1.0
+        assert block.compute(-1.0)['y'] == 2.0
+        assert block.compute_raw(4.0) == 1.0
+
+    def test_bind_zero_divisor_raises(self):
+        """Test that binding a zero divisor raises error"""
+        block = Modulo()
+        with pytest.raises(ZeroDivisionError):
+            block.bind_divisor(0.0)
+
+    def test_compute_batch(self):
+        """Test element-wise modulo over arrays"""
+        block = Modulo()
+        u1 = np.array([10.0, -1.0, 7.5])
+        result = block.compute_batch(u1, np.array([3.0, 3.0, 2.0]))
+        assert np.allclose(result['y'], [1.0, 2.0, 1.5])
+
+        block.bind_divisor(3.0)
+        result = block.compute_batch(u1)
+        assert np.allclose(result['y'], [1.0, 2.0, 1.5 % 3.0])
+
+    def test_compute_batch_zero_divisor_raises(self):
+        """Test that a zero divisor in the batch raises error"""
+        block = Modulo()
+        with pytest.raises(ZeroDivisionError):
+            block.compute_batch(np.array([1.0, 2.0]), np.array([1.0, 0.0]))
+
+
+class TestInputOrder:
+    """Tests for the input order derived from compute()"""
+
+    def test_input_order_matches_signature(self):
+        """Test _input_order lists the compute() inputs in order"""
+        assert Multiply._input_order == ('u1', 'u2')
+        assert Divide._input_order == ('u1', 'u2')
+
+    def test_positional_call_in_input_order(self):
+        """Test compute(*values) in _input_order matches the keyword call"""
+        block = Divide()
+        inputs = {'u2': 4.0, 'u1': 10.0}
+        values = [inputs[name] for name in block._input_order]
+        assert block.compute(*values)['y'] == block.compute(**inputs)['y'] == 2.5
+
+    def test_required_inputs_from_signature(self):
+        """Test _REQUIRED holds the compute() inputs without defaults"""
+        assert Divide._REQUIRED == frozenset({'u1', 'u2'})
+
+    def test_input_order_follows_bound_compute(self):
+        """Test _input_order and _REQUIRED follow compute() rebound by bind_divisor()"""
+        block = Modulo()
+        block.bind_divisor(3.0)
+        assert block._input_order == ('u1',)
+        assert block._REQUIRED == frozenset({'u1'})
+        values = [{'u1': 10.0}[name] for name in block._input_order]
+        assert block.compute(*values)['y'] == 1.0
+        block._validate_inputs({'u1': 10.0})
+        # Other instances keep the class-level order
+        assert Modulo()._input_order == ('u1', 'u2')
+
+    def test_validate_inputs_reports_missing(self):
+        """Test _validate_inputs raises for missing required inputs"""
+        block = Divide()
+        block._validate_inputs({'u1': 1.0, 'u2': 2.0})
+        with pytest.raises(ValueError, match="u2"):
+            block._validate_inputs({'u1': 1.0})
+
+
+class TestComputeRaw:
+    """compute_raw() returns compute()['y'] and updates state the same way"""
+
+    def test_greater(self):
+        """Test Greater with hysteresis"""
+        calls = [(0.0, 0.0), (0.4, 0.0), (0.6, 0.0), (0.2, 0.0), (-0.6, 0.0), (0.1, 0.0)]
+        _assert_raw_matches(lambda: Greater(h=1.0), calls)
+
+    def test_limiter(self):
+        """Test Limiter below, within and above the limits"""
+        _assert_raw_matches(lambda: Limiter(uMax=2.0, uMin=-1.0),
+                            [(-5.0,), (0.5,), (2.0,), (7.0,)])
+
+    def test_log(self):
+        """Test Log"""
+        _assert_raw_matches(Log, [(0.5,), (1.0,), (10.0,)])
+
+    def test_limit_slew_rate(self):
+        """Test LimitSlewRate while rising, falling and following the input"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        calls = [(0.0,), (5.0,), (5.0,), (0.05,), (-3.0,), (-3.0,), (-2.98,)]
+        _assert_raw_matches(
+            lambda: LimitSlewRate(time_manager=tm, raisingSlewRate=2.0, fallingSlewRate=4.0),
+            calls, tm)
+
+    def test_matrix_max_min(self):
+        """Test MatrixMax and MatrixMin"""
+        calls = [([1.0, -2.0, 3.0],), (np.array([-1.0, -0.5]),)]
+        _assert_raw_matches(MatrixMax, calls)
+        _assert_raw_matches(MatrixMin, calls)
+
+    def test_line(self):
+        """Test Line within and beyond the limits"""
+        calls = [(0.0, 0.0, 2.0, 4.0, u) for u in [-1.0, 0.5, 3.0]]
+        _assert_raw_matches(Line, calls)
+        _assert_raw_matches(lambda: Line(limitBelow=False, limitAbove=False), calls)
+
+    def test_integrator_with_reset(self):
+        """Test IntegratorWithReset across integration and resets"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        calls = [(1.0, False, 0.0), (2.0, False, 0.0), (2.0, True, 5.0), (2.0, True, 9.0),
+                 (-1.0, False, 0.0), (0.5, True, -2.0), (0.5, False, 0.0)]
+        _assert_raw_matches(lambda: IntegratorWithReset(time_manager=tm, k=0.5), calls, tm)
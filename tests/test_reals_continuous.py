@@ -1,7 +1,58 @@
 # ABOUTME: Tests for continuous-time Reals blocks
 import pytest
 from cdl_python.time_manager import TimeManager, ExecutionMode
-from cdl_python.CDL.Reals import Derivative, LimitSlewRate, MovingAverage
+from cdl_python.CDL.Reals import Derivative, LimitSlewRate, MovingAverage, PID
+from cdl_python.CDL.Reals.PID import SimpleController
+
+
+class _ReferencePID:
+    """The general PID algorithm, with every term switched at run time
+
+    Copy of the single compute() that PID had before it was specialized per
+    controller type, used to check the specialized variants.
+    """
+
+    def __init__(self, controller_type, reverse_acting, k, Ti, Td, r, yMax, yMin, Ni, Nd,
+                 xi_start, yd_start):
+        self.with_I = controller_type in [SimpleController.PI, SimpleController.PID]
+        self.with_D = controller_type in [SimpleController.PD, SimpleController.PID]
+        self.reverse_acting = reverse_acting
+        self.k, self.Ti, self.Td, self.r = k, Ti, Td, r
+        self.yMax, self.yMin, self.Ni, self.Nd = yMax, yMin, Ni, Nd
+        self.integral = xi_start
+        self.derivative_filtered = yd_start
+        self.last_error = 0.0
+        self.last_time = None
+
+    def compute(self, t, u_s, u_m):
+        sign = 1.0 if self.reverse_acting else -1.0
+        error = sign * (u_s - u_m) / self.r
+        P = self.k * error
+        if self.last_time is None:
+            self.last_time = t
+            self.last_error = error
+            return max(self.yMin, min(self.yMax, P))
+
+        dt = t - self.last_time
+        I = 0.0
+        if self.with_I and dt > 0:
+            self.integral += error * dt
+            I = self.k / self.Ti * self.integral
+        D = 0.0
+        if self.with_D and dt > 0:
+            derivative = (error - self.last_error) / dt
+            alpha = dt * self.Nd / self.Td
+            self.derivative_filtered += alpha * (derivative - self.derivative_filtered)
+            D = self.k * self.Td * self.derivative_filtered
+
+        y_unlim = P + I + D
+        y = max(self.yMin, min(self.yMax, y_unlim))
+        if self.with_I and y != y_unlim and dt > 0:
+            self.integral -= (y_unlim - y) / (self.k * self.Ni) * dt
+
+        self.last_error = error
+        self.last_time = t
+        return y
 
 
 class TestDerivative:
@@ -116,6 +167,24 @@ class TestLimitSlewRate:
         # After 1 second, should be at ~8.0
         assert 7.9 < result['y'] < 8.1
 
+    def test_non_positive_rates_raise(self):
+        """Should reject slew rates that are not positive"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        with pytest.raises(ValueError):
+            LimitSlewRate(time_manager=tm, raisingSlewRate=0.0)
+        with pytest.raises(ValueError):
+            LimitSlewRate(time_manager=tm, fallingSlewRate=-1.0)
+
+    def test_falling_rate_changed_after_construction(self):
+        """Assigning fallingSlewRate should take effect on the next step"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        limiter = LimitSlewRate(time_manager=tm, fallingSlewRate=1.0, y_start=10.0)
+        limiter.compute(u=10.0)
+        limiter.fallingSlewRate = 5.0
+        tm.advance()
+        assert limiter.compute(u=0.0)['y'] == pytest.approx(9.5)
+        assert limiter.fallingSlewRate == 5.0
+
 
 class TestMovingAverage:
     """Test MovingAverage block"""
@@ -164,3 +233,108 @@ class TestMovingAverage:
         tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
         with pytest.raises(ValueError):
             MovingAverage(time_manager=tm, delta=0.0)
+
+
+class TestPID:
+    """Test PID block"""
+
+    def test_p_controller_output(self):
+        """P controller output should be k * error, limited"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        pid = PID(time_manager=tm, controllerType=SimpleController.P, k=2.0,
+                  yMax=10.0, yMin=-10.0)
+
+        pid.compute(u_s=1.0, u_m=0.0)
+        tm.advance()
+        result = pid.compute(u_s=1.5, u_m=0.5)
+        assert result['y'] == pytest.approx(2.0)
+
+    def test_changing_gain_updates_output(self):
+        """Setting k after construction should be used by the next step"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        pid = PID(time_manager=tm, controllerType=SimpleController.P, k=1.0,
+                  yMax=10.0, yMin=-10.0)
+
+        assert pid.compute(u_s=1.0, u_m=0.0)['y'] == pytest.approx(1.0)
+        pid.k = 3.0
+        tm.advance()
+        assert pid.compute(u_s=1.0, u_m=0.0)['y'] == pytest.approx(3.0)
+
+    def test_pi_controller_integrates_error(self):
+        """PI controller should add k/Ti times the integrated error"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        pid = PID(time_manager=tm, controllerType=SimpleController.PI, k=1.0, Ti=0.5,
+                  yMax=10.0, yMin=-10.0)
+
+        pid.compute(u_s=1.0, u_m=0.0)
+        tm.advance()
+        result = pid.compute(u_s=1.0, u_m=0.0)
+        # P = 1.0, I = 1/0.5 * (1.0 * 0.1)
+        assert result['y'] == pytest.approx(1.2)
+
+    def test_compute_matches_general_algorithm(self):
+        """Each controller type should match the general PID algorithm step by step"""
+        params = dict(k=2.0, Ti=0.5, Td=0.2, r=2.0, yMax=1.0, yMin=-1.0, Ni=0.9, Nd=10.0,
+                      xi_start=0.1, yd_start=0.05)
+        # Large errors saturate the output both ways; None repeats a call
+        # without advancing time
+        steps = [(1.0, 0.0), (1.0, 0.0), None, (3.0, 0.0), (3.0, 0.5), (-2.0, 1.0),
+                 (-2.0, 1.0), (0.2, 0.1), None, (0.2, 0.15), (0.0, 0.0)]
+        for controller_type in SimpleController:
+            for reverse_acting in [True, False]:
+                tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+                pid = PID(time_manager=tm, controllerType=controller_type,
+                          reverseActing=reverse_acting, **params)
+                reference = _ReferencePID(controller_type, reverse_acting, **params)
+                saturated = 0
+                u_s = u_m = 0.0
+                for step in steps:
+                    if step is not None:
+                        tm.advance()
+                        u_s, u_m = step
+                    t = tm.get_time()
+                    y = pid.compute(u_s=u_s, u_m=u_m)['y']
+                    expected = reference.compute(t, u_s, u_m)
+                    assert y == pytest.approx(expected, rel=1e-12, abs=1e-12)
+                    saturated += y in (params['yMax'], params['yMin'])
+                assert saturated > 0
+                assert pid.get_state()['integral'] == pytest.approx(reference.integral, rel=1e-12)
+
+    def test_direct_acting_inverts_error(self):
+        """Direct acting controller should use u_m - u_s as error"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        pid = PID(time_manager=tm, controllerType=SimpleController.P, k=1.0,
+                  yMax=10.0, yMin=-10.0, reverseActing=False)
+
+        result = pid.compute(u_s=1.0, u_m=3.0)
+        assert result['y'] == pytest.approx(2.0)
+
+    def test_changing_acting_direction_updates_output(self):
+        """Setting reverseActing after construction should flip the error sign"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        pid = PID(time_manager=tm, controllerType=SimpleController.P, k=1.0,
+                  yMax=10.0, yMin=-10.0)
+
+        assert pid.compute(u_s=1.0, u_m=3.0)['y'] == pytest.approx(-2.0)
+        pid.reverseActing = False
+        tm.advance()
+        assert pid.compute(u_s=1.0, u_m=3.0)['y'] == pytest.approx(2.0)
+
+    def test_state_round_trip(self):
+        """Restoring a saved state should reproduce the same outputs"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        pid = PID(time_manager=tm, controllerType=SimpleController.PID,
+                  yMax=10.0, yMin=-10.0)
+
+        for _ in range(5):
+            pid.compute(u_s=1.0, u_m=0.2)
+            tm.advance()
+        saved_state = pid.get_state()
+        saved_time = tm.get_state()
+        expected = pid.compute(u_s=1.0, u_m=0.4)
+
+        pid.reset_state()
+        tm.set_state(saved_time)
+        pid.set_state(saved_state)
+        result = pid.compute(u_s=1.0, u_m=0.4)
+        assert result['y'] == pytest.approx(expected['y'])
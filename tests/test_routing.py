@@ -1,6 +1,7 @@
 # ABOUTME: Test suite for Routing blocks
 # ABOUTME: Tests extractors, replicators, and filters for Real, Integer, Boolean types
 import pytest
+import numpy as np
 from cdl_python.CDL.Routing import (
     # Real blocks
     RealExtractor,
@@ -96,6 +97,12 @@ class TestRealScalarReplicator:
         result = rep.compute(u=3.14)
         assert result['y'] == [3.14]
 
+    def test_compute_batch(self):
+        """Replicate a batch of scalars into one row per step"""
+        rep = RealScalarReplicator(nout=3)
+        result = rep.compute_batch(np.array([1.0, 2.5]))
+        assert result['y'].tolist() == [[1.0, 1.0, 1.0], [2.5, 2.5, 2.5]]
+
 
 class TestRealVectorReplicator:
     """Test RealVectorReplicator block"""
@@ -112,6 +119,13 @@ class TestRealVectorReplicator:
         result = rep.compute(u=[1.0, 2.0, 3.0])
         assert result['y'] == [1.0, 2.0, 3.0]
 
+    def test_compute_batch(self):
+        """Replicate a batch of vectors, matching compute row by row"""
+        rep = RealVectorReplicator(nin=2, nrep=3)
+        u = np.array([[1.0, 2.0], [3.0, 4.0]])
+        result = rep.compute_batch(u)
+        assert result['y'].tolist() == [rep.compute(u=row)['y'] for row in u.tolist()]
+
 
 # =====================================================
 # Real Filter Tests
@@ -138,6 +152,13 @@ class TestRealVectorFilter:
         result = filt.compute(u=[10.0, 20.0, 30.0, 40.0, 50.0])
         assert result['y'] == [10.0, 30.0, 40.0]
 
+    def test_filter_array_input(self):
+        """Filtering a numpy array returns a numpy array"""
+        filt = RealVectorFilter(nin=5, nout=3, msk=[True, False, True, True, False])
+        result = filt.compute(u=np.array([10.0, 20.0, 30.0, 40.0, 50.0]))
+        assert isinstance(result['y'], np.ndarray)
+        assert result['y'].tolist() == [10.0, 30.0, 40.0]
+
     def test_raises_on_mismatch(self):
         """Raises error when nout doesn't match True count"""
         with pytest.raises(ValueError):
@@ -290,3 +311,10 @@ class TestBooleanVectorFilter:
         filt = BooleanVectorFilter(nin=3, nout=2, msk=[False, True, True])
         result = filt.compute(u=[True, False, False])
         assert result['y'] == [False, False]
+
+    def test_filter_array_input(self):
+        """Filtering a numpy bool array returns a numpy bool array"""
+        filt = BooleanVectorFilter(nin=4, nout=2, msk=[True, False, False, True])
+        result = filt.compute(u=np.array([True, True, False, False]))
+        assert result['y'].dtype == bool
+        assert result['y'].tolist() == [True, False]
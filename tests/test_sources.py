@@ -2,6 +2,7 @@
 # ABOUTME: Tests constant, time-varying, and table-based signal generators
 import pytest
 import math
+import numpy as np
 from datetime import datetime
 from cdl_python.time_manager import TimeManager, ExecutionMode
 from cdl_python.CDL.Reals.Sources import (
@@ -145,6 +146,17 @@ class TestSin:
             if i < len(test_points) - 1:
                 tm.advance(dt=0.25)
 
+    def test_sin_compute_range_matches_compute(self):
+        """Test compute_range matches compute at each time, including before startTime"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        sin = Sin(time_manager=tm, amplitude=2.0, freqHz=0.5, phase=0.3, offset=1.0, startTime=0.35)
+        times = np.arange(0.0, 3.0, 0.1)
+        y = sin.compute_range(times)['y']
+
+        for i in range(len(times)):
+            assert y[i] == pytest.approx(sin.compute()['y'], abs=1e-12)
+            tm.advance()
+
 
 # ============================================================================
 # Integers.Sources Tests
@@ -257,6 +269,22 @@ class TestIntegerTimeTable:
         result = tt.compute()
         assert result['y'] == 5
 
+    def test_timetable_multiple_columns(self):
+        """Test multi-column lookup returns a new list of ints on each call"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.5)
+        table = [[0.0, 1, 2], [1.0, 3, 4]]
+        tt = IntTimeTable(time_manager=tm, table=table, timeScale=1.0, period=2.0)
+
+        tm.advance()
+        first = tt.compute()['y']
+        assert first == [1, 2]
+        assert all(type(v) is int for v in first)
+        first[0] = 99
+        assert tt.compute()['y'] == [1, 2]
+
+        tm.advance()
+        assert tt.compute()['y'] == [3, 4]
+
 
 # ============================================================================
 # Logical.Sources Tests
@@ -440,6 +468,41 @@ class TestRealPulse:
         result = pulse.compute()
         assert result['y'] == pytest.approx(4.0)
 
+    def test_pulse_high_at_period_starts(self):
+        """Test pulse is high at the start of every period with a non-integer period"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        for n in range(1, 50):
+            # A negative shift places t=0 at the start of period n
+            pulse = RealPulse(time_manager=tm, width=0.5, period=0.1, shift=-n * 0.1)
+            assert pulse.compute()['y'] == 1.0
+
+    def test_pulse_parameters_changed_after_construction(self):
+        """Test assigning each parameter gives the same outputs as a new block"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        params = dict(amplitude=5.0, width=0.5, period=1.0, shift=0.0, offset=2.0)
+        changes = [('amplitude', 3.0), ('width', 0.25), ('period', 0.4),
+                   ('shift', 0.3), ('offset', -1.0)]
+        times = [0.0, 0.15, 0.35, 0.5, 0.75, 1.05, 2.6, 3.9]
+        for name, value in changes:
+            pulse = RealPulse(time_manager=tm, **params)
+            setattr(pulse, name, value)
+            expected = RealPulse(time_manager=tm, **dict(params, **{name: value}))
+            for t in times:
+                tm.reset(start_time=t)
+                assert pulse.compute()['y'] == expected.compute()['y'], (name, t)
+
+    def test_pulse_invalid_parameter_assignment(self):
+        """Test assigning an invalid width or period raises and keeps the old value"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        pulse = RealPulse(time_manager=tm, width=0.5, period=1.0)
+        with pytest.raises(ValueError, match="width"):
+            pulse.width = 1.5
+        with pytest.raises(ValueError, match="period"):
+            pulse.period = 0.0
+        assert (pulse.width, pulse.period) == (0.5, 1.0)
+        tm.reset(start_time=0.6)
+        assert pulse.compute()['y'] == 0.0
+
 
 class TestRamp:
     """Test the Ramp source block"""
@@ -486,6 +549,30 @@ class TestRamp:
         result = ramp.compute()
         assert result['y'] == pytest.approx(10.0, abs=1e-5)
 
+    def test_ramp_parameters_changed_after_construction(self):
+        """Test assigning each parameter gives the same outputs as a new block"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        params = dict(height=10.0, duration=2.0, offset=5.0, startTime=1.0)
+        changes = [('height', 4.0), ('duration', 0.5), ('offset', -1.0), ('startTime', 2.0)]
+        times = [0.0, 1.0, 1.25, 1.5, 2.0, 2.25, 2.75, 3.0, 4.0]
+        for name, value in changes:
+            ramp = Ramp(time_manager=tm, **params)
+            setattr(ramp, name, value)
+            expected = Ramp(time_manager=tm, **dict(params, **{name: value}))
+            for t in times:
+                tm.reset(start_time=t)
+                assert ramp.compute()['y'] == expected.compute()['y'], (name, t)
+
+    def test_ramp_invalid_duration_assignment(self):
+        """Test assigning a non-positive duration raises and keeps the old value"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        ramp = Ramp(time_manager=tm, height=10.0, duration=2.0)
+        with pytest.raises(ValueError, match="duration"):
+            ramp.duration = 0.0
+        assert ramp.duration == 2.0
+        tm.reset(start_time=1.0)
+        assert ramp.compute()['y'] == pytest.approx(5.0)
+
 
 class TestRealTimeTable:
     """Test the Real TimeTable source block"""
@@ -557,6 +644,145 @@ class TestRealTimeTable:
         result = tt.compute()
         assert result['y'] == pytest.approx(100.0)
 
+    def test_timetable_offset_does_not_accumulate(self):
+        """Test repeated calls add the offset to fresh values each time"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        tt = RealTimeTable(time_manager=tm, table=[[0.0, 1.0, 2.0], [1.0, 3.0, 4.0]],
+                           extrapolation=Extrapolation.HOLD_LAST_POINT, offset=[10.0, 20.0])
+        tm.reset(start_time=-1.0)
+        first = tt.compute()['y']
+        second = tt.compute()['y']
+        assert first == [11.0, 22.0]
+        assert second == [11.0, 22.0]
+        assert first is not second
+
+    def test_timetable_compute_range_matches_compute(self):
+        """Test compute_range matches compute for all interpolation and extrapolation modes"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        table = [[0.0, 1.0, 2.0], [1.0, 3.0, -1.0], [1.0, 5.0, 0.0], [2.5, 4.0, 1.0], [4.0, 0.0, 2.0]]
+        times = [-3.7, -0.2, 0.0, 0.4, 1.0, 1.3, 2.5, 3.99, 4.0, 4.6, 9.25]
+
+        for smoothness in Smoothness:
+            for extrapolation in Extrapolation:
+                tt = RealTimeTable(time_manager=tm, table=table, smoothness=smoothness,
+                                   extrapolation=extrapolation, offset=[0.5, -0.5])
+                y = tt.compute_range(np.array(times))['y']
+                assert y.shape == (len(times), 2)
+                for i, t in enumerate(times):
+                    tm.reset(start_time=t)
+                    assert y[i].tolist() == tt.compute()['y']
+
+    def test_timetable_lookup_after_time_jumps_back(self):
+        """Test interval lookup stays correct when time moves backwards"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        tt = RealTimeTable(time_manager=tm, table=[[0.0, 0.0], [1.0, 10.0], [2.0, 30.0], [3.0, 60.0]],
+                           extrapolation=Extrapolation.HOLD_LAST_POINT)
+
+        for t, expected in [(0.5, 5.0), (1.5, 20.0), (2.5, 45.0), (0.25, 2.5), (3.0, 60.0), (1.0, 10.0)]:
+            tm.reset(start_time=t)
+            assert tt.compute()['y'] == pytest.approx(expected)
+
+    def test_timetable_single_column_matches_general_path(self):
+        """Test the single-column compute() gives the same values as the general path"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        table = [[0.0, 1.0], [1.0, 3.0], [1.0, 5.0], [2.5, 4.0]]
+        for smoothness in Smoothness:
+            for extrapolation in Extrapolation:
+                tt = RealTimeTable(time_manager=tm, table=table, smoothness=smoothness,
+                                   extrapolation=extrapolation, offset=[0.5])
+                for t in [-1.2, 0.0, 0.7, 1.0, 2.0, 2.5, 3.3, 7.9]:
+                    tm.reset(start_time=t)
+                    assert tt.compute()['y'] == RealTimeTable.compute(tt)['y']
+
+    def test_timetable_compute_range_large_table(self):
+        """Test compute_range on a table large enough for the Eytzinger lookup"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        # Hourly schedule over 20 days, with a repeated time stamp for a step change
+        table = [[float(h), float(h % 24)] for h in range(480)]
+        table.insert(100, [100.0, -1.0])
+        tt = RealTimeTable(time_manager=tm, table=table, timeScale=3600.0,
+                           extrapolation=Extrapolation.HOLD_LAST_POINT)
+        # Unsorted times, as ascending ones are searched with np.searchsorted
+        times = np.random.default_rng(0).permutation(np.linspace(-7200.0, 480 * 3600.0, 1001))
+        y = tt.compute_range(times)['y']
+
+        for i in range(0, len(times), 50):
+            tm.reset(start_time=times[i])
+            assert y[i] == tt.compute()['y']
+        tm.reset(start_time=100 * 3600.0)
+        assert tt.compute_range(np.array([100 * 3600.0]))['y'][0] == tt.compute()['y']
+
+    def test_timetable_compute_range_unsorted_times(self):
+        """Test compute_range gives the same values for shuffled and sorted times"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        short_table = [[0.0, 0.0], [1.0, 2.0], [1.0, 3.0], [4.0, -1.0], [6.0, 5.0]]
+        long_table = [[0.25 * i, float(i % 7)] for i in range(40)]
+        times = np.linspace(-2.0, 12.0, 2001)
+        order = np.random.default_rng(0).permutation(len(times))
+        for table in [short_table, long_table]:
+            tt = RealTimeTable(time_manager=tm, table=table,
+                               extrapolation=Extrapolation.LAST_TWO_POINTS)
+            y_sorted = tt.compute_range(times)['y']
+            y_shuffled = tt.compute_range(times[order])['y']
+            assert np.array_equal(y_shuffled, y_sorted[order])
+
+    def test_timetable_compute_range_single_column(self):
+        """Test compute_range returns a 1-D array for a single output column"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        tt = RealTimeTable(time_manager=tm, table=[[0.0, 0.0], [1.0, 10.0]],
+                           extrapolation=Extrapolation.HOLD_LAST_POINT)
+        y = tt.compute_range(np.array([-1.0, 0.25, 0.5, 2.0]))['y']
+        assert y.tolist() == [0.0, 2.5, 5.0, 10.0]
+
+    def test_timetable_extrapolation_after_step_holds(self):
+        """Test two-point extrapolation after a step change at the end holds the value"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        tt = RealTimeTable(time_manager=tm, table=[[0.0, 1.0], [1.0, 2.0], [1.0, 5.0]],
+                           extrapolation=Extrapolation.LAST_TWO_POINTS)
+        tm.reset(start_time=3.0)
+        assert tt.compute()['y'] == 5.0
+        assert tt.compute_range(np.array([3.0]))['y'].tolist() == [5.0]
+
+    def test_timetable_parameters_changed_after_construction(self):
+        """Test assigning each parameter gives the same outputs as a new block"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        table = [[0.0, 1.0], [1.0, 3.0], [2.0, 2.0]]
+        changes = [
+            ('offset', [100.0]),
+            ('table', [[0.0, 1.0, 4.0], [1.0, 3.0, 0.0], [2.0, 2.0, 8.0]]),
+            ('smoothness', Smoothness.CONSTANT_SEGMENTS),
+            ('extrapolation', Extrapolation.LAST_TWO_POINTS),
+            ('timeScale', 2.0),
+        ]
+        times = [-0.5, 0.5, 1.5, 3.5, 5.0]
+        for name, value in changes:
+            tt = RealTimeTable(time_manager=tm, table=table)
+            for t in times:
+                tm.reset(start_time=t)
+                tt.compute()
+            setattr(tt, name, value)
+            expected = RealTimeTable(time_manager=tm, **{'table': table, name: value})
+            for t in times:
+                tm.reset(start_time=t)
+                assert tt.compute()['y'] == expected.compute()['y'], (name, t)
+            assert np.array_equal(tt.compute_range(np.array(times))['y'],
+                                  expected.compute_range(np.array(times))['y'])
+
+    def test_timetable_offset_and_table_arrays_read_only(self):
+        """Test in-place edits of offset and table raise instead of being ignored"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        tt = RealTimeTable(time_manager=tm, table=[[0.0, 1.42], [1.0, 1.42]], offset=[0.0])
+        with pytest.raises(ValueError):
+            tt.offset[0] = 100.0
+        with pytest.raises(ValueError):
+            tt.table[0, 1] = 5.0
+        tt.offset = [100.0]
+        assert tt.compute()['y'] == pytest.approx(101.42)
+        with pytest.raises(ValueError, match="offset length"):
+            tt.offset = [1.0, 2.0]
+        with pytest.raises(ValueError, match="offset length"):
+            tt.table = [[0.0, 1.0, 2.0]]
+
 
 class TestCalendarTime:
     """Test the CalendarTime source block"""
@@ -600,6 +826,21 @@ class TestCalendarTime:
         assert result['month'] == 1
         assert result['day'] == 1
 
+    def test_calendar_time_uses_types_zero_time(self):
+        """Test CalendarTime accepts the ZeroTime members from CDL.Types"""
+        from cdl_python.CDL import Types
+
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        assert ZeroTime is Types.ZeroTime
+        cal = CalendarTime(time_manager=tm, zerTim=Types.ZeroTime.NY2045)
+        result = cal.compute()
+        assert (result['year'], result['month'], result['day']) == (2045, 1, 1)
+
+        cal = CalendarTime(time_manager=tm, zerTim=Types.ZeroTime.UnixTimeStampGMT)
+        assert cal.compute()['year'] == 1970
+        cal = CalendarTime(time_manager=tm, zerTim=Types.ZeroTime.Custom, yearRef=2031)
+        assert cal.compute()['year'] == 2031
+
     def test_calendar_time_with_offset(self):
         """Test calendar time with timezone offset"""
         tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
@@ -610,6 +851,69 @@ class TestCalendarTime:
         assert result['hour'] == 3
         assert result['minute'] == pytest.approx(0.0)
 
+    def test_calendar_time_leap_day(self):
+        """Test calendar time on a leap day"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        # 2016-02-29 12:30:30 is 59 days, 12.5 hours and 30 seconds after NY2016
+        offset = 59 * 86400 + 12 * 3600 + 30 * 60 + 30.0
+        cal = CalendarTime(time_manager=tm, zerTim=ZeroTime.NY2016, offset=offset)
+
+        result = cal.compute()
+        assert (result['year'], result['month'], result['day']) == (2016, 2, 29)
+        assert result['hour'] == 12
+        assert result['minute'] == pytest.approx(30.5)
+        assert result['weekDay'] == 1
+
+    def test_calendar_time_before_reference(self):
+        """Test calendar time before the reference date"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        cal = CalendarTime(time_manager=tm, zerTim=ZeroTime.NY2016, offset=-30.0)
+
+        result = cal.compute()
+        assert (result['year'], result['month'], result['day']) == (2015, 12, 31)
+        assert result['hour'] == 23
+        assert result['minute'] == pytest.approx(59.5)
+        assert result['weekDay'] == 4
+
+    def test_calendar_time_across_midnight(self):
+        """Test date and weekday update when stepping past midnight"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=600)
+        cal = CalendarTime(time_manager=tm, zerTim=ZeroTime.NY2016, offset=86400 - 1200)
+
+        days = []
+        for _ in range(4):
+            result = cal.compute()
+            days.append((result['day'], result['weekDay'], result['hour']))
+            tm.advance(600)
+        assert days == [(1, 5, 23), (1, 5, 23), (2, 6, 0), (2, 6, 0)]
+
+    def test_calendar_time_compute_range_matches_compute(self):
+        """Test compute_range gives the same outputs as stepping compute"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.1)
+        times = np.array([0.0, 59.5, 3600.0, 86399.9, 86400.0, 5.3e6, 3.2e7])
+        cal = CalendarTime(time_manager=tm, zerTim=ZeroTime.NY2016, offset=-7200.0)
+        batch = cal.compute_range(times)
+
+        for i, t in enumerate(times):
+            # The time manager stays at 0, so the time goes in through the offset
+            ref = CalendarTime(time_manager=tm, zerTim=ZeroTime.NY2016, offset=t - 7200.0)
+            result = ref.compute()
+            for key in ['year', 'month', 'day', 'hour', 'weekDay']:
+                assert batch[key][i] == result[key]
+            assert batch['minute'][i] == pytest.approx(result['minute'])
+
+    def test_calendar_time_output_dict_reused(self):
+        """Test compute updates the same output dictionary each call"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=3600)
+        cal = CalendarTime(time_manager=tm, zerTim=ZeroTime.NY2016)
+
+        first = cal.compute()
+        tm.advance(3600)
+        second = cal.compute()
+        assert first is second
+        assert second['hour'] == 1
+        assert set(second) == {'year', 'month', 'day', 'hour', 'minute', 'weekDay'}
+
 
 class TestCivilTime:
     """Test the CivilTime source block"""
@@ -107,3 +107,46 @@ class TestTimeManager:
         tm.set_mode(ExecutionMode.SIMULATION, start_time=100.0)
 
         assert tm.get_time() == 100.0
+
+    def test_set_mode_switches_get_time(self):
+        """Test get_time follows the mode after switching back and forth"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, start_time=5.0)
+        tm.set_mode(ExecutionMode.REALTIME)
+        assert tm.get_time() > 1e9
+
+        tm.mode = ExecutionMode.SIMULATION
+        tm.reset(start_time=5.0)
+        assert tm.get_time() == 5.0
+
+    def test_thread_safe(self):
+        """Test a thread-safe TimeManager behaves the same under its lock"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, time_step=0.5, thread_safe=True)
+        tm.advance()
+        assert tm.get_time() == 0.5
+        assert tm.get_state() == {'mode': 'simulation', 'current_time': 0.5, 'time_step': 0.5}
+
+    def test_realtime_tick_latches_wall_clock(self):
+        """Test get_time returns the wall-clock time of the last tick"""
+        tm = TimeManager(mode=ExecutionMode.REALTIME)
+        t1 = tm.tick()
+        time.sleep(0.01)
+        assert tm.get_time() == t1
+
+        t2 = tm.tick()
+        assert t2 - t1 >= 0.01
+        assert tm.get_time() == t2
+
+    def test_simulation_tick_keeps_time(self):
+        """Test tick does not advance simulation time"""
+        tm = TimeManager(mode=ExecutionMode.SIMULATION, start_time=3.0)
+        assert tm.tick() == 3.0
+        assert tm.get_time() == 3.0
+
+    def test_assigning_mode_updates_realtime_flag(self):
+        """Test assigning mode directly switches advance() behaviour"""
+        tm = TimeManager(mode=ExecutionMode.REALTIME, time_step=1.0)
+        tm.mode = ExecutionMode.SIMULATION
+        tm.reset()
+        tm.advance()
+        assert tm.get_time() == 1.0
+        assert tm.get_state()['mode'] == 'simulation'
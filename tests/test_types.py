@@ -0,0 +1,30 @@
+# ABOUTME: Unit tests for the CDL type enumerations.
+# ABOUTME: Tests the precomputed ZeroTime epochs.
+
+import pytest
+from datetime import datetime, timezone
+from cdl_python.CDL.Types import ZeroTime
+
+
+class TestZeroTime:
+    """Tests for ZeroTime enumeration"""
+
+    def test_epoch_new_year(self):
+        """Test epoch of the NY members matches the calendar date"""
+        assert ZeroTime.NY2010.epoch() == 1262304000
+        assert ZeroTime.epoch(ZeroTime.NY2050) == 2524608000
+        for member in ZeroTime:
+            if member.name.startswith("NY"):
+                year = int(member.name[2:])
+                expected = datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()
+                assert member.epoch() == expected
+
+    def test_epoch_unix_time_stamp(self):
+        """Test Unix time stamp members start at zero"""
+        assert ZeroTime.UnixTimeStamp.epoch() == 0
+        assert ZeroTime.UnixTimeStampGMT.epoch() == 0
+
+    def test_epoch_custom_raises(self):
+        """Test Custom has no fixed epoch"""
+        with pytest.raises(ValueError):
+            ZeroTime.Custom.epoch()
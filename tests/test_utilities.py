@@ -2,12 +2,20 @@
 # ABOUTME: Tests Assert block for validation and debugging
 import pytest
 import warnings
+import numpy as np
 from cdl_python.CDL.Utilities import Assert
 
 
 class TestAssert:
     """Test the Assert utility block"""
 
+    def test_assert_has_no_instance_dict(self):
+        """Assert keeps its attributes in slots"""
+        assert_block = Assert(message="slots")
+        assert not hasattr(assert_block, '__dict__')
+        assert assert_block.message == "slots"
+        assert assert_block.get_state() == {}
+
     def test_assert_true_no_warning(self):
         """No warning when input is True"""
         assert_block = Assert(message="This should not appear")
@@ -87,3 +95,36 @@ class TestAssert:
 
         assert result_true == {}
         assert result_false == {}
+
+    def test_assert_compute_batch(self):
+        """One warning per batch, naming the first failing index"""
+        assert_block = Assert(message="Batch")
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            assert assert_block.compute_batch(np.array([True, True, True])) == {}
+            assert len(w) == 0
+
+            assert_block.compute_batch(np.array([True, False, True, False]))
+            assert len(w) == 1
+            assert "Batch (first failure at index 1)" in str(w[0].message)
+
+    def test_assert_warning_location_is_construction_site(self):
+        """Warning is attributed to the line that created the block"""
+        assert_block = Assert(message="Located")
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            assert_block.compute(u=False)
+
+            assert w[0].filename == __file__
+
+    def test_assert_default_filter_warns_once_per_block(self):
+        """Under the default filter each block warns once"""
+        assert_block = Assert(message="Once")
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("default")
+            assert_block.compute(u=False)
+            assert_block.compute(u=False)
+            assert len(w) == 1
@@ -1,6 +1,7 @@
 # ABOUTME: Tests for new Utilities blocks (SunRiseSet)
 import pytest
 import math
+import numpy as np
 from cdl_python.CDL.Utilities import SunRiseSet
 
 
@@ -84,3 +85,86 @@ class TestSunRiseSet:
         assert 10000 < result['tSunRis'] < 40000
         # Sunset should be between 4 PM and 10 PM (wider bounds for solar vs local time)
         assert 50000 < result['tSunSet'] < 90000
+
+    def test_compute_batch_matches_compute(self):
+        """Batch evaluation should match compute, including polar day and night"""
+        sun = SunRiseSet(year=2024)
+
+        times = np.array([1, 80, 172, 172, 355, 365]) * 86400.0
+        latitudes = np.array([40.0, 0.0, 85.0, -85.0, 45.0, -30.0])
+        longitudes = np.array([0.0, 10.0, 0.0, 0.0, -75.0, 150.0])
+
+        result = sun.compute_batch(times, latitudes, longitudes)
+
+        for i in range(len(times)):
+            expected = sun.compute(time=times[i], latitude=latitudes[i], longitude=longitudes[i])
+            assert result['tSunRis'][i] == pytest.approx(expected['tSunRis'])
+            assert result['tSunSet'][i] == pytest.approx(expected['tSunSet'])
+
+    def test_compute_batch_broadcasts_location(self):
+        """A scalar location should broadcast against an array of times"""
+        sun = SunRiseSet(year=2024)
+
+        times = np.arange(0, 365) * 86400.0
+        result = sun.compute_batch(times, 45.0, 0.0)
+
+        assert result['tSunRis'].shape == times.shape
+        day_length = result['tSunSet'] - result['tSunRis']
+        assert day_length[171] > day_length[0]
+
+    def test_changing_year_updates_leap_year(self):
+        """Setting year after construction should change leap year handling"""
+        sun = SunRiseSet(year=2024)
+        time = 365.5 * 86400  # Day 366 in a leap year, clamped to day 365 otherwise
+
+        leap_result = dict(sun.compute(time=time, latitude=45.0, longitude=0.0))
+        sun.year = 2023
+        result = sun.compute(time=time, latitude=45.0, longitude=0.0)
+
+        assert result == SunRiseSet(year=2023).compute(time=time, latitude=45.0, longitude=0.0)
+        assert result != leap_result
+
+    def test_compute_batch_parallel_matches_compute_batch(self):
+        """Threaded batch should give the same results as compute_batch"""
+        sun = SunRiseSet(year=2024)
+        rng = np.random.default_rng(0)
+        n = 300_000
+        times = rng.uniform(0.0, 366 * 86400.0, n)
+        latitudes = rng.uniform(-89.0, 89.0, n)
+
+        expected = sun.compute_batch(times, latitudes, 10.0)
+        result = sun.compute_batch_parallel(times, latitudes, 10.0, workers=4)
+        assert np.array_equal(result['tSunRis'], expected['tSunRis'])
+        assert np.array_equal(result['tSunSet'], expected['tSunSet'])
+
+        small = sun.compute_batch_parallel(times[:10], latitudes[:10], 10.0, workers=4)
+        assert np.array_equal(small['tSunRis'], expected['tSunRis'][:10])
+
+    def test_output_dict_reused(self):
+        """compute() should return the same dictionary, updated in place"""
+        sun = SunRiseSet(year=2024)
+        first = sun.compute(time=0.0, latitude=40.0, longitude=0.0)
+        expected = SunRiseSet(year=2024).compute(time=180 * 86400.0, latitude=40.0, longitude=0.0)
+        second = sun.compute(time=180 * 86400.0, latitude=40.0, longitude=0.0)
+        assert second is first
+        assert second == expected
+
+    def test_day_of_year_bounds(self):
+        """Day of year starts at 1 on day boundaries and is clamped to the year"""
+        sun = SunRiseSet(year=2023)
+        assert sun._day_of_year(-10.0) == 1
+        assert sun._day_of_year(0.0) == 1
+        assert sun._day_of_year(86400.0) == 2
+        assert sun._day_of_year(400 * 86400.0) == 365
+
+    def test_result_updates_when_location_changes(self):
+        """Repeated calls within a day should follow changes of location"""
+        sun = SunRiseSet(year=2024)
+        time = 100 * 86400
+
+        first = dict(sun.compute(time=time, latitude=40.0, longitude=-75.0))
+        assert sun.compute(time=time + 3600, latitude=40.0, longitude=-75.0) == first
+
+        moved = sun.compute(time=time + 7200, latitude=40.0, longitude=0.0)
+        assert moved == SunRiseSet(year=2024).compute(time=time, latitude=40.0, longitude=0.0)
+        assert moved != first
@@ -1,4 +1,5 @@
 # ABOUTME: Tests for CDL model representation classes
+import sys
 import pytest
 from cdl_translator.model import (
     Parameter,
@@ -78,6 +79,37 @@ class TestBlockInstance:
         assert module_path == "cdl_python.CDL.Psychrometrics"
         assert class_name == "DewPoint_TDryBulPhi"
 
+    def test_get_python_import_path_cached(self):
+        """Import path is computed once; custom blocks still raise every time"""
+        instance = BlockInstance(
+            instance_name="adder",
+            block_type="Buildings.Controls.OBC.CDL.Reals.Add"
+        )
+        assert instance.get_python_import_path() is instance.get_python_import_path()
+
+        custom = BlockInstance(instance_name="sub", block_type="MyPackage.SubController")
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid CDL block type"):
+                custom.get_python_import_path()
+        assert custom.needs_time_manager() is False
+        assert instance.is_standard_cdl_block() and not instance.is_custom_block()
+        assert custom.is_custom_block() and not custom.is_standard_cdl_block()
+
+        shallow = BlockInstance(instance_name="and1", block_type="CDL.Logical.And")
+        assert shallow.get_python_import_path() == ("cdl_python.CDL.Logical", "And")
+
+    def test_get_custom_block_name(self):
+        """Custom block names drop namespace prefix, URI and package path"""
+        cases = {
+            "ex:SubController": "SubController",
+            "http://example.org#FromModelica.SubController": "SubController",
+            "MyPackage.MyBlock": "MyBlock",
+            "MyBlock": "MyBlock",
+        }
+        for block_type, name in cases.items():
+            instance = BlockInstance(instance_name="sub", block_type=block_type)
+            assert instance.get_custom_block_name() == name
+
     def test_needs_time_manager_stateful_block(self):
         """Stateful blocks should need TimeManager"""
         # PID needs TimeManager
@@ -136,6 +168,13 @@ class TestConnection:
         assert conn.is_from_input() is False
         assert conn.is_to_output() is False
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_connection_uses_slots(self):
+        """Connections keep their fields in slots, without an instance dict"""
+        conn = Connection("gain", "y", "limiter", "u")
+        assert not hasattr(conn, "__dict__")
+        assert conn == Connection("gain", "y", "limiter", "u")
+
     def test_input_to_block_connection(self):
         """Connection from model input to block"""
         conn = Connection(
@@ -220,6 +259,21 @@ class TestCDLModel:
         assert "cdl_python.CDL.Logical" in imports
         assert "And" in imports["cdl_python.CDL.Logical"]
 
+    def test_get_required_imports_skips_custom_blocks(self):
+        """Custom blocks are left out and the result is a plain dict"""
+        model = CDLModel(
+            metadata=ModelMetadata(name="Test"),
+            instances=[
+                BlockInstance("add1", "Buildings.Controls.OBC.CDL.Reals.Add"),
+                BlockInstance("add2", "Buildings.Controls.OBC.CDL.Reals.Add"),
+                BlockInstance("sub", "ex:SubController"),
+            ]
+        )
+
+        imports = model.get_required_imports()
+        assert imports == {"cdl_python.CDL.Reals": {"Add"}}
+        assert type(imports) is dict
+
     def test_needs_time_manager_with_stateful_blocks(self):
         """Model with stateful blocks needs TimeManager"""
         instances = [
@@ -301,6 +355,77 @@ class TestCDLModel:
         assert order_names.index("add") < order_names.index("final")
         assert order_names.index("mult") < order_names.index("final")
 
+    def test_computation_order_deterministic_with_duplicate_connections(self):
+        """Ready blocks come out in name order; repeated connections count once"""
+        instances = [
+            BlockInstance("z", "Buildings.Controls.OBC.CDL.Reals.Add"),
+            BlockInstance("c", "Buildings.Controls.OBC.CDL.Reals.Add"),
+            BlockInstance("b", "Buildings.Controls.OBC.CDL.Reals.Add"),
+            BlockInstance("a", "Buildings.Controls.OBC.CDL.Reals.Add"),
+        ]
+
+        connections = [
+            Connection("z", "y", "a", "u1"),
+            Connection("z", "y", "a", "u2"),
+            Connection("c", "y", "b", "u1"),
+        ]
+
+        model = CDLModel(
+            metadata=ModelMetadata(name="Test"),
+            instances=instances,
+            connections=connections
+        )
+
+        order = model.get_computation_order()
+        assert [inst.instance_name for inst in order] == ["c", "b", "z", "a"]
+
+    def test_computation_order_cached(self):
+        """The sort is reused until blocks or connections change"""
+        model = CDLModel(
+            metadata=ModelMetadata(name="Test"),
+            instances=[BlockInstance("b", "Buildings.Controls.OBC.CDL.Reals.Add")],
+        )
+        first = model.get_computation_order()
+        assert model.get_computation_order() == first
+        assert model._order_cache is not None
+
+        model.instances.append(BlockInstance("a", "Buildings.Controls.OBC.CDL.Reals.Add"))
+        assert [inst.instance_name for inst in model.get_computation_order()] == ["a", "b"]
+
+        model.connections.append(Connection("b", "y", "a", "u1"))
+        assert [inst.instance_name for inst in model.get_computation_order()] == ["b", "a"]
+
+        model.connections[0] = Connection("a", "y", "b", "u1")
+        assert [inst.instance_name for inst in model.get_computation_order()] == ["a", "b"]
+
+        model.connections[0].source_block = "b"
+        model.connections[0].target_block = "a"
+        model.invalidate_caches()
+        assert [inst.instance_name for inst in model.get_computation_order()] == ["b", "a"]
+
+    def test_validate_checks_connections_every_call(self):
+        """validate() reports a connection replaced in place after a valid run"""
+        model = CDLModel(
+            metadata=ModelMetadata(name="Test", inputs=[Port("u", PortType.REAL)]),
+            instances=[BlockInstance("a", "Buildings.Controls.OBC.CDL.Reals.Add")],
+            connections=[Connection("", "u", "a", "u1")],
+        )
+        assert model.validate() == (True, [])
+
+        model.connections[0] = Connection("a", "y", "ghost", "u1")
+        assert model.validate() == (False, ["Connection references unknown target block: ghost"])
+
+    def test_computation_order_smallest_ready_first(self):
+        """Among blocks whose inputs are ready, the smallest name comes first"""
+        names = ["c", "a", "e", "b", "d"]
+        model = CDLModel(
+            metadata=ModelMetadata(name="Test"),
+            instances=[BlockInstance(n, "Buildings.Controls.OBC.CDL.Reals.Add") for n in names],
+            connections=[Connection("e", "y", "a", "u1"), Connection("d", "y", "b", "u1")],
+        )
+        order = [inst.instance_name for inst in model.get_computation_order()]
+        assert order == ["c", "d", "b", "e", "a"]
+
     def test_computation_order_circular_dependency(self):
         """Circular dependency should raise error"""
         instances = [
@@ -400,3 +525,31 @@ class TestCDLModel:
 
         nonexistent = model.get_instance("nonexistent")
         assert nonexistent is None
+
+    def test_get_instance_after_adding_instance(self):
+        """Test get_instance finds instances added after the first lookup"""
+        model = CDLModel(
+            metadata=ModelMetadata(name="Test"),
+            instances=[BlockInstance("add", "Buildings.Controls.OBC.CDL.Reals.Add")]
+        )
+        assert model.get_instance("gain") is None
+
+        model.instances.append(
+            BlockInstance("gain", "Buildings.Controls.OBC.CDL.Reals.MultiplyByParameter"))
+        assert model.get_instance("gain") is model.instances[1]
+        assert model.get_instance("add") is model.instances[0]
+
+    def test_get_instance_after_replacing_instance(self):
+        """Test get_instance follows an instance replaced in the list"""
+        model = CDLModel(
+            metadata=ModelMetadata(name="Test"),
+            instances=[BlockInstance("a", "Buildings.Controls.OBC.CDL.Reals.Add"),
+                       BlockInstance("b", "Buildings.Controls.OBC.CDL.Reals.Add")]
+        )
+        assert model.get_instance("b") is model.instances[1]
+        model.get_computation_order()
+
+        model.instances[1] = BlockInstance("c", "Buildings.Controls.OBC.CDL.Reals.Add")
+        assert model.get_instance("c") is model.instances[1]
+        assert model.get_instance("b") is None
+        assert [inst.instance_name for inst in model.get_computation_order()] == ["a", "c"]
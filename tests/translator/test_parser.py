@@ -2,7 +2,7 @@
 import pytest
 import json
 from pathlib import Path
-from cdl_translator.parser import CXFParser
+from cdl_translator.parser import CXFParser, read_cxf_json
 from cdl_translator.model import CDLModel, PortType
 
 
@@ -115,6 +115,13 @@ class TestCXFParser:
         with pytest.raises(json.JSONDecodeError):
             parser.parse_file(str(bad_file))
 
+    def test_read_cxf_json_utf8(self, tmp_path):
+        """Files are decoded as UTF-8 regardless of the locale"""
+        cxf_file = tmp_path / "utf8.json"
+        cxf_file.write_bytes('{"description": "Supply air temperature in °C"}'.encode("utf-8"))
+
+        assert read_cxf_json(cxf_file) == {"description": "Supply air temperature in °C"}
+
     def test_parse_missing_graph(self, parser):
         """CXF without @graph should raise error"""
         cxf_data = {"@context": "http://example.com"}
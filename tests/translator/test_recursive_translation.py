@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+import os
 import sys
 import json
 import tempfile
@@ -99,6 +100,15 @@ class TestRecursiveTranslation:
         assert (temp_output_dir / "SubController.py").exists()
         assert (temp_output_dir / "MyController.py").exists()
 
+    @pytest.mark.parametrize("workers", [None, 1])
+    def test_written_files_match_generated_code(self, fixtures_dir, tmp_path, workers):
+        """Test that written files hold the generated code, with and without threads"""
+        translator = RecursiveTranslator(workers=workers)
+        generated = translator.translate_file(fixtures_dir / "MyController.jsonld", tmp_path)
+
+        for block_name, code in generated.items():
+            assert (tmp_path / f"{block_name}.py").read_text() == code
+
     def test_dependency_order(self, fixtures_dir, temp_output_dir):
         """Test that dependencies are translated before dependents"""
         cxf_path = fixtures_dir / "MyController.jsonld"
@@ -207,6 +217,74 @@ class TestRecursiveTranslation:
         # Check that translator tracked it as translated
         assert 'SubController' in translator.translated
 
+    def test_each_cxf_file_parsed_once(self, fixtures_dir):
+        """Test every CXF file is parsed once per translation"""
+        cxf_path = fixtures_dir / "MyController.jsonld"
+
+        translator = RecursiveTranslator()
+        parsed = []
+        parse_dict = translator.parser.parse_dict
+        translator.parser.parse_dict = lambda data: parsed.append(data) or parse_dict(data)
+
+        translator.translate_file(cxf_path)
+        assert len(parsed) == 2
+        assert len(translator._parsed_models) == 2
+
+    def test_parsed_models_reused_until_file_changes(self, fixtures_dir, tmp_path):
+        """Test later translations reuse parsed models unless the file was modified"""
+        for name in ("MyController.jsonld", "SubController.jsonld"):
+            shutil.copy(fixtures_dir / name, tmp_path / name)
+
+        translator = RecursiveTranslator()
+        parsed = []
+        parse_dict = translator.parser.parse_dict
+        translator.parser.parse_dict = lambda data: parsed.append(data) or parse_dict(data)
+
+        first = dict(translator.translate_file(tmp_path / "MyController.jsonld"))
+        assert translator.translate_file(tmp_path / "MyController.jsonld") == first
+        assert len(parsed) == 2
+        assert translator.load_model(tmp_path / "SubController.jsonld").metadata.name == "SubController"
+        assert len(parsed) == 2
+
+        sub = tmp_path / "SubController.jsonld"
+        mtime = sub.stat().st_mtime_ns + 1_000_000_000
+        os.utime(sub, ns=(mtime, mtime))
+        assert translator.translate_file(tmp_path / "MyController.jsonld") == first
+        assert len(parsed) == 3
+
+    def test_generated_code_cached_on_disk(self, fixtures_dir, tmp_path):
+        """Test generated code is reused from the cache directory by a later translator"""
+        cxf_path = fixtures_dir / "MyController.jsonld"
+        cache_dir = tmp_path / ".cdl_cache"
+
+        first = RecursiveTranslator(cache_dir=cache_dir).translate_file(cxf_path)
+        assert sorted(path.name.split("-")[0] for path in cache_dir.iterdir()) == \
+            ["MyController", "SubController"]
+
+        translator = RecursiveTranslator(cache_dir=cache_dir)
+        generated = []
+        generate = translator.codegen.generate
+        translator.codegen.generate = lambda *args, **kwargs: generated.append(args) or generate(*args, **kwargs)
+        assert translator.translate_file(cxf_path) == first
+        assert generated == []
+
+        assert RecursiveTranslator().translate_file(cxf_path) == first
+
+    def test_code_cache_key_covers_model_module(self, tmp_path, monkeypatch):
+        """Test editing the model module changes the code generator fingerprint"""
+        from cdl_translator import codegen
+        sources = []
+        for path in codegen._FINGERPRINT_SOURCES:
+            copy = tmp_path / path.name
+            copy.write_bytes(path.read_bytes())
+            sources.append(copy)
+        assert [path.name for path in sources] == ["codegen.py", "model.py"]
+        monkeypatch.setattr(codegen, "_FINGERPRINT_SOURCES", tuple(sources))
+
+        before = codegen.CodeGenerator().fingerprint()
+        sources[1].write_text(sources[1].read_text() + "\n# edited\n")
+        assert codegen.CodeGenerator().fingerprint() != before
+
     def test_custom_block_does_not_require_time_manager(self):
         """Test that custom blocks don't require time manager from parent"""
         # Create a custom block instance
@@ -255,6 +333,71 @@ class TestRecursiveTranslation:
                 translator.translate_file(temp_path)
 
 
+    def test_circular_dependency_error(self, tmp_path):
+        """Test that custom blocks containing each other are reported as a cycle"""
+        def write_model(name, uses):
+            cxf = {
+                "@context": {"S231P": "https://data.ashrae.org/S231P#", "ex": "http://example.org#"},
+                "@graph": [
+                    {
+                        "@id": f"http://example.org#{name}",
+                        "@type": "S231P:Block",
+                        "S231P:label": name,
+                        "S231P:containsBlock": [{"@id": f"http://example.org#{name}.sub"}]
+                    },
+                    {
+                        "@id": f"http://example.org#{name}.sub",
+                        "@type": f"ex:{uses}",
+                        "S231P:label": "sub"
+                    }
+                ]
+            }
+            (tmp_path / f"{name}.jsonld").write_text(json.dumps(cxf))
+
+        write_model("BlockA", "BlockB")
+        write_model("BlockB", "BlockA")
+
+        translator = RecursiveTranslator()
+        with pytest.raises(ValueError, match="BlockA -> BlockB -> BlockA"):
+            translator.translate_file(tmp_path / "BlockA.jsonld")
+        assert translator.dependency_chain == []
+        assert translator._chain_set == set()
+
+    def test_sibling_cxf_files_read_concurrently(self, tmp_path):
+        """Test that custom blocks of one model are read together with the same result"""
+        def write_model(name, uses):
+            graph = [{
+                "@id": f"http://example.org#{name}",
+                "@type": "S231P:Block",
+                "S231P:label": name,
+                "S231P:containsBlock": [{"@id": f"http://example.org#{name}.{u.lower()}"} for u in uses]
+            }]
+            graph += [{
+                "@id": f"http://example.org#{name}.{u.lower()}",
+                "@type": f"ex:{u}",
+                "S231P:label": u.lower()
+            } for u in uses]
+            cxf = {"@context": {"S231P": "https://data.ashrae.org/S231P#", "ex": "http://example.org#"},
+                   "@graph": graph}
+            (tmp_path / f"{name}.jsonld").write_text(json.dumps(cxf))
+
+        write_model("Top", ["BlockA", "BlockB"])
+        write_model("BlockA", [])
+        write_model("BlockB", [])
+
+        translator = RecursiveTranslator()
+        prefetched = []
+        prefetch = translator._prefetch
+        translator._prefetch = lambda paths: prefetch(paths) or prefetched.append(dict(translator._prefetched))
+        generated = translator.translate_file(tmp_path / "Top.jsonld")
+
+        assert {path.name for path in prefetched[0]} == {"BlockA.jsonld", "BlockB.jsonld"}
+        assert translator._prefetched == {}
+        assert list(generated) == ["BlockA", "BlockB", "Top"]
+
+        serial = RecursiveTranslator(workers=1).translate_file(tmp_path / "Top.jsonld")
+        assert serial == generated
+
 class TestCXFResolver:
     """Test CXF file resolution for custom blocks"""
 
@@ -284,6 +427,17 @@ class TestCXFResolver:
         assert result is not None
         assert result == tmp_path / "CustomBlock.json"
 
+    def test_resolve_relative_base_directory(self, tmp_path, monkeypatch):
+        """Test a relative base directory is resolved against the working directory"""
+        from cdl_translator.resolver import CXFResolver
+
+        (tmp_path / "CustomBlock.jsonld").touch()
+        monkeypatch.chdir(tmp_path)
+
+        result = CXFResolver().resolve("CustomBlock", Path("."))
+        assert result == (tmp_path / "CustomBlock.jsonld").resolve()
+        assert result.is_absolute()
+
     def test_resolve_in_search_paths(self, tmp_path):
         """Test resolving CXF file in additional search paths"""
         from cdl_translator.resolver import CXFResolver
@@ -299,6 +453,71 @@ class TestCXFResolver:
         assert result is not None
         assert result == search_dir / "CustomBlock.jsonld"
 
+    def test_search_paths_resolved_once(self, tmp_path, monkeypatch):
+        """Test search paths given as relative strings are resolved on construction"""
+        from cdl_translator.resolver import CXFResolver
+
+        (tmp_path / "custom_blocks").mkdir()
+        (tmp_path / "custom_blocks" / "CustomBlock.json").touch()
+        monkeypatch.chdir(tmp_path)
+
+        resolver = CXFResolver(search_paths=["custom_blocks"])
+        assert resolver.search_paths == [(tmp_path / "custom_blocks").resolve()]
+        assert resolver.resolve("CustomBlock", tmp_path / "models") == \
+            (tmp_path / "custom_blocks" / "CustomBlock.json").resolve()
+
+    def test_resolve_in_cxf_tree_indexed_once(self, tmp_path):
+        """Test recursive lookup from the cxf root prefers .jsonld and reuses its index"""
+        from cdl_translator.resolver import CXFResolver
+
+        base_dir = tmp_path / "cxf" / "models"
+        base_dir.mkdir(parents=True)
+        (tmp_path / "cxf" / "lib" / "a").mkdir(parents=True)
+        (tmp_path / "cxf" / "lib" / "a" / "CustomBlock.json").touch()
+        (tmp_path / "cxf" / "lib" / "CustomBlock.jsonld").touch()
+        (tmp_path / "cxf" / "lib" / "Other.json").touch()
+
+        resolver = CXFResolver()
+        assert resolver.resolve("CustomBlock", base_dir) == tmp_path / "cxf" / "lib" / "CustomBlock.jsonld"
+        assert resolver.resolve("Other", base_dir) == tmp_path / "cxf" / "lib" / "Other.json"
+        assert list(resolver._index_cache) == [(tmp_path / "cxf").resolve()]
+
+    def test_resolve_nested_file_added_after_indexing(self, tmp_path):
+        """Test a CXF file created in a subdirectory after the first lookup is found"""
+        from cdl_translator.resolver import CXFResolver
+
+        base_dir = tmp_path / "cxf" / "models"
+        base_dir.mkdir(parents=True)
+        nested = tmp_path / "cxf" / "lib" / "deep"
+        nested.mkdir(parents=True)
+        (nested / "Existing.json").touch()
+
+        resolver = CXFResolver()
+        assert resolver.resolve("Existing", base_dir) == nested / "Existing.json"
+        assert resolver.resolve("Added", base_dir) is None
+
+        (nested / "Added.jsonld").touch()
+        assert resolver.resolve("Added", base_dir) == nested / "Added.jsonld"
+
+        (nested / "Existing.json").unlink()
+        (tmp_path / "cxf" / "lib" / "Existing.json").touch()
+        assert resolver.resolve("Existing", base_dir) == tmp_path / "cxf" / "lib" / "Existing.json"
+
+    def test_add_search_path_skips_duplicates(self, tmp_path):
+        """Test a search path is only added once and order is kept"""
+        from cdl_translator.resolver import CXFResolver
+
+        first = (tmp_path / "first").resolve()
+        second = (tmp_path / "second").resolve()
+        first.mkdir()
+        second.mkdir()
+
+        resolver = CXFResolver(search_paths=[first])
+        resolver.add_search_path(second)
+        resolver.add_search_path(first)
+        resolver.add_search_path(tmp_path / "second")
+        assert resolver.search_paths == [first, second]
+
     def test_resolve_not_found(self, tmp_path):
         """Test that None is returned when file not found"""
         from cdl_translator.resolver import CXFResolver